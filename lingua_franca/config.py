@@ -1,2 +1,6 @@
 load_langs_on_demand = False
 inject_timezones = True
+# memoize results of localized functions declared pure
+cache_results = False
+result_cache_size = 1024
+result_cache_ttl = None  # seconds, None to never expire
@@ -23,6 +23,7 @@ from warnings import warn
 from os.path import join
 
 from lingua_franca.util import match_one, fuzzy_match
+from lingua_franca.util.langs import get_language_names
 from lingua_franca.bracket_expansion import SentenceTreeParser
 from lingua_franca.internal import localized_function, \
     populate_localized_function_dict, get_active_langs, \
@@ -259,19 +260,11 @@ date_time_format = DateTimeFormat(os.path.join(os.path.dirname(__file__),
 @localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
 def pronounce_lang(lang_code, lang=""):
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/langs.json") or \
-                    resolve_resource_file("text/en-us/langs.json")
-    with open(resource_file) as f:
-        LANGUAGES = json.load(f)
-    lang_code = lang_code.lower()
-    lang2 = lang_code.split("-")[0]
-    spoken_lang = LANGUAGES.get(lang_code) or LANGUAGES.get(lang2) or lang_code
-    if isinstance(spoken_lang, list):
-        spoken_lang = spoken_lang[0]
-    return spoken_lang
+    return get_language_names(lang).spoken_name(lang_code)
 
 
-@localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError],
+                    pure=True)
 def nice_number(number, lang='', speech=True, denominators=None):
     """Format a float to human readable functions
 
@@ -312,7 +305,7 @@ def nice_time(dt, lang='', speech=True, use_24hour=False,
     """
 
 
-@localized_function()
+@localized_function(pure=True)
 def pronounce_number(number, lang='', places=2, short_scale=True,
                      scientific=False, ordinals=False):
     """
@@ -478,7 +471,7 @@ def get_date_strings(dt=None, date_format='MDY', time_format="full", lang=""):
     }
 
 
-@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[FunctionNotLocalizedError], pure=True)
 def nice_duration(duration, lang='', speech=True):
     """ Convert duration in seconds to a nice spoken timespan
 
@@ -1,7 +1,10 @@
 import os.path
+import threading
+from collections import OrderedDict, namedtuple
 from functools import wraps
 from importlib import import_module
 from inspect import signature
+from time import monotonic
 
 from warnings import warn
 from datetime import datetime
@@ -387,7 +390,111 @@ def __get_full_lang_code_deprecation_warning(lang=''):
         raise UnsupportedLanguageError(lang)
 
 
-def localized_function(run_own_code_on=[type(None)]):
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions",
+                                     "expirations", "size"])
+
+
+class ResultCache:
+    """
+    Thread safe LRU cache, with optional expiry, of localized results
+
+    Size and time to live are read from lingua_franca.config on every
+    insertion, so they can be changed at runtime
+    """
+    _MISSING = object()
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def get(self, key):
+        """ Returns the cached value, or ResultCache._MISSING """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None \
+                    and entry[1] <= monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return self._MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        maxsize = config.result_cache_size
+        if maxsize is not None and maxsize <= 0:
+            return
+        ttl = config.result_cache_ttl
+        expires = None if ttl is None else monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while maxsize is not None and len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """ Drop every entry and reset the metrics """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+            self._evictions = self._expirations = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self._expirations, len(self._entries))
+
+
+_RESULT_CACHE = ResultCache()
+
+
+def get_result_cache_info():
+    """ Hit/miss metrics of the localized function result cache
+
+    Returns:
+        CacheInfo: (hits, misses, evictions, expirations, size)
+    """
+    return _RESULT_CACHE.info()
+
+
+def clear_result_cache():
+    """ Empty the localized function result cache and reset its metrics """
+    _RESULT_CACHE.clear()
+
+
+def _result_cache_args(func_signature, clock_params, args, kwargs):
+    """ Hashable form of a call, None if the call can't be cached """
+    try:
+        bound = func_signature.bind(*args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    # None means "now" for these, the result depends on the time of the call
+    if any(bound.arguments.get(param) is None for param in clock_params):
+        return None
+    # keep the types, 1 and 1.0 are equal keys but not always equal results
+    call_args = tuple((name, type(value), value)
+                      for name, value in bound.arguments.items()
+                      if name != 'lang')
+    # aware datetimes of the same instant are equal in any timezone, but
+    # "tomorrow" is not the same day everywhere
+    call_args += tuple((name, value.utcoffset(), value.tzname())
+                       for name, value in bound.arguments.items()
+                       if isinstance(value, datetime))
+    try:
+        hash(call_args)
+    except TypeError:
+        return None
+    return call_args
+
+
+def localized_function(run_own_code_on=[type(None)], pure=False,
+                       clock_params=()):
     """
     Decorator which finds localized functions, and calls them, from signatures
     defined in the top-level modules. See lingua_franca.format or .parse for
@@ -417,6 +524,11 @@ def localized_function(run_own_code_on=[type(None)]):
     Here, nice_number() itself will be executed in the event that the localizer
     raises an UnsupportedLanguageError.
 
+    Results of pure functions are memoized when config.cache_results is set,
+    keyed by function, full lang code and arguments. Calls with unhashable
+    arguments, or where a parameter in clock_params is None and so
+    defaults to the current time, are never cached.
+
     Arguments:
         run_own_code_on(list(type), optional)
             A list of Error types (ValueError, NotImplementedError, etc)
@@ -426,6 +538,12 @@ def localized_function(run_own_code_on=[type(None)]):
             If this argument is omitted, the function itself will never
             be run. Calls to the wrapped function will be passed to the
             appropriate, localized function.
+        pure(bool, optional)
+            The localized result only depends on the arguments and lang,
+            so it may be cached.
+        clock_params(tuple(str), optional)
+            Parameters of a pure function which fall back to the current
+            time when None.
 
 
     """
@@ -473,6 +591,11 @@ def localized_function(run_own_code_on=[type(None)]):
                     if isinstance(value, datetime) and value.tzinfo is None:
                         args = (*args[:idx], to_local(value), *args[idx + 1:])
 
+            call_args = None
+            if pure and config.cache_results:
+                call_args = _result_cache_args(func_signature, clock_params,
+                                               args, kwargs)
+
             # Check if we're passing a lang as a kwarg
             if 'lang' in kwargs.keys():
                 lang_param = kwargs['lang']
@@ -593,10 +716,20 @@ def localized_function(run_own_code_on=[type(None)]):
 
             # Now we call the function, ignoring any kwargs from the
             # wrapped function that aren't in the localized function.
-            r_val = localized_func(*args,
-                                   **{arg: val for arg, val
-                                      in kwargs.items()
-                                      if arg in loc_signature.parameters})
+            loc_kwargs = {arg: val for arg, val in kwargs.items()
+                          if arg in loc_signature.parameters}
+            if call_args is None:
+                r_val = localized_func(*args, **loc_kwargs)
+            else:
+                cache_key = (func.__module__, func_name,
+                             full_lang_code or lang_code, call_args)
+                r_val = _RESULT_CACHE.get(cache_key)
+                if r_val is ResultCache._MISSING:
+                    r_val = localized_func(*args, **loc_kwargs)
+                    _RESULT_CACHE.put(cache_key, r_val)
+                # callers may mutate the containers they get back
+                if isinstance(r_val, (list, dict)):
+                    r_val = r_val.copy()
 
             # Unload all the stuff we just assembled and imported
             del localized_func
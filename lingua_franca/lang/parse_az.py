@@ -16,11 +16,13 @@
 
 from typing import List
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer, \
+    get_normalizer
 from lingua_franca.lang.common_data_az import _LONG_SCALE_AZ, \
     _SHORT_SCALE_AZ, _NEGATIVES_AZ, _SUMS_AZ, _MULTIPLIES_LONG_SCALE_AZ, \
     _MULTIPLIES_SHORT_SCALE_AZ, _FRACTION_MARKER_AZ, _DECIMAL_MARKER_AZ, \
@@ -501,7 +503,7 @@ def _extract_whole_number_with_text_az(tokens, short_scale, ordinals):
     return val, number_words
 
 
-def _initialize_number_data_az(short_scale, speech=True):
+def _build_number_data_az(short_scale, speech=True):
     """
     Generate dictionaries of words to numbers, based on scale.
 
@@ -512,7 +514,7 @@ def _initialize_number_data_az(short_scale, speech=True):
         speech (bool): consider extra words (_SPOKEN_EXTRA_NUM_AZ) to be numbers
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mapping(str, number), mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -525,7 +527,31 @@ def _initialize_number_data_az(short_scale, speech=True):
     string_num_scale_az = _SHORT_SCALE_AZ if short_scale else _LONG_SCALE_AZ
     string_num_scale_az = invert_dict(string_num_scale_az)
 
-    return multiplies, string_num_ordinal_az, string_num_scale_az
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_az), \
+        MappingProxyType(string_num_scale_az)
+
+
+_NUMBER_DATA_AZ = {
+    (short_scale, speech): _build_number_data_az(short_scale, speech)
+    for short_scale in (True, False) for speech in (True, False)}
+
+
+def _initialize_number_data_az(short_scale, speech=True):
+    """
+    Get the read only dictionaries of words to numbers for a scale.
+
+    They are built once at import by _build_number_data_az.
+
+    Args:
+        short_scale (bool):
+        speech (bool): consider extra words to be numbers
+
+    Returns:
+        (frozenset(str), mapping(str, number), mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+
+    """
+    return _NUMBER_DATA_AZ[bool(short_scale), bool(speech)]
 
 
 def extract_number_az(text, short_scale=True, ordinals=False):
@@ -1224,4 +1250,5 @@ class AzerbaijaniNormalizer(Normalizer):
 
 def normalize_az(text, remove_articles=True):
     """ Azerbaijani string normalization """
-    return AzerbaijaniNormalizer().normalize(text, remove_articles)
+    normalizer = get_normalizer(AzerbaijaniNormalizer)
+    return normalizer.normalize(text, remove_articles)
@@ -28,7 +28,7 @@ from lingua_franca.lang.common_data_ca import _NUMBERS_CA, \
     _MALE_DETERMINANTS_CA, _MALE_ENDINGS_CA, _GENDERS_CA, \
     _TENS_CA, _AFTER_TENS_CA, _HUNDREDS_CA, _BEFORE_HUNDREDS_CA
 from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, get_normalizer
 import json
 import re
 
@@ -249,7 +249,7 @@ class CatalanNormalizer(Normalizer):
         #utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \3",
         #                   utterance)
         tokens = utterance.split()
-        if tokens[-1] == '-':
+        while tokens and tokens[-1] == '-':
             tokens = tokens[:-1]
 
         return tokens
@@ -257,7 +257,7 @@ class CatalanNormalizer(Normalizer):
 
 def normalize_ca(text, remove_articles=True):
     """ CA string normalization """
-    return CatalanNormalizer().normalize(text, remove_articles)
+    return get_normalizer(CatalanNormalizer).normalize(text, remove_articles)
 
 
 def extract_datetime_ca(text, anchorDate=None, default_time=None):
@@ -14,12 +14,181 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from datetime import datetime, time, timedelta
 import re
 import json
+import threading
 import unicodedata
 
-from quebra_frases import word_tokenize
-from lingua_franca.internal import  resolve_resource_file, FunctionNotLocalizedError
+from dateutil.relativedelta import relativedelta
+from quebra_frases import word_tokenize, span_indexed_word_tokenize
+from lingua_franca import config
+from lingua_franca.internal import  resolve_resource_file, FunctionNotLocalizedError, \
+    ResultCache
+from lingua_franca.time import now_local, to_local
+
+
+_DEFAULT_ACCENTS = {"á": "a", "à": "a", "ã": "a", "â": "a",
+                    "é": "e", "è": "e", "ê": "e", "ẽ": "e",
+                    "í": "i", "ì": "i", "î": "i", "ĩ": "i",
+                    "ò": "o", "ó": "o", "ô": "o", "õ": "o",
+                    "ú": "u", "ù": "u", "û": "u", "ũ": "u",
+                    "Á": "A", "À": "A", "Ã": "A", "Â": "A",
+                    "É": "E", "È": "E", "Ê": "E", "Ẽ": "E",
+                    "Í": "I", "Ì": "I", "Î": "I", "Ĩ": "I",
+                    "Ò": "O", "Ó": "O", "Ô": "O", "Õ": "O",
+                    "Ú": "U", "Ù": "U", "Û": "U", "Ũ": "U"}
+
+_DEFAULT_SYMBOLS = [".", ",", ";", "_", "!", "?", "<", ">",
+                    "|", "(", ")", "=", "[", "]", "{", "}",
+                    "»", "«", "*", "~", "^", "`", "\""]
+
+
+def fold_unicode(text, decomposition="NFD", ascii_only=True):
+    """
+    Decompose unicode characters, optionally dropping everything that is
+    not ascii afterwards, e.g. "não é" -> "nao e"
+
+    Args:
+        text (str): text to fold
+        decomposition (str): unicode normal form, "NFD" or "NFKD"
+        ascii_only (bool): drop the non ascii characters, such as the
+                           accents split from their letters
+
+    Returns:
+        (str): folded text
+    """
+    if text.isascii():
+        # nothing to decompose
+        return text
+    text = unicodedata.normalize(decomposition, text)
+    if ascii_only:
+        text = text.encode("ascii", "ignore").decode("utf-8")
+    return text
+
+
+def make_translation_table(mapping):
+    """
+    Build a str.translate table out of a {character: replacement} dict
+
+    Latin characters map to themselves, so translating common text rarely
+    misses the table.
+
+    Args:
+        mapping (dict): single characters and their replacement strings
+
+    Returns:
+        (dict): translation table, None if mapping can not be expressed as
+                one, because a key is not a single character or a
+                replacement would be replaced again
+    """
+    if any(len(k) != 1 for k in mapping) or \
+            any(k in v for k in mapping for v in mapping.values()):
+        return None
+    table = {c: c for c in range(0x250)}
+    table.update(str.maketrans(mapping))
+    return table
+
+
+class PhraseMatcher:
+    """
+    Token trie mapping phrases to their replacement tokens
+
+    Replaces every known phrase in a token list in a single left to right
+    scan, the longest phrase starting at a token wins.
+    """
+
+    def __init__(self, phrases=()):
+        """
+        Args:
+            phrases: iterable of (phrase tokens, replacement tokens) tuples
+        """
+        self._root = {}
+        self.phrases = []
+        for phrase, replacement in phrases:
+            self.add(phrase, replacement)
+
+    def __bool__(self):
+        return bool(self.phrases)
+
+    def add(self, phrase, replacement):
+        """
+        Add a phrase, if the phrase is already known it is left untouched
+
+        Args:
+            phrase ([str]): tokens to match
+            replacement ([str]): tokens to replace the phrase with
+        """
+        if not phrase:
+            return
+        node = self._root
+        for token in phrase:
+            node = node.setdefault(token, {})
+        # tokens are strings, None marks the end of a phrase
+        if None not in node:
+            node[None] = list(replacement)
+            self.phrases.append((tuple(phrase), node[None]))
+
+    def replace(self, words):
+        """
+        Replace all the phrases in a token list
+
+        Args:
+            words ([str]): tokens
+
+        Returns:
+            ([str]): tokens with the phrases replaced
+        """
+        if not self._root:
+            return words
+        replaced = []
+        idx = 0
+        while idx < len(words):
+            node = self._root
+            match = None
+            end = idx
+            while end < len(words) and words[end] in node:
+                node = node[words[end]]
+                end += 1
+                if None in node:
+                    match = (end, node[None])
+            if match is None:
+                replaced.append(words[idx])
+                idx += 1
+            else:
+                replaced += match[1]
+                idx = match[0]
+        return replaced
+
+    @classmethod
+    def chain(cls, matchers):
+        """
+        Merge matchers meant to run one after the other into a single one
+
+        Replacements are passed through the matchers that follow theirs,
+        so the result is the same as applying them in order as long as no
+        later phrase straddles the boundary of an earlier replacement, for
+        phrases known to several matchers the first one wins.
+
+        A later phrase overlapping an earlier replacement is not matched,
+        e.g. with "isn't" -> "is not" followed by "not really" -> "barely",
+        "isn't really" stays "is not really" where running the matchers in
+        sequence gives "is barely". Only chain matchers whose phrases can
+        not span an earlier replacement and the words around it.
+
+        Args:
+            matchers ([PhraseMatcher]): matchers in the order they apply
+
+        Returns:
+            PhraseMatcher
+        """
+        chained = cls()
+        for idx, matcher in enumerate(matchers):
+            for phrase, replacement in matcher.phrases:
+                for following in matchers[idx + 1:]:
+                    replacement = following.replace(replacement)
+                chained.add(phrase, replacement)
+        return chained
 
 
 class Normalizer:
@@ -29,9 +198,29 @@ class Normalizer:
     normalize_XX should pass a valid config read from json
     """
     _default_config = {}
+    # stages done by a PhraseMatcher, and the attribute holding it
+    _REPLACEMENT_STAGES = {"expand_contractions": "_contractions",
+                           "replace_words": "_word_replacements",
+                           "numbers_to_digits": "_number_replacements"}
 
     def __init__(self, config=None):
         self.config = config or self._default_config
+        # config lookups are resolved once, replacements are kept as the
+        # tokens they expand to, so normalize only tokenizes once
+        self._lowercase = self.should_lowercase
+        self._remove_articles = self.should_remove_articles
+        self._contractions = self._compile_replacements(self.contractions)
+        self._word_replacements = \
+            self._compile_replacements(self.word_replacements)
+        self._number_replacements = \
+            self._compile_replacements(self.number_replacements)
+        self._accents = dict(self.accents)
+        self._accents_table = make_translation_table(self._accents)
+        self._symbols = frozenset(self.symbols)
+        self._articles = frozenset(self.articles)
+        self._stopwords = frozenset(self.stopwords)
+        self._pipelines = {True: self._compile_pipeline(True),
+                           False: self._compile_pipeline(False)}
 
     @staticmethod
     def tokenize(utterance):
@@ -79,18 +268,7 @@ class Normalizer:
 
     @property
     def accents(self):
-        return self.config.get("accents",
-                               {"á": "a", "à": "a", "ã": "a", "â": "a",
-                                "é": "e", "è": "e", "ê": "e", "ẽ": "e",
-                                "í": "i", "ì": "i", "î": "i", "ĩ": "i",
-                                "ò": "o", "ó": "o", "ô": "o", "õ": "o",
-                                "ú": "u", "ù": "u", "û": "u", "ũ": "u",
-                                "Á": "A", "À": "A", "Ã": "A", "Â": "A",
-                                "É": "E", "È": "E", "Ê": "E", "Ẽ": "E",
-                                "Í": "I", "Ì": "I", "Î": "I", "Ĩ": "I",
-                                "Ò": "O", "Ó": "O", "Ô": "O", "Õ": "O",
-                                "Ú": "U", "Ù": "U", "Û": "U", "Ũ": "U"
-                                })
+        return self.config.get("accents", _DEFAULT_ACCENTS)
 
     @property
     def stopwords(self):
@@ -102,32 +280,79 @@ class Normalizer:
 
     @property
     def symbols(self):
-        return self.config.get("symbols",
-                               [".", ",", ";", "_", "!", "?", "<", ">",
-                                "|", "(", ")", "=", "[", "]", "{", "}",
-                                "»", "«", "*", "~", "^", "`", "\""])
+        return self.config.get("symbols", _DEFAULT_SYMBOLS)
+
+    def _compile_replacements(self, replacements):
+        return PhraseMatcher((self.tokenize(k), self.tokenize(v)
+                              if v.strip() else [])
+                             for k, v in replacements.items() if k.strip())
+
+    def _compile_pipeline(self, remove_articles):
+        stages = []
+        if self.should_expand_contractions:
+            stages.append("expand_contractions")
+        stages.append("replace_words")
+        if self.should_numbers_to_digits:
+            stages.append("numbers_to_digits")
+        if self.should_remove_symbols:
+            stages.append("remove_symbols")
+        if self.should_remove_accents:
+            stages.append("remove_accents")
+        if remove_articles:
+            stages.append("remove_articles")
+        if self.should_remove_stopwords:
+            stages.append("remove_stopwords")
+
+        pipeline = []
+        replacements = []
+        for name in stages:
+            # stages overridden by the language run on the joined string,
+            # so do accents, as stripping them may change the tokenization
+            overridden = name == "remove_accents" or \
+                getattr(type(self), name) is not getattr(Normalizer, name)
+            if not overridden and name in self._REPLACEMENT_STAGES:
+                replacements.append(
+                    getattr(self, self._REPLACEMENT_STAGES[name]))
+                continue
+            if replacements:
+                # consecutive replacement stages share a single scan
+                pipeline.append((PhraseMatcher.chain(replacements).replace,
+                                 True))
+                replacements = []
+            if overridden:
+                pipeline.append((getattr(self, name), False))
+            else:
+                pipeline.append((getattr(self, f"_{name}_tokens"), True))
+        if replacements:
+            pipeline.append((PhraseMatcher.chain(replacements).replace, True))
+        return pipeline
+
+    def _remove_symbols_tokens(self, words):
+        return [w for w in words if w not in self._symbols]
+
+    def _remove_articles_tokens(self, words):
+        return [w for w in words if w not in self._articles]
+
+    def _remove_stopwords_tokens(self, words):
+        words = [w for w in words if w not in self._stopwords]
+        # Remove orphaned trailing hyphens
+        if words and words[-1].endswith("-"):
+            words[-1] = words[-1][:-1]
+        return words
 
     def expand_contractions(self, utterance):
         """ Expand common contractions, e.g. "isn't" -> "is not" """
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.contractions:
-                words[idx] = self.contractions[w]
-        utterance = " ".join(words)
-        return utterance
+        words = self._contractions.replace(self.tokenize(utterance))
+        return " ".join(words)
 
     def numbers_to_digits(self, utterance):
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.number_replacements:
-                words[idx] = self.number_replacements[w]
-        utterance = " ".join(words)
-        return utterance
+        words = self._number_replacements.replace(self.tokenize(utterance))
+        return " ".join(words)
 
     def remove_articles(self, utterance):
         words = self.tokenize(utterance)
         for idx, w in enumerate(words):
-            if w in self.articles:
+            if w in self._articles:
                 words[idx] = ""
         utterance = " ".join(words)
         return utterance
@@ -135,7 +360,7 @@ class Normalizer:
     def remove_stopwords(self, utterance):
         words = self.tokenize(utterance)
         for idx, w in enumerate(words):
-            if w in self.stopwords:
+            if w in self._stopwords:
                 words[idx] = ""
         # if words[-1] == '-':
         #    words = words[:-1]
@@ -146,118 +371,208 @@ class Normalizer:
         return utterance
 
     def remove_symbols(self, utterance):
-        words = self.tokenize(utterance)        
-        return " ".join([w for w in words if w not in self.symbols])
+        return " ".join(self._remove_symbols_tokens(self.tokenize(utterance)))
 
     def remove_accents(self, utterance):
-        for s in self.accents:
-            utterance = utterance.replace(s, self.accents[s])
+        if self._accents_table is not None:
+            return utterance.translate(self._accents_table)
+        for s in self._accents:
+            utterance = utterance.replace(s, self._accents[s])
         return utterance
 
     def replace_words(self, utterance):
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.word_replacements:
-                words[idx] = self.word_replacements[w]
-        utterance = " ".join(words)
-        return utterance
+        words = self._word_replacements.replace(self.tokenize(utterance))
+        return " ".join(words)
 
     def normalize(self, utterance="", remove_articles=None):
-        # mutations
-        if self.should_lowercase:
+        if self._lowercase:
             utterance = utterance.lower()
-        if self.should_expand_contractions:
-            utterance = self.expand_contractions(utterance)
-        utterance = self.replace_words(utterance)
-        if self.should_numbers_to_digits:
-            utterance = self.numbers_to_digits(utterance)
-
-        # removals
-        if self.should_remove_symbols:
-            utterance = self.remove_symbols(utterance)
-        if self.should_remove_accents:
-            utterance = self.remove_accents(utterance)
         # TODO deprecate remove_articles param, backwards compat
-        if remove_articles is not None and remove_articles:
-            utterance = self.remove_articles(utterance)
-        elif self.should_remove_articles:
-            utterance = self.remove_articles(utterance)
-        if self.should_remove_stopwords:
-            utterance = self.remove_stopwords(utterance)
+        pipeline = self._pipelines[bool(remove_articles) or
+                                   self._remove_articles]
+
+        # mutations and removals, tokenized once unless a language
+        # overrides a stage with its own string based implementation
+        words = None
+        for stage, on_tokens in pipeline:
+            if on_tokens:
+                if words is None:
+                    words = self.tokenize(utterance)
+                words = stage(words)
+            else:
+                if words is not None:
+                    utterance = " ".join(words)
+                    words = None
+                utterance = stage(utterance)
+        if words is None:
+            words = utterance.split(" ")
+
         # remove extra spaces
-        utterance = " ".join([w for w in utterance.split(" ") if w])
-        return utterance
+        return " ".join([w for w in words if w])
 
 
-def match_yes_or_no(text, lang):
-    resource_file = resolve_resource_file(f"text/{lang}/yesno.json")
-    if not resource_file:
-        raise FunctionNotLocalizedError(f"yesno.json missing for {lang}")
+_NORMALIZERS = {}
+_NORMALIZERS_LOCK = threading.Lock()
 
-    with open(resource_file) as f:
-        words = json.load(f)
-        words = {k: [_.lower() for _ in v] for k, v in words.items()}
+
+def get_normalizer(normalizer_class=Normalizer, config=None):
+    """
+    Get the shared instance of a Normalizer for a config
+
+    Normalizers are compiled once per (class, config) and never mutated
+    afterwards, the same instance is safe to use from several threads
+
+    Args:
+        normalizer_class (type): Normalizer subclass of the language
+        config (dict): normalizer config, None for the class default
+
+    Returns:
+        Normalizer
+    """
+    key = (normalizer_class,
+           None if config is None else json.dumps(config, sort_keys=True))
+    normalizer = _NORMALIZERS.get(key)
+    if normalizer is None:
+        with _NORMALIZERS_LOCK:
+            normalizer = _NORMALIZERS.get(key)
+            if normalizer is None:
+                normalizer = normalizer_class(config)
+                _NORMALIZERS[key] = normalizer
+    return normalizer
+
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of labeled patterns
+
+    Finds every occurrence of every pattern in a single pass over a text,
+    regardless of how many patterns there are.
+    """
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns: iterable of (pattern, label) tuples
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for pattern, label in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._out[state].append((len(pattern), label))
+
+        # breadth first, so the failure state is always resolved first
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + \
+                    self._out[self._fail[child]]
+
+    @staticmethod
+    def _is_word_char(char):
+        return char.isalnum() or char == "_" or \
+            bool(unicodedata.combining(char))
+
+    def finditer(self, text, word_boundaries=True):
+        """
+        Find all pattern occurrences in text
+
+        Args:
+            text (str): the text to search
+            word_boundaries (bool): only report occurrences that are not
+                                    part of a bigger word
+
+        Returns:
+            [(int, int, any)]: (start, end, label) of each occurrence, in the
+                               order their ends appear in the text
+        """
+        hits = []
+        state = 0
+        for idx, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, label in self._out[state]:
+                start, end = idx + 1 - length, idx + 1
+                if word_boundaries and (
+                        (start > 0 and self._is_word_char(text[start - 1])
+                         and self._is_word_char(text[start])) or
+                        (end < len(text) and self._is_word_char(text[end])
+                         and self._is_word_char(text[end - 1]))):
+                    continue
+                hits.append((start, end, label))
+        return hits
+
+
+def _fold_yes_no(text, lang):
     # after encoding information is lost
-    if lang == 'uk-ua':
-        text = unicodedata.normalize('NFD', text)
-    else:
-        text = unicodedata.normalize('NFD', text) \
-            .encode('ascii', 'ignore').decode("utf-8")
-    text = text.lower()
+    return fold_unicode(text, ascii_only=lang != 'uk-ua').lower()
+
+
+_YES_NO_MATCHERS = {}
+
+
+def _get_yes_no_matcher(lang):
+    if lang not in _YES_NO_MATCHERS:
+        resource_file = resolve_resource_file(f"text/{lang}/yesno.json")
+        if not resource_file:
+            raise FunctionNotLocalizedError(f"yesno.json missing for {lang}")
+
+        with open(resource_file) as f:
+            words = json.load(f)
+        _YES_NO_MATCHERS[lang] = MultiPatternMatcher(
+            (_fold_yes_no(w.lower(), lang), k)
+            for k, v in words.items() for w in v)
+    return _YES_NO_MATCHERS[lang]
 
 
+def match_yes_or_no(text, lang):
+    text = _fold_yes_no(text, lang)
+    hits = _get_yes_no_matcher(lang).finditer(text)
+
     # if user says yes but later says no, he changed his mind mid-sentence
-    # the highest index is the last yesno word
+    # the highest index is the last yesno word, "no" wins a tie
     res = None
-    best = -1
-    # check if user said yes
-    for w in words["yes"]:
-        if w not in text:
-            continue
-        idx = text.index(w)
-        if idx >= best:
-            best = idx
-            res = True
-
-    # check if user said no
-    for w in words["no"]:
-        if w not in text:
+    best = None
+    for hit in hits:
+        if hit[2] not in ("yes", "no"):
             continue
-
-        idx = text.index(w)
-        if idx >= best:
-            best = idx
-
+        if best is None or hit[0] > best[0] or \
+                (hit[0] == best[0] and hit[2] == "no"):
+            best = hit
+    if best is not None:
+        res = best[2] == "yes"
+        if not res:
             # handle double negatives, eg "its not a lie"
-            double_negs = [f"{w} {neg}" for neg in words.get("neutral_no", [])]
-            for n in double_negs:
-                if n in text and text.index(n) <= idx:
+            for start, end, kind in hits:
+                if kind == "neutral_no" and start == best[1] + 1 and \
+                        text[best[1]] == " ":
                     res = True
                     break
-            else:
-                res = False
 
     # check if user said no, but only if there isn't a previous yes
     # handles cases such as "yes/no, that's a lie" vs "it's a lie" -> no
-    if res is None:
-        for w in words.get("neutral_no", []):
-            if w not in text:
-                continue
-            idx = text.index(w)
-            if idx >= best:
-                best = idx
-                res = False
+    if res is None and any(hit[2] == "neutral_no" for hit in hits):
+        res = False
 
     # check if user said yes, but only if there isn't a previous no
     # handles cases such as "no! please! I beg you"
-    if res is None:
-        for w in words.get("neutral_yes", []):
-            if w not in text:
-                continue
-            idx = text.index(w)
-            if idx >= best:
-                best = idx
-                res = True
+    if res is None and any(hit[2] == "neutral_yes" for hit in hits):
+        res = True
 
     # None - neutral
     # True - yes
@@ -270,6 +585,7 @@ def match_yes_or_no(text, lang):
 # text. To ensure things parse correctly, we need to know where text came
 # from in the original input, hence this nametuple.
 Token = namedtuple('Token', 'word index')
+NumberSpan = namedtuple('NumberSpan', 'value start end is_ordinal')
 
 
 class ReplaceableNumber:
@@ -317,6 +633,604 @@ class ReplaceableNumber:
                                       t=self.tokens)
 
 
+class NumberGrammar:
+    """
+    Table driven parser for spoken cardinal numbers
+
+    The grammar is shared by every language, only the vocabulary differs.
+    It is compiled once into word lookups, parsing is a single left to
+    right pass that consumes the longest number starting at a word.
+
+        number    := zero | group (scale group?)*  (scales decreasing)
+        group     := hundreds below_100? | below_100
+        hundreds  := hundreds word | unit hundred word
+        below_100 := word below the first ten | ten (connector? unit)?
+    """
+
+    def __init__(self, numbers, first_ten=20, connectors=(), scales=None,
+                 hundred_words=(), bare_scales=False):
+        """
+        Args:
+            numbers (dict): number word -> value, for values up to 999,
+                            words with other values are ignored
+            first_ten (int): lowest multiple of ten that combines with a
+                             following unit, words below it stand alone
+            connectors (iterable): words required between a ten and its
+                                   unit, if empty they are juxtaposed
+            scales (dict): scale word -> multiplier, e.g. {"mil": 1000}
+            hundred_words (iterable): words multiplying a unit by 100
+            bare_scales (bool): whether a scale word alone is a number
+        """
+        values = {word: value for word, value in numbers.items()
+                  if isinstance(value, int) and 0 <= value <= 999}
+        self._zeros = frozenset(w for w, v in values.items() if v == 0)
+        self._units = {w: v for w, v in values.items() if 1 <= v <= 9}
+        self._below_tens = {w: v for w, v in values.items()
+                            if 1 <= v < first_ten}
+        self._tens = {w: v for w, v in values.items()
+                      if first_ten <= v <= 90 and v % 10 == 0}
+        self._hundreds = {w: v for w, v in values.items()
+                          if 100 <= v <= 900 and v % 100 == 0}
+        self._connectors = frozenset(connectors)
+        self._hundred_words = frozenset(hundred_words)
+        self._scales = dict(scales or {})
+        self._bare_scales = bare_scales
+
+    def parse(self, words, i=0):
+        """
+        Parse the number starting at words[i]
+
+        Args:
+            words ([str]): the words to parse
+            i (int): index of the first word of the number
+
+        Returns:
+            (int, int): the number and the index of the word after it,
+                        None if no number starts at words[i]
+        """
+        if i < len(words) and words[i] in self._zeros:
+            return 0, i + 1
+        group = self._group(words, i)
+        if group is None and not (self._bare_scales and i < len(words)
+                                  and words[i] in self._scales):
+            return None
+        value, i = group or (1, i)
+        total = 0
+        last_scale = None
+        while i < len(words) and words[i] in self._scales:
+            scale = self._scales[words[i]]
+            if last_scale is not None and scale >= last_scale:
+                break
+            last_scale = scale
+            total += value * scale
+            value, i = self._group(words, i + 1) or (0, i + 1)
+        return total + value, i
+
+    def _group(self, words, i):
+        if i >= len(words):
+            return None
+        word = words[i]
+        hundreds = None
+        if word in self._hundreds:
+            hundreds = self._hundreds[word], i + 1
+        elif word in self._units and i + 1 < len(words) and \
+                words[i + 1] in self._hundred_words:
+            hundreds = self._units[word] * 100, i + 2
+        if hundreds is None:
+            return self._below_100(words, i)
+        value, i = hundreds
+        below_100 = self._below_100(words, i)
+        if below_100 is None:
+            return hundreds
+        return value + below_100[0], below_100[1]
+
+    def _below_100(self, words, i):
+        if i >= len(words):
+            return None
+        word = words[i]
+        if word in self._below_tens:
+            return self._below_tens[word], i + 1
+        if word not in self._tens:
+            return None
+        value = self._tens[word]
+        unit = i + 1
+        if self._connectors:
+            if unit >= len(words) or words[unit] not in self._connectors:
+                return value, i + 1
+            unit += 1
+        if unit < len(words) and words[unit] in self._units:
+            return value + self._units[words[unit]], unit + 1
+        return value, i + 1
+
+
+class DurationGrammar:
+    """
+    Table driven parser for spoken durations, e.g. "3 hours 10 minutes"
+
+    The unit table of a language is compiled once into a single regex
+    alternating every unit, parsing is one scan that sums the quantity of
+    every match into timedelta keywords.
+    """
+
+    def __init__(self, units, pattern, flags=0):
+        """
+        Args:
+            units (list): (unit regex, timedelta keyword, factor) tuples,
+                          quantities are summed in this order
+            pattern (str): duration regex with a "value" group and a
+                           {unit} placeholder for the unit alternation
+            flags (int): re flags for the compiled regex
+        """
+        self.units = tuple(units)
+        self._groups = tuple("u{}".format(idx)
+                             for idx in range(len(self.units)))
+        alternation = "|".join(
+            "(?P<{}>{})".format(group, unit[0])
+            for group, unit in zip(self._groups, self.units))
+        self.regex = re.compile(
+            pattern.replace("{unit}", "(?:" + alternation + ")"), flags)
+
+    def _unit(self, match):
+        for idx, group in enumerate(self._groups):
+            if match.group(group) is not None:
+                return idx
+
+    def parse(self, text):
+        """
+        Sum every duration in text
+
+        Args:
+            text (str): text with numbers already converted to digits
+
+        Returns:
+            (dict, str, list): timedelta keywords with their summed
+                               values, the text with every duration
+                               removed and the (start, end) span of each
+                               removed duration
+        """
+        values = [[] for _ in self.units]
+        spans = []
+        remainder = []
+        last = 0
+        for match in self.regex.finditer(text):
+            value = match.group("value").replace(",", ".")
+            values[self._unit(match)].append(float(value))
+            spans.append(match.span())
+            remainder.append(text[last:match.start()])
+            last = match.end()
+        remainder.append(text[last:])
+        return self._sum(values), "".join(remainder), spans
+
+    def durations(self, text, joiners=()):
+        """
+        Sum every distinct duration of text on its own
+
+        Consecutive units only separated by whitespace, commas or joiner
+        words are one duration, e.g. "3 hours, 10 minutes and 5 seconds"
+
+        Args:
+            text (str): text with numbers already converted to digits
+            joiners (iterable): words chaining the units of one duration
+
+        Returns:
+            list: (dict, int, int) tuples with the timedelta keywords of
+                  each duration and the span of text it covers
+        """
+        results = []
+        values = None
+        start = end = 0
+        for match in self.regex.finditer(text):
+            between = text[end:match.start()].replace(",", " ").split()
+            if values is None or \
+                    any(word not in joiners for word in between):
+                if values is not None:
+                    results.append((self._sum(values), start, end))
+                values = [[] for _ in self.units]
+                start = match.start()
+            value = match.group("value").replace(",", ".")
+            values[self._unit(match)].append(float(value))
+            end = match.end()
+        if values is not None:
+            results.append((self._sum(values), start, end))
+
+        durations = []
+        for time_units, start, end in results:
+            # unit patterns may consume the separators around a duration
+            matched = text[start:end]
+            durations.append(
+                (time_units,
+                 start + len(matched) - len(matched.lstrip(" ,")),
+                 start + len(matched.rstrip(" ,"))))
+        return durations
+
+    def _sum(self, values):
+        time_units = {}
+        for (_, key, factor), quantities in zip(self.units, values):
+            total = time_units.get(key, 0)
+            for quantity in quantities:
+                total += factor * quantity
+            time_units[key] = total
+        return time_units
+
+    def extract_duration(self, text):
+        """
+        Extract the total duration of text
+
+        Args:
+            text (str): text with numbers already converted to digits
+
+        Returns:
+            (timedelta, str): the duration, None if there is none, and the
+                              remainder with its ends stripped
+        """
+        time_units, text, _ = self.parse(text)
+        text = text.strip()
+        duration = timedelta(**time_units) \
+            if any(time_units.values()) else None
+        return duration, text
+
+
+class DatetimeProgram(namedtuple('DatetimeProgram',
+                                 'text words resolver compiler')):
+    """
+    A datetime expression compiled once, resolved against any anchor
+
+    Compiling does the anchor independent work of a language's datetime
+    parser, normalizing the utterance and converting spoken numbers, so
+    resolving only runs the token pass and date arithmetic.
+
+    Attributes:
+        text (str): the compiled utterance
+        words (tuple): the normalized words of the utterance
+        resolver (callable): resolver(words, anchorDate, default_time)
+        compiler (callable): compiler(text) -> DatetimeProgram of the same
+                             language
+    """
+    __slots__ = ()
+
+    def compile(self, text):
+        """ Compile another text in the same language, skipping dispatch """
+        return self.compiler(text)
+
+    def resolve(self, anchorDate=None, default_time=None):
+        """
+        Args:
+            anchorDate (datetime): A reference date/time for "tommorrow", etc
+            default_time (time): Time to set if no time was found
+
+        Returns:
+            [datetime, str]: the datetime and the remaining text, or None if
+                             no date or time related text was found
+        """
+        if anchorDate and anchorDate.tzinfo is None and \
+                config.inject_timezones:
+            anchorDate = to_local(anchorDate)
+        return self.resolver(list(self.words), anchorDate, default_time)
+
+
+_DATETIME_PROGRAMS = ResultCache()
+
+
+def get_datetime_program(text, lang, compiler):
+    """
+    Get the cached DatetimeProgram of a text, compiling it on first use
+
+    Programs are keyed by language and whitespace normalized text, the
+    cache size follows lingua_franca.config.result_cache_size
+
+    Args:
+        text (str): the utterance
+        lang (str): the language the compiler belongs to
+        compiler (callable): compiler(text) -> DatetimeProgram
+
+    Returns:
+        DatetimeProgram
+    """
+    text = " ".join(text.split())
+    program = _DATETIME_PROGRAMS.get((lang, text))
+    if program is ResultCache._MISSING:
+        program = compiler(text)
+        _DATETIME_PROGRAMS.put((lang, text), program)
+    return program
+
+
+class DatetimeResolution:
+    """
+    The date arithmetic shared by the datetime parsers
+
+    A parser's token passes collect what the utterance said as offsets and
+    absolutes, e.g. "in 2 days at 5 pm" is day_offset 2, hr_abs 17 and
+    min_abs 0, resolve then applies them to the anchor date. hr_abs and
+    min_abs are None when no clock time was said and -1 when a relative
+    time ("in 3 hours") rules one out.
+
+    Two policies exist for clock times: they either replace the time of
+    the anchor, keeping it for relative times (english), or are counted
+    from midnight of the resolved day (german, spanish).
+    """
+    __slots__ = ("datestr", "has_year", "day_specified", "year_offset",
+                 "month_offset", "day_offset", "hr_offset", "min_offset",
+                 "sec_offset", "hr_abs", "min_abs")
+
+    # tried in order, datestr is an english month name with optional day
+    # and year
+    _DATE_FORMATS = ("%B %d", "%B %d %Y", "%B %Y", "%B")
+
+    def __init__(self, datestr="", has_year=False, day_specified=False,
+                 year_offset=0, month_offset=0, day_offset=False,
+                 hr_offset=0, min_offset=0, sec_offset=0, hr_abs=None,
+                 min_abs=None):
+        """
+        Args:
+            datestr (str): explicit date, e.g. "june 5" or "june 5 2017"
+            has_year (bool): datestr includes the year
+            day_specified (bool): the day is explicit, a passed clock time
+                                  is not moved to the next day
+            year_offset, month_offset, day_offset, hr_offset, min_offset,
+            sec_offset (int): relative amounts to add, day_offset is False
+                              if no day was said
+            hr_abs, min_abs (int): clock time
+        """
+        self.datestr = datestr
+        self.has_year = has_year
+        self.day_specified = day_specified
+        self.year_offset = year_offset
+        self.month_offset = month_offset
+        self.day_offset = day_offset
+        self.hr_offset = hr_offset
+        self.min_offset = min_offset
+        self.sec_offset = sec_offset
+        self.hr_abs = hr_abs
+        self.min_abs = min_abs
+
+    def found(self):
+        """ Whether anything date or time related was collected """
+        return bool(self.datestr != "" or
+                    self.year_offset != 0 or self.month_offset != 0 or
+                    self.day_offset is True or self.hr_offset != 0 or
+                    self.hr_abs or self.min_offset != 0 or
+                    self.min_abs or self.sec_offset != 0)
+
+    def _date(self, extractedDate):
+        for date_format in self._DATE_FORMATS[:-1]:
+            try:
+                temp = datetime.strptime(self.datestr, date_format)
+                break
+            except ValueError:
+                pass
+        else:
+            temp = datetime.strptime(self.datestr, self._DATE_FORMATS[-1])
+        if self.has_year:
+            return extractedDate.replace(year=temp.year, month=temp.month,
+                                         day=temp.day)
+        temp = temp.replace(year=extractedDate.year,
+                            tzinfo=extractedDate.tzinfo)
+        year = extractedDate.year if extractedDate < temp else \
+            extractedDate.year + 1
+        return extractedDate.replace(year=year, month=temp.month,
+                                     day=temp.day)
+
+    def _add(self, extractedDate, **offsets):
+        for unit, offset in offsets.items():
+            if offset != 0:
+                extractedDate = extractedDate + relativedelta(**{unit: offset})
+        return extractedDate
+
+    def resolve(self, anchorDate, default_time=None, from_midnight=False):
+        """
+        Args:
+            anchorDate (datetime): A reference date/time for "tommorrow", etc
+            default_time (time): Time to set if no time was found
+            from_midnight (bool): count clock times from midnight of the
+                                  resolved day instead of replacing the
+                                  anchor time
+
+        Returns:
+            datetime: the resolved date and time
+        """
+        default_time = default_time or time(0, 0, 0)
+        dayOffset = self.day_offset or 0
+        hrAbs, minAbs = self.hr_abs, self.min_abs
+        relative_time = self.hr_offset != 0 or self.min_offset != 0 or \
+            self.sec_offset != 0
+        if from_midnight:
+            extractedDate = anchorDate.replace(microsecond=0, second=0,
+                                               minute=0, hour=0)
+            if self.datestr != "":
+                extractedDate = self._date(extractedDate)
+        else:
+            extractedDate = anchorDate.replace(microsecond=0)
+            if self.datestr != "":
+                extractedDate = self._date(
+                    extractedDate.replace(hour=0, minute=0, second=0))
+            elif not relative_time:
+                # ignore the current HH:MM:SS if relative using days or
+                # greater
+                extractedDate = extractedDate.replace(
+                    hour=default_time.hour, minute=default_time.minute,
+                    second=default_time.second)
+        extractedDate = self._add(extractedDate, years=self.year_offset,
+                                  months=self.month_offset, days=dayOffset)
+        time_offsets = dict(hours=self.hr_offset, minutes=self.min_offset,
+                            seconds=self.sec_offset)
+        if not from_midnight:
+            extractedDate = self._add(extractedDate, **time_offsets)
+
+        if hrAbs != -1 and minAbs != -1 and \
+                (from_midnight or not relative_time):
+            if hrAbs is None and minAbs is None and default_time:
+                hrAbs, minAbs = default_time.hour, default_time.minute
+            hrAbs, minAbs = hrAbs or 0, minAbs or 0
+            if from_midnight:
+                extractedDate = extractedDate + relativedelta(hours=hrAbs,
+                                                              minutes=minAbs)
+            else:
+                extractedDate = extractedDate.replace(hour=hrAbs,
+                                                      minute=minAbs)
+            if (hrAbs or minAbs) and self.datestr == "" and \
+                    not self.day_specified and anchorDate > extractedDate:
+                extractedDate = extractedDate + relativedelta(days=1)
+
+        if from_midnight:
+            extractedDate = self._add(extractedDate, **time_offsets)
+        return extractedDate
+
+
+def datetime_remainder(words, joiners=()):
+    """
+    The words a datetime parser did not consume, as text
+
+    Args:
+        words (list): the words, consumed ones blanked to ""
+        joiners (iterable): words such as "and" that are dropped when
+                            nothing is left on either side of them
+
+    Returns:
+        str: the remaining words
+    """
+    last = len(words) - 1
+    for idx, word in enumerate(words):
+        if word in joiners and (idx == 0 or words[idx - 1] == "") and \
+                (idx == last or words[idx + 1] == ""):
+            words[idx] = ""
+    return " ".join(" ".join(words).split())
+
+
+DatetimeSpan = namedtuple('DatetimeSpan', 'datetime start end text')
+DurationSpan = namedtuple('DurationSpan', 'duration start end')
+
+
+class DatetimeStream:
+    """
+    Incremental extract_datetimes for an utterance that keeps growing
+
+    Made for the partial hypotheses of streaming speech recognition. Words
+    are split in clauses at separators, a clause is normalized and resolved
+    once when its separator arrives, so each new partial only costs its new
+    words plus the clause that is still open.
+
+    A language provides a cleaner, turning a clause's (start, end, word)
+    spans into normalized (word, start, end), and the resolver of its
+    DatetimeProgram, which blanks the words it consumes.
+    """
+
+    def __init__(self, clean, resolver, separators=(), qualifiers=(),
+                 anchorDate=None, default_time=None):
+        """
+        Args:
+            clean (callable): clean(spans) -> [(word, start, end)]
+            resolver (callable): resolver(words, anchorDate, default_time)
+            separators (iterable): lowercase words that end a clause
+            qualifiers (iterable): words the resolver reads without
+                                   consuming them, e.g. "tonight"
+            anchorDate (datetime): A reference date/time for "tommorrow",
+                                   etc, defaults to now
+            default_time (time): Time to set if no time was found
+        """
+        anchorDate = anchorDate or now_local()
+        if anchorDate.tzinfo is None and config.inject_timezones:
+            anchorDate = to_local(anchorDate)
+        self.anchorDate = anchorDate
+        self.default_time = default_time
+        self._clean = clean
+        self._resolver = resolver
+        self._separators = frozenset(separators)
+        self._qualifiers = frozenset(qualifiers)
+        self.text = ""
+        self._spans = []
+        # (end, DatetimeSpan or None) of every closed clause, end is the
+        # position after its separator
+        self._clauses = []
+        self._open = None
+
+    def feed(self, tokens):
+        """
+        Append words to the utterance
+
+        Args:
+            tokens (str or [str]): the new words
+        """
+        if not isinstance(tokens, str):
+            tokens = " ".join(tokens)
+        offset = len(self.text) + 1 if self.text else 0
+        self.text = self.text + " " + tokens if self.text else tokens
+        first = len(self._spans)
+        self._spans += [(start + offset, end + offset, word) for start, end, word
+                        in self._tokenize(tokens)]
+        self._close_clauses(first)
+
+    def update(self, text):
+        """
+        Replace the utterance by a revised hypothesis
+
+        Closed clauses the new text still starts with are kept
+
+        Args:
+            text (str): the whole new utterance
+        """
+        spans = self._tokenize(text)
+        same = 0
+        for old, new in zip(self._spans, spans):
+            if old != new:
+                break
+            same += 1
+        while self._clauses and self._clauses[-1][0] > same:
+            self._clauses.pop()
+        self.text = text
+        self._spans = spans
+        self._open = None
+        self._close_clauses(self._clauses[-1][0] if self._clauses else 0)
+
+    def result(self):
+        """
+        Returns:
+            [DatetimeSpan]: (datetime, start, end, text) of every expression
+                            found so far, in order of appearance
+        """
+        start = self._clauses[-1][0] if self._clauses else 0
+        if self._open is None or self._open[0] != (start, len(self._spans)):
+            self._open = ((start, len(self._spans)),
+                          self._resolve(start, len(self._spans)))
+        results = [result for _, result in self._clauses if result]
+        if self._open[1]:
+            results.append(self._open[1])
+        return results
+
+    def _tokenize(self, text):
+        # the tokenizer keeps punctuation after a number, "at 9. then"
+        spans = []
+        for start, end, word in span_indexed_word_tokenize(text):
+            if len(word) > 1 and word[-1] in self._separators and \
+                    word[-2].isdigit():
+                spans += [(start, end - 1, word[:-1]), (end - 1, end, word[-1])]
+            else:
+                spans.append((start, end, word))
+        return spans
+
+    def _close_clauses(self, first):
+        start = self._clauses[-1][0] if self._clauses else 0
+        for idx in range(max(first, start), len(self._spans)):
+            if self._spans[idx][2].lower() in self._separators:
+                self._clauses.append((idx + 1, self._resolve(start, idx)))
+                start = idx + 1
+
+    def _resolve(self, start, end):
+        if start >= end:
+            return None
+        clause = self._clean(self._spans[start:end])
+        words = [word for word, _, _ in clause]
+        result = self._resolver(words, self.anchorDate, self.default_time) \
+            if words else None
+        if not result:
+            return None
+        used = [idx for idx, word in enumerate(words)
+                if not word or word in self._qualifiers]
+        if not used:
+            return None
+        start, end = clause[used[0]][1], clause[used[-1]][2]
+        return DatetimeSpan(result[0], start, end, self.text[start:end])
+
+
 def tokenize(text):
     """
     Generate a list of token object, given a string.
@@ -419,7 +1333,8 @@ def extract_numbers_generic(text, pronounce_handler, extract_handler,
 
     Args:
         text (str): the string to extract a number from
-        pronounce_handler (function): function that pronounces a number
+        pronounce_handler (function): unused, kept for backwards
+        compatibility
         extract_handler (function): function that extracts the last number
         present in a string
         short_scale (bool): Use "short scale" or "long scale" for large
@@ -430,34 +1345,85 @@ def extract_numbers_generic(text, pronounce_handler, extract_handler,
     Returns:
         list: list of extracted numbers as floats
     """
+    return [number.value for number in extract_number_spans_generic(
+        text, extract_handler, short_scale, ordinals)]
+
+
+def _is_scale(value):
+    """ Whether value is a scale word's value, e.g. 100, 1000 or 1000000 """
+    return value >= 100 and value == int(value) and \
+        str(int(value)).rstrip("0") == "1"
+
+
+def extract_number_spans_generic(text, extract_handler, short_scale=True,
+                                 ordinals=False):
+    """
+        Takes in a string and extracts every number with its position.
+        Language agnostic, only needs the language's extract_number
+
+    Numbers are found left to right by growing a window of words from the
+    first word the handler parses, every word is passed to the handler a
+    bounded number of times. A word extends the number while the window
+    parses to a new value that the word alone doesn't explain, e.g.
+    "twenty five" -> 25 but not "one two" -> 2, when a one is the article
+    of a fraction, e.g. "un medio" -> 0.5, or when the handler multiplies
+    it by a scale word, e.g. "un milione". An unparsed word may join two
+    parts of a number, e.g. "vingt et un", two if the handler can't end
+    the number after them.
+
+    Args:
+        text (str): the string to extract numbers from
+        extract_handler (function): function that extracts the last number
+        present in a string
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: list of NumberSpan(value, start, end, is_ordinal) tuples,
+              is_ordinal is always False as the handler doesn't report it
+    """
+    spans = span_indexed_word_tokenize(text)
+    words = [word for _, _, word in spans]
+
+    def extract(start, end):
+        value = extract_handler(" ".join(words[start:end]),
+                                short_scale, ordinals)
+        return None if value is False else value
+
     numbers = []
-    normalized = text
-    extract = extract_handler(normalized, short_scale, ordinals)
-    to_parse = normalized
-    while extract:
-        numbers.append(extract)
-        prev = to_parse
-        num_txt = pronounce_handler(extract)
-        extract = str(extract)
-        if extract.endswith(".0"):
-            extract = extract[:-2]
-
-        # handle duplicate occurences, replace last one only
-        def replace_right(source, target, replacement, replacements=None):
-            return replacement.join(source.rsplit(target, replacements))
-
-        normalized = replace_right(normalized, num_txt, extract, 1)
-        # last biggest number was replaced, recurse to handle cases like
-        # test one two 3
-        to_parse = replace_right(to_parse, num_txt, extract, 1)
-        to_parse = replace_right(to_parse, extract, " ", 1)
-        if to_parse == prev:
-            # avoid infinite loops, occasionally pronounced number may be
-            # different from extracted text,
-            # ie pronounce(0.5) != half and extract(half) == 0.5
-            extract = False
-            # TODO fix this
-        else:
-            extract = extract_handler(to_parse, short_scale, ordinals)
-    numbers.reverse()
+    start = 0
+    while start < len(words):
+        value = extract(start, start + 1)
+        if value is None:
+            start += 1
+            continue
+        end = start + 1
+        idx = start + 1
+        while idx < len(words) and idx - end <= 2:
+            word_value = extract(idx, idx + 1)
+            if word_value is None:
+                # possible connector, e.g. "and", kept only if a number
+                # word follows it, a second one only while the number is
+                # unfinished, e.g. "et hundrede og tyve"
+                if idx > end and extract(start, idx + 1) is not None:
+                    break
+                idx += 1
+                continue
+            window_value = extract(start, idx + 1)
+            if window_value is None:
+                break
+            if window_value == word_value or window_value == value:
+                # "one two" are two numbers, but "one half" is a fraction
+                # and "one thousand" a scale the handler multiplied
+                fraction = 1 in (value, word_value) and window_value % 1
+                scaled = word_value > value and _is_scale(word_value) and \
+                    window_value == value * word_value
+                if not fraction and not scaled:
+                    break
+            value = window_value
+            idx += 1
+            end = idx
+        numbers.append(NumberSpan(value, spans[start][0],
+                                  spans[end - 1][1], False))
+        start = end
     return numbers
@@ -13,21 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import MappingProxyType
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer, \
+    get_normalizer, DurationGrammar
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_CS  # _ARTICLES_CS
 
-import re
 import json
 from lingua_franca import resolve_resource_file
 from lingua_franca.time import now_local
+from lingua_franca.profile import traced, mark
 
 
 def generate_plurals_cs(originals):
@@ -82,6 +84,7 @@ _STRING_SHORT_ORDINAL_CS = invert_dict(_SHORT_ORDINAL_CS)
 _STRING_LONG_ORDINAL_CS = invert_dict(_LONG_ORDINAL_CS)
 
 
+@traced
 def _convert_words_to_numbers_cs(text, short_scale=True, ordinals=False):
     """
     Convert words in a string into their equivalent numbers.
@@ -553,7 +556,7 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
     return val, number_words
 
 
-def _initialize_number_data(short_scale):
+def _build_number_data_cs(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
@@ -563,7 +566,7 @@ def _initialize_number_data(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mapping(str, number), mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -576,7 +579,29 @@ def _initialize_number_data(short_scale):
     string_num_scale_cs = _SHORT_SCALE_CS if short_scale else _LONG_SCALE_CS
     string_num_scale_cs = invert_dict(string_num_scale_cs)
     string_num_scale_cs.update(generate_plurals_cs(string_num_scale_cs))
-    return multiplies, string_num_ordinal_cs, string_num_scale_cs
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_cs), \
+        MappingProxyType(string_num_scale_cs)
+
+
+_NUMBER_DATA_CS = {short_scale: _build_number_data_cs(short_scale)
+                   for short_scale in (True, False)}
+
+
+def _initialize_number_data(short_scale):
+    """
+    Get the read only dictionaries of words to numbers for a scale.
+
+    They are built once at import by _build_number_data_cs.
+
+    Args:
+        short_scale boolean:
+
+    Returns:
+        (frozenset(str), mapping(str, number), mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+
+    """
+    return _NUMBER_DATA_CS[bool(short_scale)]
 
 
 def extract_number_cs(text, short_scale=True, ordinals=False):
@@ -599,6 +624,14 @@ def extract_number_cs(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
+# For day: den, dny, dnů - short patern not applicable, list all
+_DURATION_GRAMMAR_CS = DurationGrammar(
+    [(unit, unit_en, 1) for unit, unit_en in _TIME_UNITS_CONVERSION.items()],
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?")
+
+
+@traced
 def extract_duration_cs(text):
     """
     Convert an english phrase into a number of seconds
@@ -628,36 +661,12 @@ def extract_duration_cs(text):
     if not text:
         return None
 
-    # Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
-    # For day: den, dny, dnů - short patern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
     text = _convert_words_to_numbers_cs(text)
-
-    for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_cs)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    mark("units")
+    return _DURATION_GRAMMAR_CS.extract_duration(text)
 
 
+@traced
 def extract_datetime_cs(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -791,8 +800,10 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
     year_multiples = ["desetiletí", "století", "tisíciletí"]
     day_multiples = ["týden", "měsíc", "rok"]
 
+    mark("clean", text)
     words = clean_string(text)
 
+    mark("date", words)
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -1047,6 +1058,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
             found = True
             daySpecified = True
 
+    mark("time", words)
     # parse time
     hrOffset = 0
     minOffset = 0
@@ -1454,6 +1466,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
             idx += used - 1
             found = True
+    mark("offsets")
     # check that we found a date
     if not date_found():
         return None
@@ -1524,6 +1537,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
         extractedDate = extractedDate + relativedelta(minutes=minOffset)
     if secOffset != 0:
         extractedDate = extractedDate + relativedelta(seconds=secOffset)
+    mark("remainder", words)
     for idx, word in enumerate(words):
         if words[idx] == "a" and \
                 words[idx - 1] == "" and words[idx + 1] == "":
@@ -1586,7 +1600,7 @@ class CzechNormalizer(Normalizer):
 
 def normalize_cs(text, remove_articles=True):
     """ Czech string normalization """
-    return CzechNormalizer().normalize(text, remove_articles)
+    return get_normalizer(CzechNormalizer).normalize(text, remove_articles)
 
 
 def _text_cs_inflection_normalize(word, arg):
@@ -16,13 +16,15 @@
 
 import re
 import json
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import (
+    DatetimeResolution,
+    DurationGrammar,
     ReplaceableNumber,
     Normalizer,
+    get_normalizer,
     Token,
+    datetime_remainder,
     look_for_fractions,
     tokenize,
 )
@@ -38,10 +40,12 @@ from lingua_franca.lang.common_data_de import (
     _ARTICLES
 )
 from lingua_franca.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
+from lingua_franca.profile import traced, mark
 from lingua_franca.internal import resolve_resource_file
 
 
 
+@traced
 def _convert_words_to_numbers_de(text, short_scale=False,
                                  ordinals=False, fractions=True):
     """
@@ -311,6 +315,21 @@ def _extract_real_number_with_text_de(tokens, short_scale):
     return val, number_words
 
 
+_DATETIME_JOINERS_DE = ("und",)
+
+# Einzahl und Mehrzahl
+_DURATION_GRAMMAR_DE = DurationGrammar(
+    [('mikrosekunde', 'microseconds', 1),
+     ('millisekunde', 'milliseconds', 1),
+     ('sekunde', 'seconds', 1),
+     ('minute', 'minutes', 1),
+     ('stunde', 'hours', 1),
+     ('tag', 'days', 1),
+     ('woche', 'weeks', 1)],
+    r"(?:^|\s)(?P<value>\d+(?:[.,]?\d+)?\b)(?:\s+|\-)(?P<unit>{unit}[nes]?[sn]?\b)")
+
+
+@traced
 def extract_duration_de(text):
     """
     Convert an german phrase into a number of seconds
@@ -335,39 +354,12 @@ def extract_duration_de(text):
         return None
 
     text = text.lower()
-    # die time_unit values werden für timedelta() mit dem jeweiligen Wert überschrieben
-    time_units = {
-        'microseconds': 'mikrosekunden',
-        'milliseconds': 'millisekunden',
-        'seconds': 'sekunden',
-        'minutes': 'minuten',
-        'hours': 'stunden',
-        'days': 'tage',
-        'weeks': 'wochen'
-    }
-
-    # Einzahl und Mehrzahl
-    pattern = r"(?:^|\s)(?P<value>\d+(?:[.,]?\d+)?\b)(?:\s+|\-)(?P<unit>{unit}[nes]?[sn]?\b)"
-
     text = _convert_words_to_numbers_de(text)
-
-    for (unit_en, unit_de) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_de[:-1])  # remove 'n'/'e' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            value = match.group("value").replace(",",".")
-            time_units[unit_en] += float(value)
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    mark("units")
+    return _DURATION_GRAMMAR_DE.extract_duration(text)
 
 
+@traced
 def extract_datetime_de(text, anchorDate=None, default_time=None):
     def clean_string(s):
         """
@@ -391,16 +383,6 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
 
         return wordList
 
-    def date_found():
-        return found or \
-            (
-                datestr != "" or timeStr != "" or
-                yearOffset != 0 or monthOffset != 0 or
-                dayOffset is True or hrOffset != 0 or
-                hrAbs or minOffset != 0 or
-                minAbs or secOffset != 0
-            )
-
     if text == "":
         return None
 
@@ -447,8 +429,10 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
     validFollowups.append("letztem")
     validFollowups.append("jetzt")
 
+    mark("clean", text)
     words = clean_string(text)
 
+    mark("date", words)
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -623,8 +607,8 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
             found = True
             daySpecified = True
 
+    mark("time", words)
     # parse time
-    timeStr = ""
     hrOffset = 0
     minOffset = 0
     secOffset = 0
@@ -960,20 +944,7 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
             idx += used - 1
             found = True
 
-    # check that we found a date
-    if not date_found():
-        return None
-
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = dateNow
-    extractedDate = extractedDate.replace(microsecond=0,
-                                          second=0,
-                                          minute=0,
-                                          hour=0)
+    mark("offsets")
     if datestr != "":
         en_months = ['january', 'february', 'march', 'april', 'may', 'june',
                      'july', 'august', 'september', 'october', 'november',
@@ -985,74 +956,16 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
             datestr = datestr.replace(months[idx], en_month)
         for idx, en_month in enumerate(en_monthsShort):
             datestr = datestr.replace(monthsShort[idx], en_month)
-
-        if hasYear:
-            temp = datetime.strptime(datestr, "%B %d %Y")
-        else:
-            temp = datetime.strptime(datestr, "%B %d")
-
-        if extractedDate.tzinfo:
-            temp = temp.replace(tzinfo=extractedDate.tzinfo)
-
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(year=int(currentYear),
-                                                      month=int(
-                                                          temp.strftime(
-                                                              "%m")),
-                                                      day=int(temp.strftime(
-                                                          "%d")))
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
-
-    if timeStr != "":
-        temp = datetime(timeStr)
-        extractedDate = extractedDate.replace(hour=temp.strftime("%H"),
-                                              minute=temp.strftime("%M"),
-                                              second=temp.strftime("%S"))
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-
-    if hrAbs is None and minAbs is None and default_time:
-        hrAbs = default_time.hour
-        minAbs = default_time.minute
-
-    if hrAbs != -1 and minAbs != -1:
-
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
-        if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "und" and words[idx - 1] == "" \
-                and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-
-    return [extractedDate, resultStr]
+    resolution = DatetimeResolution(
+        datestr, hasYear, daySpecified, yearOffset, monthOffset, dayOffset,
+        hrOffset, minOffset, secOffset, hrAbs, minAbs)
+    # check that we found a date
+    if not found and not resolution.found():
+        return None
+    extractedDate = resolution.resolve(dateNow, default_time,
+                                       from_midnight=True)
+    mark("remainder", words)
+    return [extractedDate, datetime_remainder(words, _DATETIME_JOINERS_DE)]
 
 
 def is_fractional_de(input_str, short_scale=False):
@@ -1229,4 +1142,4 @@ class GermanNormalizer(Normalizer):
 
 
 def normalize_de(text, remove_articles=True):
-    return GermanNormalizer().normalize(text, remove_articles)
+    return get_normalizer(GermanNormalizer).normalize(text, remove_articles)
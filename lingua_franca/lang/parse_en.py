@@ -14,9 +14,10 @@
 # limitations under the License.
 #
 import json
-import re
-from datetime import datetime, timedelta, time
-from dateutil.relativedelta import relativedelta
+from bisect import bisect_left, bisect_right
+from datetime import timedelta, time
+from types import MappingProxyType
+from quebra_frases import span_indexed_word_tokenize
 
 from lingua_franca.internal import resolve_resource_file
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, \
@@ -26,8 +27,12 @@ from lingua_franca.lang.common_data_en import _ARTICLES_EN, _LONG_ORDINAL_EN, _L
     _STRING_NUM_EN, _STRING_SHORT_ORDINAL_EN, _STRING_LONG_ORDINAL_EN, \
     _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer, \
+    get_normalizer, NumberSpan, DatetimeProgram, get_datetime_program, \
+    DatetimeStream, DurationGrammar, DurationSpan, DatetimeResolution, \
+    datetime_remainder
 from lingua_franca.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
+from lingua_franca.profile import traced, mark
 from lingua_franca.util.colors import Color, ColorOutOfSpace
 
 
@@ -95,6 +100,7 @@ def get_color_en(text):
     return color
 
 
+@traced
 def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
     """
     Convert words in a string into their equivalent numbers.
@@ -152,26 +158,90 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
     """
     placeholder = "<placeholder>"  # inserted to maintain correct indices
     results = []
+    # extracted numbers are overwritten with placeholders in place, so
+    # every other token keeps its position and nothing is rescanned:
+    #  - the fraction and decimal passes only run while their marker
+    #    splits the tokens in exactly 3 partitions, as they require
+    #  - the whole number scan resumes after the last token which reset
+    #    it, the tokens before it can't be part of any number anymore
+    indices = [t.index for t in tokens]
+    sorted_indices = all(a <= b for a, b in zip(indices, indices[1:]))
+    markers = {c: {idx for idx, t in enumerate(tokens) if t.word == c}
+               for c in _FRACTION_MARKER_EN | _DECIMAL_MARKER_EN}
+    start = 0
     while True:
-        to_replace = \
-            _extract_number_with_text_en(tokens, short_scale,
-                                         ordinals, fractional_numbers)
+        number, number_tokens, resume = None, None, None
+        if fractional_numbers:
+            if _has_three_partitions(_FRACTION_MARKER_EN, markers,
+                                     len(tokens)):
+                number, number_tokens = _extract_fraction_with_text_en(
+                    tokens, short_scale, ordinals)
+            if not number and _has_three_partitions(_DECIMAL_MARKER_EN,
+                                                    markers, len(tokens)):
+                number, number_tokens = _extract_decimal_with_text_en(
+                    tokens, short_scale, ordinals)
+        if not number:
+            number, number_tokens, resume = _scan_whole_number_en(
+                tokens, short_scale, ordinals, start)
+        while number_tokens and number_tokens[0].word in _ARTICLES_EN:
+            number_tokens.pop(0)
+        to_replace = ReplaceableNumber(number, number_tokens)
 
         if not to_replace:
             break
 
         results.append(to_replace)
 
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
+        if sorted_indices:
+            first = bisect_left(indices, to_replace.start_index)
+            replaced = range(first,
+                             bisect_right(indices, to_replace.end_index))
+        else:
+            replaced = [idx for idx, t in enumerate(tokens) if
+                        to_replace.start_index <= t.index <=
+                        to_replace.end_index]
+        if resume is not None:
+            start = resume
+        elif replaced and replaced[0] < start:
+            start = 0
+        # the caller's list is never overwritten
+        if len(results) == 1:
+            tokens = list(tokens)
+        for idx in replaced:
+            markers.get(tokens[idx].word, set()).discard(idx)
+            tokens[idx] = Token(placeholder, tokens[idx].index)
     results.sort(key=lambda n: n.start_index)
     return results
 
 
+def _has_three_partitions(marker_words, markers, length):
+    """
+    Check if partition_list would split a token list in 3 on any marker
+
+    Args:
+        marker_words (set): words to split on
+        markers (dict): marker word -> positions of the tokens
+        length (int): number of tokens
+
+    Returns:
+        bool
+    """
+    for word in marker_words:
+        positions = markers[word]
+        if not positions or len(positions) > 3:
+            continue
+        # each marker is a partition, so is every non empty gap
+        partitions = len(positions)
+        prev = -1
+        for idx in sorted(positions):
+            partitions += idx - prev > 1
+            prev = idx
+        partitions += length - 1 > prev
+        if partitions == 3:
+            return True
+    return False
+
+
 def _extract_number_with_text_en(tokens, short_scale=True,
                                  ordinals=False, fractional_numbers=True):
     """
@@ -335,6 +405,26 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
         int or float, [Tokens]
         The value parsed, and tokens that it corresponds to.
 
+    """
+    return _scan_whole_number_en(tokens, short_scale, ordinals)[:2]
+
+
+def _scan_whole_number_en(tokens, short_scale, ordinals, start=0):
+    """
+    Scan for the first whole number, starting at token position start.
+
+    Args:
+        tokens [Token]:
+        short_scale boolean:
+        ordinals boolean:
+        start int: position of the first token to consider, the token
+                   before it must be one that resets the scan
+
+    Returns:
+        int or float, [Tokens], int
+        The value parsed, tokens that it corresponds to and the position
+        to resume scanning from once those tokens are replaced.
+
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data_en(short_scale, speech=ordinals is not None)
@@ -344,7 +434,9 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     prev_val = None
     next_val = None
     to_sum = []
-    for idx, token in enumerate(tokens):
+    resume = start
+    for idx in range(start, len(tokens)):
+        token = tokens[idx]
         current_val = None
         if next_val:
             next_val = None
@@ -388,6 +480,7 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 break
             else:
                 number_words = []
+                resume = idx + 1
                 continue
         elif word not in multiplies \
                 and prev_word not in multiplies \
@@ -560,10 +653,10 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     if val is not None and to_sum:
         val += sum(to_sum)
 
-    return val, number_words
+    return val, number_words, resume
 
 
-def _initialize_number_data_en(short_scale, speech=True):
+def _build_number_data_en(short_scale, speech=True):
     """
     Generate dictionaries of words to numbers, based on scale.
 
@@ -574,7 +667,7 @@ def _initialize_number_data_en(short_scale, speech=True):
         speech (bool): consider extra words (_SPOKEN_EXTRA_NUM_EN) to be numbers
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mapping(str, number), mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -590,7 +683,31 @@ def _initialize_number_data_en(short_scale, speech=True):
 
     if speech:
         string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_en), \
+        MappingProxyType(string_num_scale_en)
+
+
+_NUMBER_DATA_EN = {
+    (short_scale, speech): _build_number_data_en(short_scale, speech)
+    for short_scale in (True, False) for speech in (True, False)}
+
+
+def _initialize_number_data_en(short_scale, speech=True):
+    """
+    Get the read only dictionaries of words to numbers for a scale.
+
+    They are built once at import by _build_number_data_en.
+
+    Args:
+        short_scale (bool):
+        speech (bool): consider extra words to be numbers
+
+    Returns:
+        (frozenset(str), mapping(str, number), mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+
+    """
+    return _NUMBER_DATA_EN[bool(short_scale), bool(speech)]
 
 
 def extract_number_en(text, short_scale=True, ordinals=False):
@@ -613,6 +730,23 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+_DURATION_GRAMMAR_EN = DurationGrammar(
+    [('month', 'days', DAYS_IN_1_MONTH),
+     ('year', 'days', DAYS_IN_1_YEAR),
+     ('decade', 'days', 10 * DAYS_IN_1_YEAR),
+     ('century', 'days', 100 * DAYS_IN_1_YEAR),
+     ('millennium', 'days', 1000 * DAYS_IN_1_YEAR),
+     ('microsecond', 'microseconds', 1),
+     ('millisecond', 'milliseconds', 1),
+     ('second', 'seconds', 1),
+     ('minute', 'minutes', 1),
+     ('hour', 'hours', 1),
+     ('day', 'days', 1),
+     ('week', 'weeks', 1)],
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?")
+
+
+@traced
 def extract_duration_en(text):
     """
     Convert an english phrase into a number of seconds
@@ -642,58 +776,76 @@ def extract_duration_en(text):
     if not text:
         return None
 
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-    # NOTE: these are spelled wrong on purpose because of the loop below that strips the s
-    units = ['months', 'years', 'decades', 'centurys', 'millenniums'] + \
-            list(time_units.keys())
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
     text = _convert_words_to_numbers_en(text)
     text = text.replace("centuries", "century").replace("millenia", "millennium")
     for word in ('day', 'month', 'year', 'decade', 'century', 'millennium'):
         text = text.replace(f'a {word}', f'1 {word}')
 
-    for unit_en in units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])  # remove 's' from unit
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        if unit_en not in time_units:
-            text = re.sub(unit_pattern, repl_non_std, text)
-        else:
-            text = re.sub(unit_pattern, repl, text)
+    mark("units")
+    return _DURATION_GRAMMAR_EN.extract_duration(text)
+
 
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
+_DURATION_JOINERS_EN = ("and",)
+_DURATION_WORDS_EN = {"centuries": "century", "millenia": "millennium"}
+# units where "a" means one, e.g. "a day"
+_A_DURATION_UNITS_EN = ('day', 'month', 'year', 'decade', 'centur', 'millen')
 
-    return (duration, text)
 
+@traced
+def extract_durations_en(text):
+    """
+    Extract every duration of an english phrase with its position
+
+    Args:
+        text (str): string containing durations
 
+    Returns:
+        list: list of DurationSpan(duration, start, end) tuples
+    """
+    # same tokens as tokenize(text), token indices map back to char spans
+    spans = span_indexed_word_tokenize(text)
+    tokens = [Token(word, idx) for idx, (_, _, word) in enumerate(spans)]
+    numbers = {number.start_index: number
+               for number in _extract_numbers_with_text_en(tokens)}
+
+    # text with numbers as digits, as in _convert_words_to_numbers_en, and
+    # the char span each of its words comes from
+    words = []
+    word_spans = []
+    idx = 0
+    while idx < len(spans):
+        if idx in numbers:
+            number = numbers[idx]
+            words.append(str(number.value))
+            word_spans.append((spans[idx][0], spans[number.end_index][1]))
+            idx = number.end_index + 1
+            continue
+        word = spans[idx][2]
+        if word == "a" and idx + 1 < len(spans) and \
+                idx + 1 not in numbers and \
+                spans[idx + 1][2].startswith(_A_DURATION_UNITS_EN):
+            word = "1"
+        words.append(_DURATION_WORDS_EN.get(word, word))
+        word_spans.append(spans[idx][:2])
+        idx += 1
+
+    offsets = []
+    offset = 0
+    for word in words:
+        offsets.append(offset)
+        offset += len(word) + 1
+    results = []
+    for time_units, start, end in _DURATION_GRAMMAR_EN.durations(
+            " ".join(words), _DURATION_JOINERS_EN):
+        first = bisect_right(offsets, start) - 1
+        last = bisect_right(offsets, end - 1) - 1
+        results.append(DurationSpan(timedelta(**time_units),
+                                    word_spans[first][0],
+                                    word_spans[last][1]))
+    return results
+
+
+@traced
 def extract_datetime_en(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -724,48 +876,228 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if text == "":
+        return None
+    return compile_datetime_en(text).resolve(anchorDate, default_time)
+
+
+def compile_datetime_en(text):
+    """ Compile a human date reference, to resolve against any anchor
+
+    The utterance is normalized and its spoken numbers converted once,
+    programs are cached by text so repeated phrases skip that work.
+
+    Args:
+        text (str): string containing date words
+
+    Returns:
+        DatetimeProgram: program.resolve(anchorDate, default_time) returns
+                         the same as extract_datetime_en(text, anchorDate,
+                                                      default_time)
+    """
+    return get_datetime_program(text, "en", _compile_datetime_en)
+
+
+def _compile_datetime_en(text):
+    return DatetimeProgram(text, tuple(_clean_datetime_string_en(text)),
+                           _resolve_datetime_en, compile_datetime_en)
+
+
+@traced
+def _clean_datetime_string_en(s):
+    """ Normalized words of a datetime utterance, see extract_datetime_en """
+    # normalize and lowercase utt  (replaces words with numbers)
+    s = _convert_words_to_numbers_en(s, ordinals=None)
+    # clean unneeded punctuation and capitalization among other things.
+    s = s.lower().replace('?', '').replace(',', '') \
+        .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
+        .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
+        .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
+        .replace("oclock", "o'clock").replace("couple", "2") \
+        .replace("centuries", "century").replace("decades", "decade") \
+        .replace("millenniums", "millennium")
+
+    wordList = s.split()
+    for idx, word in enumerate(wordList):
+        word = word.replace("'s", "")
+
+        ordinals = ["rd", "st", "nd", "th"]
+        if word[0].isdigit():
+            for ordinal in ordinals:
+                # "second" is the only case we should not do this
+                if ordinal in word and "second" not in word:
+                    word = word.replace(ordinal, "")
+        wordList[idx] = word
+
+    return wordList
+
+
+@traced
+def extract_datetimes_en(text, anchorDate=None, default_time=None):
+    """ Find every date and time expression in a text
+
+    The text is split in clauses at words like "until" or "then" and each
+    clause is resolved like extract_datetime_en, so
+    "from monday at 9 until friday at 5" gives two datetimes.
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [DatetimeSpan]: (datetime, start, end, text) of every expression, in
+                        order of appearance, text is text[start:end]
+    """
+    stream = datetime_stream_en(anchorDate, default_time)
+    stream.feed(text)
+    return stream.result()
 
-    def clean_string(s):
-        # normalize and lowercase utt  (replaces words with numbers)
-        s = _convert_words_to_numbers_en(s, ordinals=None)
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace(',', '') \
-            .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
-            .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
-            .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
-            .replace("oclock", "o'clock").replace("couple", "2") \
-            .replace("centuries", "century").replace("decades", "decade") \
-            .replace("millenniums", "millennium")
-
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            word = word.replace("'s", "")
-
-            ordinals = ["rd", "st", "nd", "th"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    # "second" is the only case we should not do this
-                    if ordinal in word and "second" not in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
-
-    def date_found():
-        return found or \
-               (
-                       datestr != "" or
-                       yearOffset != 0 or monthOffset != 0 or
-                       dayOffset is True or hrOffset != 0 or
-                       hrAbs or minOffset != 0 or
-                       minAbs or secOffset != 0
-               )
 
+def datetime_stream_en(anchorDate=None, default_time=None):
+    """ Incremental extract_datetimes_en for a growing utterance
+
+    Args:
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        DatetimeStream: feed it words, stream.result() returns the same as
+                        extract_datetimes_en(stream.text)
+    """
+    return DatetimeStream(_clean_datetime_spans_en, _resolve_datetime_en,
+                          _DATETIME_SEPARATORS_EN, ("tonight", "night"),
+                          anchorDate, default_time)
+
+
+# "to", "and" and "," are not separators, they are part of "ten to six",
+# "two weeks and three days" and "june 5th, 2018"
+_DATETIME_SEPARATORS_EN = frozenset(["until", "till", "til", "then", "or",
+                                     "through", ";", ".", "!", "?"])
+
+
+@traced
+def _clean_datetime_spans_en(spans):
+    """ _clean_datetime_string_en of (start, end, word) spans, keeping the
+    char span of every normalized word """
+    tokens = [Token(word, idx) for idx, (_, _, word) in enumerate(spans)]
+    numbers = {}
+    for number in _extract_numbers_with_text_en(tokens, ordinals=None):
+        indices = [token.index for token in number.tokens]
+        numbers[min(indices)] = (str(number.value), max(indices))
+
+    words = []
+    idx = 0
+    while idx < len(spans):
+        start, end, word = spans[idx]
+        if idx in numbers:
+            word, idx = numbers[idx]
+            end = spans[idx][1]
+        idx += 1
+        word = word.lower().replace('?', '').replace(',', '')
+        if word in ("", "the", "a", "an"):
+            continue
+        # o'clock is a single token, o clock and o 'clock are not
+        if word == "o" and idx < len(spans) and \
+                spans[idx][2].lower() in ("clock", "'clock"):
+            word, end = "o'clock", spans[idx][1]
+            idx += 1
+        word = word.replace("oclock", "o'clock").replace("couple", "2") \
+            .replace("centuries", "century").replace("decades", "decade") \
+            .replace("millenniums", "millennium").replace("'s", "")
+        if word and word[0].isdigit():
+            for ordinal in ["rd", "st", "nd", "th"]:
+                # "second" is the only case we should not do this
+                if ordinal in word and "second" not in word:
+                    word = word.replace(ordinal, "")
+        if word:
+            words.append((word, start, end))
+    return words
+
+
+_WEEKDAYS_EN = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday',
+                'saturday', 'sunday')
+_MONTHS_EN = ('january', 'february', 'march', 'april', 'may', 'june',
+              'july', 'august', 'september', 'october', 'november',
+              'december')
+_MONTHS_SHORT_EN = ('jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                    'sept', 'oct', 'nov', 'dec')
+_AM_QUALIFIERS_EN = frozenset(['morning'])
+_PM_QUALIFIERS_EN = frozenset(['afternoon', 'evening', 'night', 'tonight'])
+_YEAR_MARKERS_EN = frozenset(['in', 'on', 'of'])
+_PAST_MARKERS_EN = frozenset(["was", "last", "past"])
+_EARLIER_MARKERS_EN = frozenset(["ago", "earlier"])
+# in a month -> + 1 month timedelta, next month -> day 1 of next month
+_FUTURE_MARKERS_EN = frozenset(["in", "within", "next"])
+_DATETIME_MARKERS_EN = _YEAR_MARKERS_EN | {'at', 'by', 'this', 'around',
+                                           'for', 'within'}
+_RECUR_MARKERS_EN = frozenset(_WEEKDAYS_EN + tuple(d + 's' for d in
+                                                   _WEEKDAYS_EN) +
+                              ('weekend', 'weekday', 'weekends', 'weekdays'))
+_YEAR_MULTIPLES_EN = frozenset(["decade", "century", "millennium"])
+_DAY_MULTIPLES_EN = frozenset(["weeks", "months", "years"])
+_DATETIME_JOINERS_EN = ("and",)
+# 5 days from tomorrow, 10 weeks from next thursday, 2 months from July
+_DATE_FOLLOWUPS_EN = frozenset(_WEEKDAYS_EN + _MONTHS_EN + _MONTHS_SHORT_EN +
+                               ("today", "tomorrow", "yesterday", "next",
+                                "last", "past", "now", "this"))
+
+# token classes of the datetime lexicons
+(_NOW, _EARLIER, _YEAR_MARKER, _COUPLE, _QUALIFIER, _RELATIVE_DAY, _UNIT,
+ _WEEKDAY, _MONTH, _MONTH_SHORT, _FROM, _HOUR, _DAYTIME, _NIGHT, _FUTURE,
+ _PAST) = range(16)
+_UNKNOWN = (None, None)
+
+# word of the date pass, stripped of its trailing s -> (class, value)
+_DATE_LEXICON_EN = {
+    "now": (_NOW, None),
+    "2": (_COUPLE, 2),
+    "today": (_RELATIVE_DAY, 0),
+    "tomorrow": (_RELATIVE_DAY, 1),
+    "yesterday": (_RELATIVE_DAY, -1),
+    "from": (_FROM, None),
+    "after": (_FROM, None),
+}
+_DATE_LEXICON_EN.update((word, (_EARLIER, None))
+                        for word in _EARLIER_MARKERS_EN)
+_DATE_LEXICON_EN.update((word, (_YEAR_MARKER, None))
+                        for word in _YEAR_MARKERS_EN)
+_DATE_LEXICON_EN.update((word, (_QUALIFIER, None))
+                        for word in _AM_QUALIFIERS_EN | _PM_QUALIFIERS_EN)
+_DATE_LEXICON_EN.update((word, (_UNIT, None))
+                        for word in ("day", "before", "week", "weekend",
+                                     "month", "year"))
+_DATE_LEXICON_EN.update((word, (_WEEKDAY, idx))
+                        for idx, word in enumerate(_WEEKDAYS_EN))
+# may, june and july are full month names, the short forms of the others
+# are only dates when no "from" came before
+_DATE_LEXICON_EN.update((word, (_MONTH_SHORT, idx))
+                        for idx, word in enumerate(_MONTHS_SHORT_EN))
+_DATE_LEXICON_EN.update((word, (_MONTH, idx))
+                        for idx, word in enumerate(_MONTHS_EN))
+
+# word of the time pass -> (class, value)
+_TIME_LEXICON_EN = {
+    "noon": (_HOUR, 12),
+    "midnight": (_HOUR, 0),
+    "morning": (_DAYTIME, 8),
+    "afternoon": (_DAYTIME, 15),
+    "evening": (_DAYTIME, 19),
+    "tonight": (_NIGHT, 22),
+    "night": (_NIGHT, 22),
+    "2": (_COUPLE, 2),
+    "hour": (_UNIT, None),
+}
+_TIME_LEXICON_EN.update((word, (_FUTURE, 1)) for word in _FUTURE_MARKERS_EN)
+_TIME_LEXICON_EN.update((word, (_PAST, -1)) for word in _PAST_MARKERS_EN)
+
+
+@traced
+def _resolve_datetime_en(words, anchorDate=None, default_time=None):
+    """ extract_datetime_en from the output of _clean_datetime_string_en """
     if not anchorDate:
         anchorDate = now_local()
 
-    if text == "":
-        return None
     default_time = default_time or time(0, 0, 0)
     found = False
     daySpecified = False
@@ -780,53 +1112,34 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    year_markers = ['in', 'on', 'of']
-    past_markers = ["last", "past"]
-    earlier_markers = ["ago", "earlier"]
-    later_markers = ["after", "later"]
-    future_markers = ["in", "within"]  # in a month -> + 1 month timedelta
-    future_1st_markers = ["next"]  # next month -> day 1 of next month
-    markers = year_markers + ['at', 'by', 'this', 'around', 'for', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
-    past_markers = ["was", "last", "past"]
-
-    words = clean_string(text)
-
+    mark("date", words)
     for idx, word in enumerate(words):
         if word == "":
             continue
-        wordPrevPrev = words[idx - 2] if idx > 1 else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
         wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
-
         # this isn't in clean string because I don't want to save back to words
         word = word.rstrip('s')
         start = idx
+        kind, value = _DATE_LEXICON_EN.get(word, _UNKNOWN)
+        # only vocabulary words and "N decades" can start a date
+        if kind is None and wordNext not in _YEAR_MULTIPLES_EN:
+            continue
+        wordPrevPrev = words[idx - 2] if idx > 1 else ""
+        wordPrev = words[idx - 1] if idx > 0 else ""
+        wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
+
         used = 0
         # save timequalifier for later
-        if word in earlier_markers and dayOffset:
+        if kind == _EARLIER and dayOffset:
             dayOffset = - dayOffset
             used += 1
-        elif word == "now" and not datestr:
+        elif kind == _NOW and not datestr:
+            words[idx] = ""
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
             extractedDate = anchorDate.replace(microsecond=0)
             return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+        elif wordNext in _YEAR_MULTIPLES_EN:
             multiplier = None
             if is_numeric(word):
                 try:
@@ -847,23 +1160,23 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNext == "millennium":
                 yearOffset = multiplier * 1000 + int(_leftover[:3]) * 100
 
-            if wordNextNext in earlier_markers:
+            if wordNextNext in _EARLIER_MARKERS_EN:
                 yearOffset = yearOffset * -1
                 used += 1
-            elif word in past_markers:
+            elif word in _PAST_MARKERS_EN:
                 yearOffset = yearOffset * -1
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 yearOffset = yearOffset * -1
                 start -= 1
                 used += 1
 
-        elif word in year_markers and wordNext.isdigit() and len(wordNext) == 4:
+        elif kind == _YEAR_MARKER and wordNext.isdigit() and len(wordNext) == 4:
             yearOffset = int(wordNext) - int(currentYear)
             used += 2
             hasYear = True
         # couple of
-        elif word == "2" and wordNext == "of" and \
-                wordNextNext in year_multiples:
+        elif kind == _COUPLE and wordNext == "of" and \
+                wordNextNext in _YEAR_MULTIPLES_EN:
             multiplier = 2
             used += 3
             if wordNextNext == "decade":
@@ -872,8 +1185,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 yearOffset = multiplier * 100
             elif wordNextNext == "millennium":
                 yearOffset = multiplier * 1000
-        elif word == "2" and wordNext == "of" and \
-                wordNextNext in day_multiples:
+        elif kind == _COUPLE and wordNext == "of" and \
+                wordNextNext in _DAY_MULTIPLES_EN:
             multiplier = 2
             used += 3
             if wordNextNext == "years":
@@ -882,14 +1195,11 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 monthOffset = multiplier
             elif wordNextNext == "weeks":
                 dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
+        elif kind == _QUALIFIER:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
-        elif word == "today" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "tomorrow" and not fromFlag:
-            dayOffset = 1
+        elif kind == _RELATIVE_DAY and not fromFlag:
+            dayOffset = value
             used += 1
         elif word == "day" and wordNext == "before" and wordNextNext == "yesterday" and not fromFlag:
             dayOffset = -2
@@ -897,9 +1207,6 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         elif word == "before" and wordNext == "yesterday" and not fromFlag:
             dayOffset = -2
             used += 2
-        elif word == "yesterday" and not fromFlag:
-            dayOffset = -1
-            used += 1
         elif (word == "day" and
               wordNext == "after" and
               wordNextNext == "tomorrow" and
@@ -911,28 +1218,28 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used += 1
         # parse 5 days, 10 weeks, last week, next week
-        elif word == "day" and wordNext not in earlier_markers:
+        elif word == "day" and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 dayOffset += int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
 
             # next day
             # normalize step makes "in a day" -> "in day"
-            elif wordPrev and wordPrev in future_markers + future_1st_markers:
+            elif wordPrev and wordPrev in _FUTURE_MARKERS_EN:
                 dayOffset += 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset = -1
                 start -= 1
                 used = 2
         # parse X days ago
-        elif word == "day" and wordNext in earlier_markers:
+        elif word == "day" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 dayOffset -= int(wordPrev)
                 start -= 1
@@ -941,31 +1248,31 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset -= 1
                 used = 2
         # parse last/past/next week and in/after X weeks
-        elif word == "week" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "week" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
             # next week -> next monday
-            elif wordPrev in future_1st_markers:
+            elif wordPrev == "next":
                 dayOffset = 7 - wkday
                 start -= 1
                 used = 2
             # normalize step makes "in a week" -> "in week"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 dayOffset = 7
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset = -7
                 start -= 1
                 used = 2
         # parse X weeks ago
-        elif word == "week" and not fromFlag and wordNext in earlier_markers:
+        elif word == "week" and not fromFlag and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 dayOffset -= int(wordPrev) * 7
                 start -= 1
@@ -974,7 +1281,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset -= 7
                 used = 2
         # parse last/past/next weekend and in/after X weekends
-        elif word == "weekend" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "weekend" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             # in/after X weekends
             if wordPrev[0].isdigit():
                 n = int(wordPrev)
@@ -983,12 +1290,12 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset += n * 7
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
             # next weekend -> next saturday
-            elif wordPrev in future_1st_markers:
+            elif wordPrev == "next":
                 if wkday < 5:
                     dayOffset = 5 - wkday
                 elif wkday == 5:
@@ -998,17 +1305,17 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used = 2
             # normalize step makes "in a weekend" -> "in weekend" (next monday)
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 dayOffset += 7 - wkday  # next monday
                 start -= 1
                 used = 2
             # last/past weekend -> last/past saturday
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset -= wkday + 2
                 start -= 1
                 used = 2
         # parse X weekends ago
-        elif word == "weekend" and not fromFlag and wordNext in earlier_markers:
+        elif word == "weekend" and not fromFlag and wordNext in _EARLIER_MARKERS_EN:
             dayOffset -= wkday + 3  # past friday "one weekend ago"
             used = 2
             # X weekends ago
@@ -1018,31 +1325,31 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used = 3
         # parse 10 months, next month, last month
-        elif word == "month" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "month" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     monthOffset = monthOffset * -1
                     start -= 1
                     used += 1
             # next month -> day 1
-            elif wordPrev in future_1st_markers:
+            elif wordPrev == "next":
                 next_dt = (anchorDate.replace(day=1) + timedelta(days=32)).replace(day=1)
                 dayOffset = (next_dt - anchorDate).days
                 start -= 1
                 used = 2
             # normalize step makes "in a month" -> "in month"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 monthOffset = 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 monthOffset = -1
                 start -= 1
                 used = 2
-        elif word == "month" and wordNext in earlier_markers:
+        elif word == "month" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 monthOffset -= int(wordPrev)
                 start -= 1
@@ -1051,31 +1358,31 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 monthOffset -= 1
                 used = 2
         # parse 5 years, next year, last year
-        elif word == "year" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "year" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     yearOffset = yearOffset * -1
                     start -= 1
                     used += 1
             # next year -> day 1
-            elif wordPrev in future_1st_markers:
+            elif wordPrev == "next":
                 next_dt = anchorDate.replace(day=1, month=1, year=anchorDate.year + 1)
                 dayOffset = (next_dt - anchorDate).days
                 start -= 1
                 used = 2
             # normalize step makes "in a year" -> "in year"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 yearOffset = 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 yearOffset = -1
                 start -= 1
                 used = 2
-        elif word == "year" and wordNext in earlier_markers:
+        elif word == "year" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 yearOffset -= int(wordPrev)
                 start -= 1
@@ -1086,8 +1393,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif kind == _WEEKDAY and not fromFlag:
+            d = value
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -1097,18 +1404,15 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     dayOffset += 7
                 used += 1
                 start -= 1
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset -= 7
                 used += 1
                 start -= 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif kind == _MONTH or kind == _MONTH_SHORT and not fromFlag:
+            m = value
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_EN[m]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -1141,7 +1445,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif word == 'may' and wordNext in ['i', 'we', 'be']:
                 datestr = ""
             # when was MONTH
-            elif not hasYear and wordPrev in past_markers:
+            elif not hasYear and wordPrev in _PAST_MARKERS_EN:
                 if anchorDate.month > m:
                     datestr += f" {anchorDate.year}"
                 else:
@@ -1156,39 +1460,30 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hasYear = True
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("past")
-        validFollowups.append("now")
-        validFollowups.append("this")
-        if (word == "from" or word == "after") and wordNext in validFollowups:
+        if kind == _FROM and wordNext in _DATE_FOLLOWUPS_EN:
             used = 2
             fromFlag = True
             if wordNext == "tomorrow":
                 dayOffset += 1
             elif wordNext == "yesterday":
                 dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _WEEKDAYS_EN:
+                d = _WEEKDAYS_EN.index(wordNext)
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _WEEKDAYS_EN:
+                d = _WEEKDAYS_EN.index(wordNextNext)
                 tmpOffset = (d + 1) - int(today)
                 used = 3
-                if wordNext in future_1st_markers:
+                if wordNext == "next":
                     if dayOffset <= 2:
                         tmpOffset += 7
                     used += 1
                     start -= 1
-                elif wordNext in past_markers:
+                elif wordNext in _PAST_MARKERS_EN:
                     tmpOffset -= 7
                     used += 1
                     start -= 1
@@ -1201,11 +1496,12 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_EN:
                 words[start - 1] = ""
             found = True
             daySpecified = True
 
+    mark("time", words)
     # parse time
     hrOffset = 0
     minOffset = 0
@@ -1217,6 +1513,10 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     for idx, word in enumerate(words):
         if word == "":
             continue
+        kind, value = _TIME_LEXICON_EN.get(word, _UNKNOWN)
+        # only vocabulary words and numbers can be a time
+        if kind is None and not word[0].isdigit():
+            continue
 
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
         wordPrev = words[idx - 1] if idx > 0 else ""
@@ -1224,31 +1524,20 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
         # parse noon, midnight, morning, afternoon, evening
         used = 0
-        if word == "noon":
-            hrAbs = 12
+        if kind == _HOUR:
+            hrAbs = value
             used += 1
-        elif word == "midnight":
-            hrAbs = 0
-            used += 1
-        elif word == "morning":
+        elif kind == _DAYTIME:
             if hrAbs is None:
-                hrAbs = 8
+                hrAbs = value
             used += 1
-        elif word == "afternoon":
+        elif kind == _NIGHT:
             if hrAbs is None:
-                hrAbs = 15
-            used += 1
-        elif word == "evening":
-            if hrAbs is None:
-                hrAbs = 19
-            used += 1
-        elif word == "tonight" or word == "night":
-            if hrAbs is None:
-                hrAbs = 22
+                hrAbs = value
             # used += 1 ## NOTE this breaks other tests, TODO refactor me!
 
         # couple of time_unit
-        elif word == "2" and wordNext == "of" and \
+        elif kind == _COUPLE and wordNext == "of" and \
                 wordNextNext in ["hours", "minutes", "seconds"]:
             used += 3
             if wordNextNext == "hours":
@@ -1257,43 +1546,33 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 minOffset = 2
             elif wordNextNext == "seconds":
                 secOffset = 2
-        # parse in a/next second/minute/hour
-        elif wordNext == "hour" and word in future_markers + future_1st_markers:
-            used += 2
-            hrOffset = 1
-        elif wordNext == "minute" and word in future_markers + future_1st_markers:
-            used += 2
-            minOffset = 1
-        elif wordNext == "second" and word in future_markers + future_1st_markers:
+        # parse in a/next/last/past second/minute/hour
+        elif (kind == _FUTURE or kind == _PAST) and \
+                wordNext in ("hour", "minute", "second"):
             used += 2
-            secOffset = 1
-        # parse last/past  second/minute/hour
-        elif wordNext == "hour" and word in past_markers:
-            used += 2
-            hrOffset = - 1
-        elif wordNext == "minute" and word in past_markers:
-            used += 2
-            minOffset = - 1
-        elif wordNext == "second" and word in past_markers:
-            used += 2
-            secOffset = - 1
+            if wordNext == "hour":
+                hrOffset = value
+            elif wordNext == "minute":
+                minOffset = value
+            else:
+                secOffset = value
         # parse half an hour, quarter hour
-        elif word == "hour" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+        elif kind == _UNIT and \
+                (wordPrev in _DATETIME_MARKERS_EN or wordPrevPrev in _DATETIME_MARKERS_EN):
             if wordPrev == "half":
                 minOffset = 30
             elif wordPrev == "quarter":
                 minOffset = 15
             elif wordPrevPrev == "quarter":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in markers:
+                if idx > 2 and words[idx - 3] in _DATETIME_MARKERS_EN:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             elif wordPrev == "within":
                 hrOffset = 1
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
@@ -1396,7 +1675,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         if timeQualifier != "":
                             military = True
                             if strHH and int(strHH) <= 12 and \
-                                    (timeQualifier in timeQualifiersPM):
+                                    (timeQualifier in _PM_QUALIFIERS_EN):
                                 strHH += str(int(strHH) + 12)
 
             else:
@@ -1430,9 +1709,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_EN or
+                        wordNext in _RECUR_MARKERS_EN or
+                        wordNextNext in _RECUR_MARKERS_EN):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1455,7 +1734,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                             (wordNext == "hours" or wordNext == "hour" or
                              remainder == "hours" or remainder == "hour") and
                             word[0] != '0' and
-                            (int(strNum) < 100 or int(strNum) > 2400 or wordPrev in past_markers)):
+                            (int(strNum) < 100 or int(strNum) > 2400 or wordPrev in _PAST_MARKERS_EN)):
                         # ignores military time
                         # "in 3 hours"
                         hrOffset = int(strNum)
@@ -1464,7 +1743,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N hours
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             hrOffset = hrOffset * -1
@@ -1478,7 +1757,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N minutes
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             minOffset = minOffset * -1
@@ -1491,7 +1770,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N seconds
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             secOffset = secOffset * -1
@@ -1531,21 +1810,21 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                             if (wordNextNext and
                                     (wordNextNext in timeQualifier or
                                      wordNextNextNext in timeQualifier)):
-                                if (wordNextNext in timeQualifiersPM or
-                                        wordNextNextNext in timeQualifiersPM):
+                                if (wordNextNext in _PM_QUALIFIERS_EN or
+                                        wordNextNextNext in _PM_QUALIFIERS_EN):
                                     remainder = "pm"
                                     used += 1
-                                if (wordNextNext in timeQualifiersAM or
-                                        wordNextNextNext in timeQualifiersAM):
+                                if (wordNextNext in _AM_QUALIFIERS_EN or
+                                        wordNextNextNext in _AM_QUALIFIERS_EN):
                                     remainder = "am"
                                     used += 1
 
                         if timeQualifier != "":
-                            if timeQualifier in timeQualifiersPM:
+                            if timeQualifier in _PM_QUALIFIERS_EN:
                                 remainder = "pm"
                                 used += 1
 
-                            elif timeQualifier in timeQualifiersAM:
+                            elif timeQualifier in _AM_QUALIFIERS_EN:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1577,7 +1856,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     # has passed, assume the next morning
                     dayOffset += 1
 
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _PM_QUALIFIERS_EN and HH < 12:
                 HH += 12
 
             if HH > 24 or MM > 59:
@@ -1606,11 +1885,11 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_EN:
                 words[idx - 1] = ""
                 if wordPrev == "this":
                     daySpecified = True
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
@@ -1618,99 +1897,17 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             idx += used - 1
             found = True
 
+    mark("offsets")
+    resolution = DatetimeResolution(
+        datestr, hasYear, daySpecified, yearOffset, monthOffset, dayOffset,
+        hrOffset, minOffset, secOffset, hrAbs, minAbs)
     # check that we found a date
-    if not date_found():
+    if not found and not resolution.found():
         return None
+    extractedDate = resolution.resolve(anchorDate, default_time)
 
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = anchorDate.replace(microsecond=0)
-
-    if datestr != "":
-        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            try:
-                temp = datetime.strptime(datestr, "%B %d %Y")
-            except ValueError:
-                # Try again, without day
-                try:
-                    temp = datetime.strptime(datestr, "%B %Y")
-                except ValueError:
-                    # Try again, with only month
-                    temp = datetime.strptime(datestr, "%B")
-        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year,
-                                tzinfo=extractedDate.tzinfo)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
-                tzinfo=extractedDate.tzinfo)
-    else:
-        # ignore the current HH:MM:SS if relative using days or greater
-        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
-            extractedDate = extractedDate.replace(hour=default_time.hour,
-                                                  minute=default_time.minute,
-                                                  second=default_time.second)
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-
-
-    if hrAbs != -1 and minAbs != -1 and not hrOffset and not minOffset and not secOffset:
-        # If no time was supplied in the string set the time to default
-        # time if it's available
-        if hrAbs is None and minAbs is None and default_time is not None:
-            hrAbs, minAbs = default_time.hour, default_time.minute
-        else:
-            hrAbs = hrAbs or 0
-            minAbs = minAbs or 0
-
-        extractedDate = extractedDate.replace(hour=hrAbs,
-                                              minute=minAbs)
-
-        if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and anchorDate > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-
-    for idx, word in enumerate(words):
-        if words[idx] == "and" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+    mark("remainder", words)
+    return [extractedDate, datetime_remainder(words, _DATETIME_JOINERS_EN)]
 
 
 def is_fractional_en(input_str, short_scale=True, spoken=True):
@@ -1762,6 +1959,40 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
     return [float(result.value) for result in results]
 
 
+def extract_number_spans_en(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts every number with its position.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: list of NumberSpan(value, start, end, is_ordinal) tuples
+    """
+    # same tokens as tokenize(text), token indices map back to char spans
+    spans = span_indexed_word_tokenize(text)
+    tokens = [Token(word, idx) for idx, (_, _, word) in enumerate(spans)]
+    ordinal_words = _initialize_number_data_en(short_scale, speech=True)[1]
+    results = []
+    for number in _extract_numbers_with_text_en(tokens, short_scale,
+                                                ordinals):
+        indices = [token.index for token in number.tokens]
+        first, last = min(indices), max(indices)
+        words = [spans[idx][2].lower() for idx in indices]
+        is_ordinal = any(
+            bool(ordinals) and word in ordinal_words or
+            is_numeric(word[:-2]) and word[-2:] in ("st", "nd", "rd", "th")
+            for word in words)
+        results.append(NumberSpan(number.value, spans[first][0],
+                                  spans[last][1], is_ordinal))
+    results.sort(key=lambda number: number.start)
+    return results
+
+
 class EnglishNormalizer(Normalizer):
     with open(resolve_resource_file("text/en-us/normalize.json")) as f:
         _default_config = json.load(f)
@@ -1772,4 +2003,4 @@ class EnglishNormalizer(Normalizer):
 
 def normalize_en(text, remove_articles=True):
     """ English string normalization """
-    return EnglishNormalizer().normalize(text, remove_articles)
+    return get_normalizer(EnglishNormalizer).normalize(text, remove_articles)
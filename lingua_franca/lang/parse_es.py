@@ -13,8 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local, DAYS_IN_1_MONTH, DAYS_IN_1_YEAR
 from lingua_franca.lang.format_es import pronounce_number_es
@@ -190,82 +188,14 @@ def extract_number_es(text, short_scale=True, ordinals=False):
     return result or False
 
 
-def _es_number_parse(words, i):
-    # TODO Not parsing 'cero'
-
-    def es_cte(i, s):
-        if i < len(words) and s == words[i]:
-            return s, i + 1
-        return None
-
-    def es_number_word(i, mi, ma):
-        if i < len(words):
-            v = _STRING_NUM_ES.get(words[i])
-            if v and v >= mi and v <= ma:
-                return v, i + 1
-        return None
-
-    def es_number_1_99(i):
-        r1 = es_number_word(i, 1, 29)
-        if r1:
-            return r1
-
-        r1 = es_number_word(i, 30, 90)
-        if r1:
-            v1, i1 = r1
-            r2 = es_cte(i1, "y")
-            if r2:
-                i2 = r2[1]
-                r3 = es_number_word(i2, 1, 9)
-                if r3:
-                    v3, i3 = r3
-                    return v1 + v3, i3
-            return r1
-        return None
+# TODO Not parsing 'cero'
+_NUMBER_GRAMMAR_ES = NumberGrammar(
+    {word: value for word, value in _STRING_NUM_ES.items() if value},
+    first_ten=30, connectors=("y",), scales={"mil": 1000})
 
-    def es_number_1_999(i):
-        # [2-9]cientos [1-99]?
-        r1 = es_number_word(i, 100, 900)
-        if r1:
-            v1, i1 = r1
-            r2 = es_number_1_99(i1)
-            if r2:
-                v2, i2 = r2
-                return v1 + v2, i2
-            else:
-                return r1
-
-        # [1-99]
-        r1 = es_number_1_99(i)
-        if r1:
-            return r1
-
-        return None
-
-    def es_number(i):
-        # check for cero
-        r1 = es_number_word(i, 0, 0)
-        if r1:
-            return r1
-
-        # check for [1-999] (mil [0-999])?
-        r1 = es_number_1_999(i)
-        if r1:
-            v1, i1 = r1
-            r2 = es_cte(i1, "mil")
-            if r2:
-                i2 = r2[1]
-                r3 = es_number_1_999(i2)
-                if r3:
-                    v3, i3 = r3
-                    return v1 * 1000 + v3, i3
-                else:
-                    return v1 * 1000, i2
-            else:
-                return r1
-        return None
 
-    return es_number(i)
+def _es_number_parse(words, i):
+    return _NUMBER_GRAMMAR_ES.parse(words, i)
 
 
 def extract_numbers_es(text, short_scale=True, ordinals=False):
@@ -355,16 +285,6 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
         s = s.replace("meses", "mes").replace("anteriores", "anterior")
         return s
 
-    def date_found():
-        return found or \
-            (
-                datestr != "" or
-                yearOffset != 0 or monthOffset != 0 or
-                dayOffset is True or hrOffset != 0 or
-                hrAbs or minOffset != 0 or
-                minAbs or secOffset != 0
-            )
-
     if text == "":
         return None
     if anchorDate is None:
@@ -994,20 +914,6 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
             idx += used - 1
             found = True
 
-    # check that we found a date
-    if not date_found():
-        return None
-
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = dateNow
-    extractedDate = extractedDate.replace(microsecond=0,
-                                          second=0,
-                                          minute=0,
-                                          hour=0)
     if datestr != "":
         en_months = ['january', 'february', 'march', 'april', 'may', 'june',
                      'july', 'august', 'september', 'october', 'november',
@@ -1019,58 +925,31 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
             datestr = datestr.replace(months[idx], en_month)
         for idx, en_month in enumerate(en_monthsShort):
             datestr = datestr.replace(monthsShort[idx], en_month)
-
-        temp = datetime.strptime(datestr, "%B %d")
-        if extractedDate.tzinfo:
-            temp = temp.replace(tzinfo=extractedDate.tzinfo)
-
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year)
-
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-
-    if hrAbs is None and minAbs is None and default_time:
-        hrAbs = default_time.hour
-        minAbs = default_time.minute
-
-    if hrAbs != -1 and minAbs != -1:
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
-        if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    # resultStr = pt_pruning(resultStr)
-    return [extractedDate, resultStr]
+    resolution = DatetimeResolution(
+        datestr, hasYear, daySpecified, yearOffset, monthOffset, dayOffset,
+        hrOffset, minOffset, secOffset, hrAbs, minAbs)
+    # check that we found a date
+    if not found and not resolution.found():
+        return None
+    extractedDate = resolution.resolve(dateNow, default_time,
+                                       from_midnight=True)
+    return [extractedDate, datetime_remainder(words)]
+
+
+_DURATION_GRAMMAR_ES = DurationGrammar(
+    [('microsegundo', 'microseconds', 1),
+     ('milisegundo', 'milliseconds', 1),
+     ('segundo', 'seconds', 1),
+     ('minuto', 'minutes', 1),
+     ('hora', 'hours', 1),
+     ('dia', 'days', 1),
+     ('semana', 'weeks', 1),
+     ('me', 'days', DAYS_IN_1_MONTH),
+     ('ano', 'days', DAYS_IN_1_YEAR),
+     ('decada', 'days', 10 * DAYS_IN_1_YEAR),
+     ('siglo', 'days', 100 * DAYS_IN_1_YEAR),
+     ('milenio', 'days', 1000 * DAYS_IN_1_YEAR)],
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?")
 
 
 def extract_duration_es(text):
@@ -1097,65 +976,9 @@ def extract_duration_es(text):
         return None
 
     text = text.lower().replace("í", "i")
-    time_units = {
-        'microseconds': 'microsegundos',
-        'milliseconds': 'milisegundos',
-        'seconds': 'segundos',
-        'minutes': 'minutos',
-        'hours': 'horas',
-        'days': 'dias',
-        'weeks': 'semanas'
-    }
-    # NOTE: some of these english units are spelled wrong on purpose because of the loop below that strips the s
-    non_std_un = {
-        "months": "mes",
-        "years": "anos",
-        'decades': "decadas",
-        'centurys': "siglos",
-        'millenniums': "milenios"
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
-
     text = text.replace("í", "i").replace("é", "e").replace("ñ", "n").replace("meses", "mes")
-    text = SpanishNormalizer().numbers_to_digits(text)
-
-    for (unit_en, unit_es) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_es[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    for (unit_en, unit_es) in non_std_un.items():
-        unit_pattern = pattern.format(
-            unit=unit_es[:-1])  # remove 's' from unit
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        text = re.sub(unit_pattern, repl_non_std, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    text = get_normalizer(SpanishNormalizer).numbers_to_digits(text)
+    return _DURATION_GRAMMAR_ES.extract_duration(text)
 
 
 def get_gender_es(word, context=""):
@@ -13,18 +13,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import re
 from dateutil.tz import gettz
-from datetime import datetime, timedelta
+from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, DurationGrammar
 from lingua_franca.lang.format_fr import pronounce_number_fr
 from lingua_franca.lang.common_data_fr import _ARTICLES_FR, _NUMBERS_FR, \
     _ORDINAL_ENDINGS_FR
 from lingua_franca.time import now_local
 
 
+_DURATION_GRAMMAR_FR = DurationGrammar(
+    [('microseconde', 'microseconds', 1),
+     ('milliseconde', 'milliseconds', 1),
+     ('seconde', 'seconds', 1),
+     ('minute', 'minutes', 1),
+     ('heure', 'hours', 1),
+     ('jour', 'days', 1),
+     ('semaine', 'weeks', 1)],
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?(\s+|,|$)")
+
+
 def extract_duration_fr(text):
     """
     Convert an french phrase into a number of seconds
@@ -50,31 +60,7 @@ def extract_duration_fr(text):
 
     text = normalize_fr(text)
 
-    time_units = {
-        'microseconds': 'microsecondes',
-        'milliseconds': 'millisecondes',
-        'seconds': 'secondes',
-        'minutes': 'minutes',
-        'hours': 'heures',
-        'days': 'jours',
-        'weeks': 'semaines'
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?(\s+|,|$)"
-
-    for (unit_en, unit_fr) in time_units.items():
-        unit_pattern = pattern.format(unit=unit_fr[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return _DURATION_GRAMMAR_FR.extract_duration(text)
 
 def _number_parse_fr(words, i):
     """ Parses a list of words to find a number
@@ -14,7 +14,7 @@
 # limitations under the License.
 #
 from lingua_franca.time import now_local
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, get_normalizer
 
 
 class HungarianNormalizer(Normalizer):
@@ -23,4 +23,4 @@ class HungarianNormalizer(Normalizer):
 
 def normalize_hu(text, remove_articles=True):
     """ English string normalization """
-    return HungarianNormalizer().normalize(text, remove_articles)
+    return get_normalizer(HungarianNormalizer).normalize(text, remove_articles)
@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 from dateutil.relativedelta import relativedelta
 
@@ -390,7 +391,7 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
     return val, number_words
 
 
-def _initialize_number_data_nl(short_scale):
+def _build_number_data_nl(short_scale):
     """Generate dictionaries of words to numbers, based on scale.
 
     This is a helper function for _extract_whole_number.
@@ -399,7 +400,7 @@ def _initialize_number_data_nl(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mapping(str, number), mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
     """
     multiplies = _MULTIPLIES_SHORT_SCALE_NL if short_scale \
@@ -411,7 +412,29 @@ def _initialize_number_data_nl(short_scale):
     string_num_scale_nl = _SHORT_SCALE_NL if short_scale else _LONG_SCALE_NL
     string_num_scale_nl = invert_dict(string_num_scale_nl)
 
-    return multiplies, string_num_ordinal_nl, string_num_scale_nl
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_nl), \
+        MappingProxyType(string_num_scale_nl)
+
+
+_NUMBER_DATA_NL = {short_scale: _build_number_data_nl(short_scale)
+                   for short_scale in (True, False)}
+
+
+def _initialize_number_data_nl(short_scale):
+    """
+    Get the read only dictionaries of words to numbers for a scale.
+
+    They are built once at import by _build_number_data_nl.
+
+    Args:
+        short_scale boolean:
+
+    Returns:
+        (frozenset(str), mapping(str, number), mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+
+    """
+    return _NUMBER_DATA_NL[bool(short_scale)]
 
 
 def extract_number_nl(text, short_scale=True, ordinals=False):
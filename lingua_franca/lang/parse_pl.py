@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 from dateutil.relativedelta import relativedelta
 
@@ -555,7 +556,7 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
     return val, number_words
 
 
-def _initialize_number_data(short_scale):
+def _build_number_data_pl(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
@@ -565,7 +566,7 @@ def _initialize_number_data(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mapping(str, number), mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -573,7 +574,29 @@ def _initialize_number_data(short_scale):
 
     string_num_scale = invert_dict(_SHORT_SCALE_PL)
     string_num_scale.update(generate_plurals_pl(string_num_scale))
-    return multiplies, _STRING_SHORT_ORDINAL_PL, string_num_scale
+    return frozenset(multiplies), MappingProxyType(_STRING_SHORT_ORDINAL_PL), \
+        MappingProxyType(string_num_scale)
+
+
+_NUMBER_DATA_PL = {short_scale: _build_number_data_pl(short_scale)
+                   for short_scale in (True, False)}
+
+
+def _initialize_number_data(short_scale):
+    """
+    Get the read only dictionaries of words to numbers for a scale.
+
+    They are built once at import by _build_number_data_pl.
+
+    Args:
+        short_scale boolean:
+
+    Returns:
+        (frozenset(str), mapping(str, number), mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+
+    """
+    return _NUMBER_DATA_PL[bool(short_scale)]
 
 
 def extract_number_pl(text, short_scale=True, ordinals=False):
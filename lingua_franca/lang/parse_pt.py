@@ -20,20 +20,20 @@
     TODO: date time pt
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, match_yes_or_no
+from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, match_yes_or_no, \
+    fold_unicode, DurationGrammar
 from lingua_franca.lang.common_data_pt import _NUMBERS_PT, \
     _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
     _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
 from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, get_normalizer
 from lingua_franca.time import now_local, DAYS_IN_1_MONTH, DAYS_IN_1_YEAR
 from lingua_franca.util.colors import Color, ColorOutOfSpace
 import json
 import re
 from quebra_frases import span_indexed_word_tokenize
-import unicodedata
 
 
 def get_color_pt(text):
@@ -185,9 +185,9 @@ def extract_color_spans_pt(text):
 def yes_or_no_pt(text):
     # normalization tricks so that "é" is removed and parser works with double negatives
     # eg. "its not a lie", "não é mentira" -> "nao e mentira" -> "nao mentira"
-    text = unicodedata.normalize('NFD', text) \
-        .encode('ascii', 'ignore').decode("utf-8")
-    text = PortugueseNormalizer().normalize(text, remove_articles=True)
+    text = fold_unicode(text)
+    text = get_normalizer(PortugueseNormalizer).normalize(
+        text, remove_articles=True)
     return match_yes_or_no(text, "pt-pt")
 
 
@@ -367,11 +367,11 @@ class PortugueseNormalizer(Normalizer):
         utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
         # Split things like #1
         utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
-        # Split things like amo-te
-        utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \2 \3",
+        # Split things like amo-te, all at once in chains like vinte-e-um
+        utterance = re.sub(r"([a-zA-Z]+)(-)(?=[a-zA-Z]+\b)", r"\1 \2 ",
                            utterance)
         tokens = utterance.split()
-        if tokens[-1] == '-':
+        while tokens and tokens[-1] == '-':
             tokens = tokens[:-1]
 
         return tokens
@@ -379,7 +379,8 @@ class PortugueseNormalizer(Normalizer):
 
 def normalize_pt(text, remove_articles=True):
     """ PT string normalization """
-    return PortugueseNormalizer().normalize(text, remove_articles)
+    normalizer = get_normalizer(PortugueseNormalizer)
+    return normalizer.normalize(text, remove_articles)
 
 
 def extract_datetime_pt(text, anchorDate=None, default_time=None):
@@ -1247,6 +1248,22 @@ def get_gender_pt(word, context=""):
     return None
 
 
+_DURATION_GRAMMAR_PT = DurationGrammar(
+    [('microsegundo', 'microseconds', 1),
+     ('milisegundo', 'milliseconds', 1),
+     ('segundo', 'seconds', 1),
+     ('minuto', 'minutes', 1),
+     ('hora', 'hours', 1),
+     ('dia', 'days', 1),
+     ('semana', 'weeks', 1),
+     ('mese', 'days', DAYS_IN_1_MONTH),
+     ('ano', 'days', DAYS_IN_1_YEAR),
+     ('decada', 'days', 10 * DAYS_IN_1_YEAR),
+     ('seculo', 'days', 100 * DAYS_IN_1_YEAR),
+     ('milenio', 'days', 1000 * DAYS_IN_1_YEAR)],
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?")
+
+
 def extract_duration_pt(text):
     """
     Convert an portuguese phrase into a number of seconds
@@ -1271,64 +1288,8 @@ def extract_duration_pt(text):
         return None
 
     text = text.lower()
-    time_units = {
-        'microseconds': 'microsegundos',
-        'milliseconds': 'milisegundos',
-        'seconds': 'segundos',
-        'minutes': 'minutos',
-        'hours': 'horas',
-        'days': 'dias',
-        'weeks': 'semanas'
-    }
-    # NOTE: some of these english units are spelled wrong on purpose because of the loop below that strips the s
-    non_std_un = {
-        "months": "meses",
-        "years": "anos",
-        'decades': "decadas",
-        'centurys': "seculos",
-        'millenniums': "milenios"
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
-
     text = text.replace("mês", "meses").replace("é", "e")
     text = text.replace("segundo", "_s_")  # HACK - segundo (second) will be replaced with 2
-    text = PortugueseNormalizer().numbers_to_digits(text)
+    text = get_normalizer(PortugueseNormalizer).numbers_to_digits(text)
     text = text.replace("_s_", "segundo")  # undo HACK
-
-    for (unit_en, unit_pt) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_pt[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    for (unit_en, unit_pt) in non_std_un.items():
-        unit_pattern = pattern.format(
-            unit=unit_pt[:-1])  # remove 's' from unit
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        text = re.sub(unit_pattern, repl_non_std, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return _DURATION_GRAMMAR_PT.extract_duration(text)
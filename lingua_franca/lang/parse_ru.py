@@ -13,21 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import MappingProxyType
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer, \
+    get_normalizer, DurationGrammar
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _LONG_ORDINAL_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, \
     _FRACTION_STRING_RU, _MONTHS_CONVERSION, _MONTHS_RU, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_RU
 
-import re
 import json
 from lingua_franca import resolve_resource_file
 from lingua_franca.time import now_local
+from lingua_franca.profile import traced, mark
 
 
 def generate_plurals_ru(originals):
@@ -128,6 +130,7 @@ _STRING_SHORT_ORDINAL_RU = invert_dict(_SHORT_ORDINAL_RU)
 _STRING_LONG_ORDINAL_RU = invert_dict(_LONG_ORDINAL_RU)
 
 
+@traced
 def _convert_words_to_numbers_ru(text, short_scale=True, ordinals=False):
     """
     Convert words in a string into their equivalent numbers.
@@ -584,7 +587,7 @@ def _extract_whole_number_with_text_ru(tokens, short_scale, ordinals):
     return val, number_words
 
 
-def _initialize_number_data(short_scale):
+def _build_number_data_ru(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
@@ -594,7 +597,7 @@ def _initialize_number_data(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mapping(str, number), mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -607,7 +610,29 @@ def _initialize_number_data(short_scale):
     string_num_scale_ru = _SHORT_SCALE_RU if short_scale else _LONG_SCALE_RU
     string_num_scale_ru = invert_dict(string_num_scale_ru)
     string_num_scale_ru.update(generate_plurals_ru(string_num_scale_ru))
-    return multiplies, string_num_ordinal_ru, string_num_scale_ru
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_ru), \
+        MappingProxyType(string_num_scale_ru)
+
+
+_NUMBER_DATA_RU = {short_scale: _build_number_data_ru(short_scale)
+                   for short_scale in (True, False)}
+
+
+def _initialize_number_data(short_scale):
+    """
+    Get the read only dictionaries of words to numbers for a scale.
+
+    They are built once at import by _build_number_data_ru.
+
+    Args:
+        short_scale boolean:
+
+    Returns:
+        (frozenset(str), mapping(str, number), mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+
+    """
+    return _NUMBER_DATA_RU[bool(short_scale)]
 
 
 def extract_number_ru(text, short_scale=True, ordinals=False):
@@ -630,6 +655,14 @@ def extract_number_ru(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# Russian inflection for time: минута, минуты, минут - safe to use минута as pattern
+# For day: день, дня, дней - short pattern not applicable, list all
+_DURATION_GRAMMAR_RU = DurationGrammar(
+    [(unit, unit_en, 1) for unit, unit_en in _TIME_UNITS_CONVERSION.items()],
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?")
+
+
+@traced
 def extract_duration_ru(text):
     """
     Convert an english phrase into a number of seconds
@@ -659,37 +692,12 @@ def extract_duration_ru(text):
     if not text:
         return None
 
-    # Russian inflection for time: минута, минуты, минут - safe to use минута as pattern
-    # For day: день, дня, дней - short pattern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?"
     text = _convert_words_to_numbers_ru(text)
-
-    for (unit_ru, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_ru)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return duration, text
+    mark("units")
+    return _DURATION_GRAMMAR_RU.extract_duration(text)
 
 
+@traced
 def extract_datetime_ru(text, anchor_date=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -817,9 +825,11 @@ def extract_datetime_ru(text, anchor_date=None, default_time=None):
                     'сен', 'окт', 'ноя', 'дек']
     year_multiples = ["десятилетие", "век", "тысячелетие"]
 
+    mark("clean", text)
     words = clean_string(text)
     preposition = ""
 
+    mark("date", words)
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -1066,6 +1076,7 @@ def extract_datetime_ru(text, anchor_date=None, default_time=None):
             found = True
             day_specified = True
 
+    mark("time", words)
     # parse time
     hr_offset = 0
     min_offset = 0
@@ -1473,6 +1484,7 @@ def extract_datetime_ru(text, anchor_date=None, default_time=None):
 
             idx += used - 1
             found = True
+    mark("offsets")
     # check that we found a date
     if not date_found():
         return None
@@ -1543,6 +1555,7 @@ def extract_datetime_ru(text, anchor_date=None, default_time=None):
         extracted_date = extracted_date + relativedelta(minutes=min_offset)
     if sec_offset != 0:
         extracted_date = extracted_date + relativedelta(seconds=sec_offset)
+    mark("remainder", words)
     for idx, word in enumerate(words):
         if words[idx] == "и" and \
                 words[idx - 1] == "" and words[idx + 1] == "":
@@ -1603,7 +1616,7 @@ class RussianNormalizer(Normalizer):
 
 def normalize_ru(text, remove_articles=True):
     """ Russian string normalization """
-    return RussianNormalizer().normalize(text, remove_articles)
+    return get_normalizer(RussianNormalizer).normalize(text, remove_articles)
 
 
 def _text_ru_inflection_normalize(word, arg):
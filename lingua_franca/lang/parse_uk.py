@@ -14,11 +14,13 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer, \
+    get_normalizer, DurationGrammar
 from lingua_franca.lang.common_data_uk import _NUM_STRING_UK, \
     _LONG_ORDINAL_UK, _LONG_SCALE_UK, _SHORT_SCALE_UK, _SHORT_ORDINAL_UK, \
     _FRACTION_STRING_UK, _MONTHS_CONVERSION, _MONTHS_UK, _TIME_UNITS_CONVERSION, \
@@ -28,6 +30,7 @@ import re
 import json
 from lingua_franca import resolve_resource_file
 from lingua_franca.time import now_local
+from lingua_franca.profile import traced, mark
 
 
 def generate_plurals_uk(originals):
@@ -129,6 +132,7 @@ _STRING_SHORT_ORDINAL_UK = invert_dict(_SHORT_ORDINAL_UK)
 _STRING_LONG_ORDINAL_UK = invert_dict(_LONG_ORDINAL_UK)
 
 
+@traced
 def _convert_words_to_numbers_uk(text, short_scale=True, ordinals=False):
     """
     Convert words in a string into their equivalent numbers.
@@ -460,7 +464,6 @@ def _extract_whole_number_with_text_uk(tokens, short_scale, ordinals):
             val = prev_val + val
 
         # is the prev word a number and should we multiply it?
-        multiplies.update({"тисячa", "тисячі", "тисячу", "тисячах", "тисячaми", "тисячею", "тисяч"})
         if word in multiplies:
             if not prev_val:
                 prev_val = 1
@@ -591,7 +594,7 @@ def _extract_whole_number_with_text_uk(tokens, short_scale, ordinals):
     return val, number_words
 
 
-def _initialize_number_data(short_scale):
+def _build_number_data_uk(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
@@ -601,12 +604,14 @@ def _initialize_number_data(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mapping(str, number), mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
     multiplies = _MULTIPLIES_SHORT_SCALE_UK if short_scale \
         else _MULTIPLIES_LONG_SCALE_UK
+    multiplies = multiplies | {"тисячa", "тисячі", "тисячу", "тисячах",
+                               "тисячaми", "тисячею", "тисяч"}
 
     string_num_ordinal_uk = _STRING_SHORT_ORDINAL_UK if short_scale \
         else _STRING_LONG_ORDINAL_UK
@@ -614,7 +619,29 @@ def _initialize_number_data(short_scale):
     string_num_scale_uk = _SHORT_SCALE_UK if short_scale else _LONG_SCALE_UK
     string_num_scale_uk = invert_dict(string_num_scale_uk)
     string_num_scale_uk.update(generate_plurals_uk(string_num_scale_uk))
-    return multiplies, string_num_ordinal_uk, string_num_scale_uk
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_uk), \
+        MappingProxyType(string_num_scale_uk)
+
+
+_NUMBER_DATA_UK = {short_scale: _build_number_data_uk(short_scale)
+                   for short_scale in (True, False)}
+
+
+def _initialize_number_data(short_scale):
+    """
+    Get the read only dictionaries of words to numbers for a scale.
+
+    They are built once at import by _build_number_data_uk.
+
+    Args:
+        short_scale boolean:
+
+    Returns:
+        (frozenset(str), mapping(str, number), mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+
+    """
+    return _NUMBER_DATA_UK[bool(short_scale)]
 
 
 def extract_number_uk(text, short_scale=True, ordinals=False):
@@ -637,6 +664,14 @@ def extract_number_uk(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# Ukrainian inflection for time: хвилина, хвилини, хвилин - safe to use хвилина as pattern
+# For day: день, дня, днів - short pattern not applicable, list all
+_DURATION_GRAMMAR_UK = DurationGrammar(
+    [(unit, unit_en, 1) for unit, unit_en in _TIME_UNITS_CONVERSION.items()],
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:ів|я|и|ин|і|унд|ни|ну|ку|дні|у|днів)?")
+
+
+@traced
 def extract_duration_uk(text):
     """
     Convert an english phrase into a number of seconds
@@ -666,29 +701,9 @@ def extract_duration_uk(text):
     if not text:
         return None
 
-    # Ukrainian inflection for time: хвилина, хвилини, хвилин - safe to use хвилина as pattern
-    # For day: день, дня, днів - short pattern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:ів|я|и|ин|і|унд|ни|ну|ку|дні|у|днів)?"
     text = _convert_words_to_numbers_uk(text)
-
-    for (unit_uk, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_uk)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    mark("units")
+    time_units, text, _ = _DURATION_GRAMMAR_UK.parse(text)
 
     new_text = []
     tokens_in_result_text = text.split(' ')
@@ -701,6 +716,7 @@ def extract_duration_uk(text):
     return duration, text
 
 
+@traced
 def extract_datetime_uk(text, anchor_date=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -829,9 +845,11 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
     year_multiples = ["десятиліття", "століття", "тисячоліття", "тисячоліть", "століть",
                         "сторіччя", "сторіч"]
 
+    mark("clean", text)
     words = clean_string(text)
     preposition = ""
 
+    mark("date", words)
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -1088,6 +1106,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
             found = True
             day_specified = True
 
+    mark("time", words)
     # parse time
     hr_offset = 0
     min_offset = 0
@@ -1506,6 +1525,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
 
             idx += used - 1
             found = True
+    mark("offsets")
     # check that we found a date
     if not date_found():
         return None
@@ -1576,6 +1596,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
         extracted_date = extracted_date + relativedelta(minutes=min_offset)
     if sec_offset != 0:
         extracted_date = extracted_date + relativedelta(seconds=sec_offset)
+    mark("remainder", words)
     for idx, word in enumerate(words):
         if words[idx] == "і" and \
                 words[idx - 1] == "" and words[idx + 1] == "":
@@ -1649,7 +1670,7 @@ class UkrainianNormalizer(Normalizer):
 
 def normalize_uk(text, remove_articles=True):
     """ Ukrainian string normalization """
-    return UkrainianNormalizer().normalize(text, remove_articles)
+    return get_normalizer(UkrainianNormalizer).normalize(text, remove_articles)
 
 
 def _text_uk_inflection_normalize(word, arg):
@@ -14,20 +14,42 @@
 # limitations under the License.
 #
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
 
 from quebra_frases import span_indexed_word_tokenize
 
 from lingua_franca.internal import populate_localized_function_dict, \
     get_active_langs, localized_function, UnsupportedLanguageError, \
-    resolve_resource_file, FunctionNotLocalizedError, get_full_lang_code
-from lingua_franca.lang.parse_common import match_yes_or_no
-from lingua_franca.util import match_one, fuzzy_match, MatchStrategy
+    resolve_resource_file, FunctionNotLocalizedError, get_full_lang_code, \
+    load_language
+from lingua_franca import config
+from lingua_franca.lang.parse_common import match_yes_or_no, \
+    extract_number_spans_generic, DatetimeProgram
+from lingua_franca.time import now_local, to_local
+from lingua_franca.util import match_one, fuzzy_match
 from lingua_franca.util.colors import Color, ColorOutOfSpace
+from lingua_franca.util.langs import get_language_names
+
+# match_one and fuzzy_match are re-exported from lingua_franca.util
+__all__ = ["match_one", "fuzzy_match", "get_color", "extract_color_spans",
+           "yes_or_no", "extract_langcode", "extract_numbers",
+           "extract_number_spans", "extract_number", "extract_duration",
+           "extract_durations", "extract_datetime", "extract_datetimes",
+           "datetime_stream", "compile_datetime", "extract_datetime_batch",
+           "normalize", "normalize_stream", "normalize_file", "get_gender",
+           "is_fractional", "is_ordinal"]
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
+                         "extract_number_spans",
                          "extract_number",
                          "extract_duration",
+                         "extract_durations",
                          "extract_datetime",
+                         "compile_datetime",
+                         "extract_datetimes",
+                         "datetime_stream",
                          "extract_langcode",
                          "normalize",
                          "get_gender",
@@ -117,7 +139,7 @@ def extract_color_spans(text, lang=''):
     return color_spans
 
 
-@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[FunctionNotLocalizedError], pure=True)
 def yes_or_no(text, lang=""):
     text = normalize(text, lang=lang, remove_articles=True).lower()
     return match_yes_or_no(text, lang)
@@ -125,23 +147,24 @@ def yes_or_no(text, lang=""):
 
 # TODO - variant kwarg - ISO 639-2 vs ISO 639-1
 @localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
-def extract_langcode(text, lang=""):
+def extract_langcode(text, lang="", score_cutoff=0.0):
+    """
+        Find the language code for a spoken language name
+
+        Args:
+            text (str): the spoken language name, e.g. "portuguese"
+            lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+            score_cutoff (float, optional): minimum fuzzy match confidence
+        Returns:
+            (tuple): (lang_code, confidence), (None, 0.0) if no language
+                     name matched with at least score_cutoff confidence
+    """
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/langs.json") or \
-                    resolve_resource_file("text/en-us/langs.json")
-    LANGUAGES = {}
-    with open(resource_file) as f:
-        for k, v in json.load(f).items():
-            if isinstance(v, str):
-                v = [v]
-            # list of spoken names for this language
-            # multiple valid spellings may exist
-            for l in v:
-                LANGUAGES[l] = k
-    return match_one(text, LANGUAGES, strategy=MatchStrategy.TOKEN_SET_RATIO)
+    return get_language_names(lang).match(text, score_cutoff)
 
 
-@localized_function()
+@localized_function(pure=True)
 def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
     """
         Takes in a string and extracts a list of numbers.
@@ -160,7 +183,32 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
-@localized_function()
+@localized_function(run_own_code_on=[FunctionNotLocalizedError], pure=True)
+def extract_number_spans(text, short_scale=True, ordinals=False, lang=''):
+    """
+        Takes in a string and extracts every number with its position.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+    Returns:
+        list: list of NumberSpan(value, start, end, is_ordinal) tuples, in
+              order of appearance, text[start:end] is the matched number
+    """
+    def extract_handler(utterance, short_scale, ordinals):
+        return extract_number(utterance, short_scale, ordinals, lang=lang)
+
+    return extract_number_spans_generic(text, extract_handler,
+                                        short_scale, ordinals)
+
+
+@localized_function(pure=True)
 def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """Takes in a string and extracts a number.
 
@@ -179,7 +227,7 @@ def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
-@localized_function()
+@localized_function(pure=True)
 def extract_duration(text, lang=''):
     """ Convert an english phrase into a number of seconds
 
@@ -211,7 +259,28 @@ def extract_duration(text, lang=''):
     """
 
 
-@localized_function()
+@localized_function(pure=True)
+def extract_durations(text, lang=''):
+    """
+    Extracts every duration of a text with its position.
+
+    Unlike extract_duration, which merges every duration into one total,
+    each duration is kept on its own, e.g. "remind me in 5 minutes and
+    again in 2 hours" gives 5 minutes and 2 hours.  Units only separated
+    by commas or "and" are one duration, as in "3 hours and 10 minutes".
+
+    Args:
+        text (str): string containing durations
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+
+    Returns:
+        list: DurationSpan(duration, start, end) tuples, in order of
+              appearance, text[start:end] is the matched duration
+    """
+
+
+@localized_function(pure=True, clock_params=("anchorDate",))
 def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
     Extracts date and time information from a sentence.  Parses many of the
@@ -265,7 +334,153 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
+@localized_function(pure=True, clock_params=("anchorDate",))
+def extract_datetimes(text, anchorDate=None, lang='', default_time=None):
+    """
+    Extracts every date and time expression from a text in one pass.
+
+    Unlike extract_datetime, which returns the first datetime and the
+    leftover text, this finds all of them with their position, e.g.
+    "from monday at 9 until friday at 5" gives two datetimes.
+
+    Args:
+        text (str): the text to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating (for example, what does "tomorrow" mean?).
+            Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+
+    Returns:
+        list: DatetimeSpan(datetime, start, end, text) tuples, in order of
+              appearance, text[start:end] is the matched expression
+    """
+
+
 @localized_function()
+def datetime_stream(anchorDate=None, lang='', default_time=None):
+    """
+    Incremental extract_datetimes for an utterance that keeps growing, e.g.
+    the partial hypotheses of streaming speech recognition.
+
+    Only the new words and the clause they belong to are parsed on each
+    update, instead of the whole utterance.
+
+        >>> stream = datetime_stream(datetime(2017, 6, 27, 13, 4))
+        >>> stream.feed("set an alarm for")
+        >>> stream.feed("seven thirty tomorrow")
+        >>> stream.result()
+        [DatetimeSpan(datetime=..., start=13, end=38,
+                      text='for seven thirty tomorrow')]
+
+    Args:
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating (for example, what does "tomorrow" mean?).
+            Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+
+    Returns:
+        DatetimeStream: stream.feed(words) appends words, stream.update(text)
+            replaces a revised hypothesis and stream.result() returns the
+            same as extract_datetimes(stream.text)
+    """
+
+
+@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+def compile_datetime(text, lang=''):
+    """
+    Compile a date and time expression once, to resolve it against any anchor
+
+    Parsing work that doesn't depend on the reference date is done once and
+    cached by text, so repeated phrases like "tomorrow at 5 pm" skip it.
+    Languages without a compiler fall back to extract_datetime on resolve.
+
+    Args:
+        text (str): the text to be interpreted
+        lang (str): the BCP-47 code for the language to use, None uses default
+
+    Returns:
+        DatetimeProgram: program.resolve(anchorDate, default_time) returns
+            the same as extract_datetime(text, anchorDate, lang, default_time)
+
+    Examples:
+
+        >>> program = compile_datetime("tomorrow at 5 pm")
+        >>> program.resolve(datetime(2017, 6, 30, 00, 00))
+        [datetime.datetime(2017, 7, 1, 17, 0), '']
+    """
+    def resolver(words, anchorDate=None, default_time=None):
+        return extract_datetime(" ".join(words), anchorDate, lang,
+                                default_time)
+
+    def compiler(text):
+        return DatetimeProgram(text, tuple(text.split()), resolver, compiler)
+
+    return compiler(text)
+
+
+def _extract_datetime_chunk(texts, anchorDate, lang, default_time):
+    program = compile_datetime(texts[0], lang)
+    return [program.compile(text).resolve(anchorDate, default_time)
+            for text in texts]
+
+
+def extract_datetime_batch(texts, anchorDate=None, lang='', default_time=None,
+                           workers=None):
+    """Extract a datetime from each of many texts sharing the same anchor
+
+    The language and the anchor are resolved once for the whole batch,
+    identical texts are only parsed once, and each worker process loads the
+    language once. When anchorDate is omitted every text is resolved against
+    the same current time.
+
+    Args:
+        texts (iterable): the strings to extract datetimes from
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating (for example, what does "tomorrow" mean?).
+            Defaults to the current local date/time.
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+        workers (int): number of worker processes, None or 1 parses in the
+                       calling process
+
+    Returns:
+        (list): extract_datetime's result for every text, in input order
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    lang = get_full_lang_code(lang)
+    anchorDate = anchorDate or now_local()
+    if config.inject_timezones and anchorDate.tzinfo is None:
+        anchorDate = to_local(anchorDate)
+    unique = list(dict.fromkeys(texts))
+
+    if not workers or workers <= 1:
+        results = _extract_datetime_chunk(unique, anchorDate, lang,
+                                          default_time)
+    else:
+        chunk_size = -(-len(unique) // (workers * 4))
+        chunks = [unique[i:i + chunk_size]
+                  for i in range(0, len(unique), chunk_size)]
+        with ProcessPoolExecutor(workers, initializer=load_language,
+                                 initargs=(lang,)) as executor:
+            results = [result for chunk in executor.map(
+                _extract_datetime_chunk, chunks, repeat(anchorDate),
+                repeat(lang), repeat(default_time)) for result in chunk]
+
+    # callers may mutate the lists they get back
+    extracted = dict(zip(unique, results))
+    return [list(extracted[text]) if extracted[text] else None
+            for text in texts]
+
+
+@localized_function(pure=True)
 def normalize(text, lang='', remove_articles=True):
     """Prepare a string for parsing
 
@@ -284,7 +499,89 @@ def normalize(text, lang='', remove_articles=True):
     """
 
 
-@localized_function()
+def _normalize_chunk(texts, lang, remove_articles):
+    return [normalize(text, lang, remove_articles) for text in texts]
+
+
+def normalize_stream(texts, lang='', remove_articles=True, workers=1,
+                     chunk_size=1000):
+    """Normalize an iterable of strings, optionally in several processes
+
+    Strings are consumed lazily in chunks of chunk_size, at most two
+    chunks per worker are in flight at any time so memory stays bounded
+    for arbitrarily large inputs. Each worker process loads the language
+    once.
+
+    Args:
+        texts (iterable): the strings to normalize
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        remove_articles (bool): whether to remove articles (like 'a', or
+                                'the'). True by default.
+        workers (int): number of worker processes, 1 normalizes in the
+                       calling process
+        chunk_size (int): number of strings sent to a worker at once
+
+    Returns:
+        (generator): the normalized strings, in input order
+    """
+    lang = get_full_lang_code(lang)
+    texts = iter(texts)
+    chunks = iter(lambda: list(islice(texts, chunk_size)), [])
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _normalize_chunk(chunk, lang, remove_articles)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=load_language,
+                             initargs=(lang,)) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_normalize_chunk, chunk,
+                                               lang, remove_articles))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # the consumer stopped early, don't wait for unwanted chunks
+            for future in pending:
+                future.cancel()
+
+
+def normalize_file(input_path, output_path, lang='', remove_articles=True,
+                   workers=1, chunk_size=1000, encoding="utf-8"):
+    """Normalize a text file line by line into another file
+
+    Args:
+        input_path (str): file to read, one utterance per line
+        output_path (str): file to write the normalized lines to
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        remove_articles (bool): whether to remove articles (like 'a', or
+                                'the'). True by default.
+        workers (int): number of worker processes, 1 normalizes in the
+                       calling process
+        chunk_size (int): number of lines sent to a worker at once
+        encoding (str): encoding of both files
+
+    Returns:
+        (int): number of lines written
+    """
+    count = 0
+    with open(input_path, encoding=encoding) as src, \
+            open(output_path, "w", encoding=encoding) as dst:
+        lines = (line.rstrip("\r\n") for line in src)
+        normalized = normalize_stream(lines, lang, remove_articles,
+                                      workers, chunk_size)
+        for chunk in iter(lambda: list(islice(normalized, chunk_size)), []):
+            dst.write("\n".join(chunk) + "\n")
+            count += len(chunk)
+    return count
+
+
+@localized_function(pure=True)
 def get_gender(word, context="", lang=''):
     """ Guess the gender of a word
 
@@ -303,7 +600,7 @@ def get_gender(word, context="", lang=''):
     """
 
 
-@localized_function()
+@localized_function(pure=True)
 def is_fractional(input_str, short_scale=True, lang=''):
     """
     This function takes the given text and checks if it is a fraction.
@@ -322,7 +619,7 @@ def is_fractional(input_str, short_scale=True, lang=''):
     """
 
 
-@localized_function()
+@localized_function(pure=True)
 def is_ordinal(input_str, lang=''):
     """
     This function takes the given text and checks if it is an ordinal number.
@@ -0,0 +1,210 @@
+"""
+Opt-in tracing of the stages of datetime and duration extraction
+
+    >>> from lingua_franca.profile import profile
+    >>> with profile() as trace:
+    ...     extract_datetime("next tuesday at 4pm", lang="en")
+    >>> trace.records
+    [StageRecord(stack=('extract_datetime_en', ...), seconds=..., tokens=4)]
+    >>> trace.write_collapsed("datetime.folded")
+
+Parsers declare their stages with the traced decorator, the stage context
+manager and mark, which all do nothing unless a profile is active in the
+calling thread.
+"""
+import threading
+from collections import defaultdict, namedtuple
+from functools import wraps
+from time import perf_counter
+
+# stack: names of the enclosing stages, outermost first
+# seconds: wall time of the stage, including its sub stages
+# tokens: number of tokens the stage worked on, None if unknown
+StageRecord = namedtuple('StageRecord', 'stack seconds tokens')
+
+_local = threading.local()
+
+
+def _count(tokens):
+    if tokens is None or isinstance(tokens, int):
+        return tokens
+    if isinstance(tokens, str):
+        return len(tokens.split())
+    try:
+        return len(tokens)
+    except TypeError:
+        return None
+
+
+class Profile:
+    """ Stage records of the extractions run while the profile is active """
+
+    def __init__(self):
+        self.records = []
+        # open frames, [name, start time, tokens, is a mark]
+        self._stack = []
+
+    def __enter__(self):
+        _local.profiles = getattr(_local, "profiles", ()) + (self,)
+        return self
+
+    def __exit__(self, *exc):
+        while self._stack:
+            self._close()
+        _local.profiles = tuple(p for p in _local.profiles if p is not self)
+
+    def _open(self, name, tokens, is_mark=False):
+        self._stack.append([name, perf_counter(), tokens, is_mark])
+
+    def _close(self):
+        stack = tuple(frame[0] for frame in self._stack)
+        _, start, tokens, _ = self._stack.pop()
+        self.records.append(
+            StageRecord(stack, perf_counter() - start, tokens))
+
+    def _end(self, name):
+        # close the marks left open inside the stage, then the stage
+        while self._stack and self._stack[-1][3]:
+            self._close()
+        if self._stack and self._stack[-1][0] == name:
+            self._close()
+
+    def _mark(self, name, tokens):
+        if self._stack and self._stack[-1][3]:
+            self._close()
+        self._open(name, tokens, is_mark=True)
+
+    def totals(self):
+        """
+        Aggregate the records by stack
+
+        Returns:
+            (dict): stack -> (calls, seconds, tokens), tokens is None if
+                    no record of the stack counted them
+        """
+        totals = {}
+        for record in self.records:
+            calls, seconds, tokens = totals.get(record.stack, (0, 0.0, None))
+            if record.tokens is not None:
+                tokens = (tokens or 0) + record.tokens
+            totals[record.stack] = (calls + 1, seconds + record.seconds,
+                                    tokens)
+        return totals
+
+    def collapsed(self):
+        """
+        Records in the collapsed stack format of flamegraph.pl and
+        speedscope, one "stage;sub stage microseconds" line per stack,
+        weighted by the time spent in the stage itself
+
+        Returns:
+            (str): collapsed stacks
+        """
+        self_time = defaultdict(float)
+        for record in self.records:
+            self_time[record.stack] += record.seconds
+            if len(record.stack) > 1:
+                self_time[record.stack[:-1]] -= record.seconds
+        return "".join("{} {}\n".format(";".join(stack),
+                                        max(0, round(seconds * 1e6)))
+                       for stack, seconds in self_time.items())
+
+    def write_collapsed(self, path):
+        """
+        Write the collapsed stacks to a file, see collapsed
+
+        Args:
+            path (str): output file
+        """
+        with open(path, "w") as f:
+            f.write(self.collapsed())
+
+
+def profile():
+    """
+    Record the stages of every traced extraction in the calling thread
+    until the context exits
+
+    Returns:
+        Profile: context manager, its records are kept after it exits
+    """
+    return Profile()
+
+
+class _Stage:
+    __slots__ = ("name", "tokens", "profiles")
+
+    def __init__(self, name, tokens, profiles):
+        self.name = name
+        self.tokens = tokens
+        self.profiles = profiles
+
+    def __enter__(self):
+        tokens = _count(self.tokens)
+        for active in self.profiles:
+            active._open(self.name, tokens)
+        return self
+
+    def __exit__(self, *exc):
+        for active in self.profiles:
+            active._end(self.name)
+
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name, tokens=None):
+    """
+    Context manager timing a stage nested in the current one
+
+    Args:
+        name (str): stage name
+        tokens (int, str or list): tokens the stage works on, strings are
+                                   counted by words
+    """
+    profiles = getattr(_local, "profiles", None)
+    if not profiles:
+        return _NO_STAGE
+    return _Stage(name, tokens, profiles)
+
+
+def mark(name, tokens=None):
+    """
+    Start the next sequential phase of the current stage, the previous
+    phase ends here and the last one when the stage ends
+
+    Args:
+        name (str): phase name
+        tokens (int, str or list): tokens the phase works on, strings are
+                                   counted by words
+    """
+    profiles = getattr(_local, "profiles", None)
+    if profiles:
+        tokens = _count(tokens)
+        for active in profiles:
+            active._mark(name, tokens)
+
+
+def traced(func):
+    """
+    Decorator making every call of func a stage named after it, the
+    tokens of its first argument are counted
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profiles = getattr(_local, "profiles", None)
+        if not profiles:
+            return func(*args, **kwargs)
+        with _Stage(func.__name__, args[0] if args else None, profiles):
+            return func(*args, **kwargs)
+    return wrapper
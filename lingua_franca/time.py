@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import time
+
 from dateutil.tz import gettz, tzlocal
 
 
@@ -23,11 +25,36 @@ DAYS_IN_1_MONTH = 30.42
 
 __default_tz = None
 
+# dateutil tz objects are expensive to build, resolve each zone once
+_UTC = gettz("UTC")
+_NAMED_TZ = {}
+_SYSTEM_TZ = None
+
+# utc offsets only change on quarter hour boundaries, now_local reuses the
+# offset of the last call within the same quarter hour
+_OFFSET_WINDOW = 900
+_EPOCH = datetime(1970, 1, 1)
+_last_offset = (None, 0.0, 0.0, None, 0)  # tz, start, end, offset, fold
+
+
+def _named_tz(name):
+    tz = _NAMED_TZ.get(name)
+    if tz is None:
+        tz = _NAMED_TZ[name] = gettz(name)
+    return tz
+
+
+def _system_tz():
+    global _SYSTEM_TZ
+    if _SYSTEM_TZ is None:
+        _SYSTEM_TZ = tzlocal()
+    return _SYSTEM_TZ
+
 
 def set_default_tz(tz):
     global __default_tz
     if isinstance(tz, str):
-        tz = gettz(tz)
+        tz = _named_tz(tz)
     __default_tz = tz
 
 
@@ -41,7 +68,7 @@ def default_timezone():
     Returns:
         (datetime.tzinfo): Definition of the default timezone
     """
-    return __default_tz or tzlocal()
+    return __default_tz or _system_tz()
 
 
 def now_utc():
@@ -50,7 +77,7 @@ def now_utc():
     Returns:
         (datetime): The current time in Universal Time, aka GMT
     """
-    return datetime.utcnow().replace(tzinfo=gettz("UTC"))
+    return datetime.utcnow().replace(tzinfo=_UTC)
 
 
 def now_local(tz=None):
@@ -62,8 +89,19 @@ def now_local(tz=None):
     Returns:
         (datetime): The current time
     """
+    global _last_offset
     tz = tz or default_timezone()
-    return datetime.now(tz)
+    now = time()
+    last_tz, start, end, offset, fold = _last_offset
+    if tz is last_tz and start <= now < end:
+        # same offset as the last call, skip the tz conversion
+        return (_EPOCH + timedelta(seconds=now) + offset).replace(
+            tzinfo=tz, fold=fold)
+    local = datetime.fromtimestamp(now, tz)
+    start = now - now % _OFFSET_WINDOW
+    _last_offset = (tz, start, start + _OFFSET_WINDOW,
+                    local.utcoffset(), local.fold)
+    return local
 
 
 def to_utc(dt):
@@ -74,10 +112,9 @@ def to_utc(dt):
     Returns:
         (datetime): time converted to UTC
     """
-    tz = gettz("UTC")
     if not dt.tzinfo:
         dt = dt.replace(tzinfo=default_timezone())
-    return dt.astimezone(tz)
+    return dt.astimezone(_UTC)
 
 
 def to_local(dt):
@@ -90,7 +127,7 @@ def to_local(dt):
     """
     tz = default_timezone()
     if not dt.tzinfo:
-        dt = dt.replace(tzinfo=default_timezone())
+        dt = dt.replace(tzinfo=tz)
     return dt.astimezone(tz)
 
 
@@ -102,7 +139,7 @@ def to_system(dt):
     Returns:
         (datetime): time converted to the operation system's timezone
     """
-    tz = tzlocal()
+    tz = _system_tz()
     if not dt.tzinfo:
         dt = dt.replace(tzinfo=default_timezone())
     return dt.astimezone(tz)
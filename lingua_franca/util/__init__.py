@@ -1,3 +1,4 @@
+from collections import defaultdict
 from difflib import SequenceMatcher
 from enum import IntEnum, auto
 
@@ -15,32 +16,80 @@ class MatchStrategy(IntEnum):
     PARTIAL_TOKEN_SET_RATIO = auto()
 
 
+# rapidfuzz scorers backing each strategy, SIMPLE_RATIO uses difflib
+_RAPIDFUZZ_SCORERS = {
+    MatchStrategy.RATIO: rapidfuzz.fuzz.ratio,
+    MatchStrategy.PARTIAL_RATIO: rapidfuzz.fuzz.partial_ratio,
+    MatchStrategy.TOKEN_SORT_RATIO: rapidfuzz.fuzz.token_sort_ratio,
+    MatchStrategy.TOKEN_SET_RATIO: rapidfuzz.fuzz.token_set_ratio,
+    MatchStrategy.PARTIAL_TOKEN_RATIO: rapidfuzz.fuzz.partial_token_ratio,
+    MatchStrategy.PARTIAL_TOKEN_SORT_RATIO:
+        rapidfuzz.fuzz.partial_token_sort_ratio,
+    MatchStrategy.PARTIAL_TOKEN_SET_RATIO:
+        rapidfuzz.fuzz.partial_token_set_ratio
+}
+
+
 def fuzzy_match(x, against, strategy=MatchStrategy.SIMPLE_RATIO):
     """Perform a 'fuzzy' comparison between two strings.
     Returns:
         float: match percentage -- 1.0 for perfect match,
                down to 0.0 for no match at all.
     """
-    if strategy == MatchStrategy.RATIO:
-        score = rapidfuzz.fuzz.ratio(x, against) / 100
-    elif strategy == MatchStrategy.PARTIAL_RATIO:
-        score = rapidfuzz.fuzz.partial_ratio(x, against) / 100
-    elif strategy == MatchStrategy.TOKEN_SORT_RATIO:
-        score = rapidfuzz.fuzz.token_sort_ratio(x, against) / 100
-    elif strategy == MatchStrategy.TOKEN_SET_RATIO:
-        score = rapidfuzz.fuzz.token_set_ratio(x, against) / 100
-    elif strategy == MatchStrategy.PARTIAL_TOKEN_SORT_RATIO:
-        score = rapidfuzz.fuzz.partial_token_sort_ratio(x, against) / 100
-    elif strategy == MatchStrategy.PARTIAL_TOKEN_SET_RATIO:
-        score = rapidfuzz.fuzz.partial_token_set_ratio(x, against) / 100
-    elif strategy == MatchStrategy.PARTIAL_TOKEN_RATIO:
-        score = rapidfuzz.fuzz.partial_token_ratio(x, against) / 100
+    scorer = _RAPIDFUZZ_SCORERS.get(strategy)
+    if scorer is not None:
+        score = scorer(x, against) / 100
     else:
         score = SequenceMatcher(None, x, against).ratio()
 
     return score
 
 
+def match_matrix(queries, choices, strategy=MatchStrategy.SIMPLE_RATIO,
+                 workers=1, score_cutoff=None):
+    """
+        Score every query against every choice in native code
+
+        Uses rapidfuzz.process.cdist when numpy is installed, otherwise
+        every pair is scored in a python loop and plain lists are returned.
+
+        MatchStrategy.SIMPLE_RATIO is scored with rapidfuzz.fuzz.ratio,
+        the same 2*M/T ratio as difflib but with M being the longest common
+        subsequence, so scores may be marginally higher than fuzzy_match
+
+        Arguments:
+            queries: list of strings to test
+            choices: list of choices
+            strategy (MatchStrategy): scoring strategy, see fuzzy_match
+            workers (int): number of threads to use, -1 for all cores
+            score_cutoff (float): if set, only return the scores at or above
+                                  this value as a sparse list
+
+        Returns: numpy array of shape (len(queries), len(choices)) with
+                 scores from 0.0 to 1.0, a list of rows without numpy, or
+                 if score_cutoff is set a list of tuples
+                 (query_index, choice_index, score)
+    """
+    scorer = _RAPIDFUZZ_SCORERS.get(strategy, rapidfuzz.fuzz.ratio)
+    cutoff = None if score_cutoff is None else score_cutoff * 100
+    try:
+        import numpy as np
+    except ImportError:
+        matrix = [[scorer(query, choice, score_cutoff=cutoff) / 100
+                   for choice in choices] for query in queries]
+        if score_cutoff is None:
+            return matrix
+        return [(q, c, score) for q, row in enumerate(matrix)
+                for c, score in enumerate(row) if score >= score_cutoff]
+    matrix = rapidfuzz.process.cdist(queries, choices, scorer=scorer,
+                                     score_cutoff=cutoff, dtype=np.float64,
+                                     workers=workers) / 100
+    if score_cutoff is None:
+        return matrix
+    return [(int(q), int(c), float(matrix[q, c]))
+            for q, c in zip(*np.nonzero(matrix >= score_cutoff))]
+
+
 def match_one(query, choices, match_func=None, strategy=MatchStrategy.SIMPLE_RATIO):
     """
         Find best match from a list or dictionary given an input
@@ -81,3 +130,128 @@ def match_all(query, choices, match_func=None, strategy=MatchStrategy.SIMPLE_RAT
     # TODO solve ties
 
     return sorted(matches, key=lambda k: k[1], reverse=True)
+
+
+class Matcher:
+    """
+        Reusable fuzzy matcher over a fixed list or dictionary of choices
+
+        Choices are preprocessed once at construction, token based
+        strategies get their tokens sorted ahead of time, and a character
+        n-gram inverted index is kept to prefilter candidates, so repeated
+        queries against the same choices only score the choices that share
+        at least one n-gram with the query.
+
+        Scores are the same as returned by fuzzy_match, but choices sharing
+        no n-gram with the query are considered a non-match and are never
+        scored, even if fuzzy_match would score them above 0. A near-miss
+        such as "hryra" for "harry" shares no trigram with it, so the best
+        match can differ from match_one, use prefilter=False when exact
+        parity with match_one matters. If no choice shares an n-gram with
+        the query every choice is scored, so such queries are as slow as
+        match_all.
+
+        Arguments:
+            choices: list or dictionary of choices
+            strategy (MatchStrategy): scoring strategy, see fuzzy_match
+            ngram_size (int): size of the character n-grams in the index
+            prefilter (bool): if False every choice is always scored
+    """
+
+    def __init__(self, choices, strategy=MatchStrategy.SIMPLE_RATIO,
+                 ngram_size=3, prefilter=True):
+        if isinstance(choices, dict):
+            self._keys = list(choices.keys())
+            self._values = list(choices.values())
+        elif isinstance(choices, list):
+            self._keys = list(choices)
+            self._values = self._keys
+        else:
+            raise ValueError('a list or dict of choices must be provided')
+        self.strategy = strategy
+        self.ngram_size = ngram_size
+        self.prefilter = prefilter
+
+        # token sort strategies are plain (partial) ratios over the
+        # sorted tokens, sort the choices once instead of per comparison
+        if strategy == MatchStrategy.TOKEN_SORT_RATIO:
+            self._presort = True
+            self._scorer = rapidfuzz.fuzz.ratio
+        elif strategy == MatchStrategy.PARTIAL_TOKEN_SORT_RATIO:
+            self._presort = True
+            self._scorer = rapidfuzz.fuzz.partial_ratio
+        else:
+            self._presort = False
+            self._scorer = _RAPIDFUZZ_SCORERS.get(strategy)
+        self._processed = [self._preprocess(c) for c in self._keys]
+
+        self._index = defaultdict(set)
+        if prefilter:
+            for idx, choice in enumerate(self._keys):
+                for gram in self._ngrams(choice):
+                    self._index[gram].add(idx)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _preprocess(self, text):
+        if self._presort:
+            return " ".join(sorted(text.split()))
+        return text
+
+    def _ngrams(self, text):
+        text = f" {text.lower()} "
+        n = self.ngram_size
+        return {text[i:i + n] for i in range(max(len(text) - n + 1, 1))}
+
+    def _candidates(self, query):
+        if not self.prefilter:
+            return range(len(self._keys))
+        candidates = set()
+        for gram in self._ngrams(query):
+            candidates.update(self._index.get(gram, ()))
+        if not candidates:
+            return range(len(self._keys))
+        return sorted(candidates)
+
+    def _score(self, query, candidates):
+        if self._scorer is None:
+            return [(idx, SequenceMatcher(None, query,
+                                          self._keys[idx]).ratio())
+                    for idx in candidates]
+        query = self._preprocess(query)
+        return [(idx, self._scorer(query, self._processed[idx]) / 100)
+                for idx in candidates]
+
+    def top(self, query, k=None, score_cutoff=0.0):
+        """
+            Find the k best matches for an input
+
+            Arguments:
+                query:   string to test
+                k (int): number of matches to return, None for all
+                score_cutoff (float): ignore matches scoring below this
+
+            Returns: list of tuples (match, score), best match first
+        """
+        scores = [(idx, score) for idx, score
+                  in self._score(query, self._candidates(query))
+                  if score >= score_cutoff]
+        # ties are kept in the original choice order, like match_all
+        scores.sort(key=lambda s: (-s[1], s[0]))
+        if k is not None:
+            scores = scores[:k]
+        return [(self._values[idx], score) for idx, score in scores]
+
+    def best(self, query, score_cutoff=0.0):
+        """
+            Find best match for an input
+
+            Arguments:
+                query:   string to test
+                score_cutoff (float): ignore matches scoring below this
+
+            Returns: tuple with best match, score or None if no match
+        """
+        matches = self.top(query, 1, score_cutoff)
+        return matches[0] if matches else None
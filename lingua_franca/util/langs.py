@@ -0,0 +1,86 @@
+import json
+
+from lingua_franca.internal import resolve_resource_file
+from lingua_franca.util import Matcher, MatchStrategy
+
+_LANGUAGE_NAMES = {}
+
+
+def _normalize_name(name):
+    return " ".join(name.casefold().split())
+
+
+class LanguageNames:
+    """ Spoken language names of a locale, indexed both ways
+
+    Loaded once from langs.json, exact and case/whitespace insensitive
+    spoken names resolve to their code with a dict lookup, everything else
+    goes through a fuzzy Matcher that only scores names sharing n-grams
+    with the query.
+    """
+
+    def __init__(self, resource_file):
+        with open(resource_file) as f:
+            languages = json.load(f)
+        # lang code -> list of spoken names for this language
+        # multiple valid spellings may exist
+        self.names = {k: [v] if isinstance(v, str) else list(v)
+                      for k, v in languages.items()}
+        # spoken name -> lang code
+        self.codes = {}
+        for code, names in self.names.items():
+            for name in names:
+                self.codes[name] = code
+        self._normalized = {_normalize_name(name): code
+                            for name, code in self.codes.items()}
+        self._matcher = Matcher(self.codes, MatchStrategy.TOKEN_SET_RATIO)
+
+    def match(self, text, score_cutoff=0.0):
+        """ Find the lang code for a spoken language name
+
+        Args:
+            text (str): spoken language name
+            score_cutoff (float): minimum fuzzy score to accept
+
+        Returns:
+            tuple: (lang code, score), (None, 0.0) if nothing reaches
+                   score_cutoff
+        """
+        if text in self.codes:
+            return self.codes[text], 1.0
+        normalized = _normalize_name(text)
+        if normalized in self._normalized:
+            return self._normalized[normalized], 1.0
+        return self._matcher.best(text, score_cutoff) or (None, 0.0)
+
+    def spoken_name(self, lang_code):
+        """ Get the spoken name for a lang code
+
+        Args:
+            lang_code (str): BCP-47 language code, e.g. "en" or "pt-br"
+
+        Returns:
+            str: spoken language name, or lang_code if unknown
+        """
+        lang_code = lang_code.lower()
+        names = self.names.get(lang_code) or \
+            self.names.get(lang_code.split("-")[0])
+        return names[0] if names else lang_code
+
+
+def get_language_names(lang):
+    """ Get the cached LanguageNames of a full lang code
+
+    Falls back to english names if the locale has no langs.json
+
+    Args:
+        lang (str): full BCP-47 language code, e.g. "en-us"
+
+    Returns:
+        LanguageNames
+    """
+    if lang not in _LANGUAGE_NAMES:
+        resource_file = resolve_resource_file(f"text/{lang}/langs.json") or \
+            resolve_resource_file("text/en-us/langs.json")
+        _LANGUAGE_NAMES[lang] = LanguageNames(resource_file)
+    return _LANGUAGE_NAMES[lang]
@@ -0,0 +1,51 @@
+"""
+Time the stages of English datetime extraction per utterance, normalizing
+the words and resolving the normalized words against the anchor date
+
+usage, from the repository root:
+    python -m scripts.benchmark_datetime [repetitions]
+"""
+import sys
+from datetime import datetime
+from timeit import timeit
+
+from lingua_franca import load_language
+from lingua_franca.lang.parse_en import _clean_datetime_string_en, \
+    _resolve_datetime_en
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+UTTERANCES = [
+    "what is the weather like next tuesday at 4pm",
+    "remind me to call mom in 2 hours and 30 minutes",
+    "set an alarm for 7:45 in the morning on june 5th",
+    "what did i do 3 days ago",
+    "schedule the meeting for the day after tomorrow at noon",
+    "how was the weather last weekend",
+    "wake me up at 0800 hours",
+    "what happened 2 decades ago",
+    "remind me to buy milk tonight",
+    "turn off the lights in 10 minutes",
+    "what is the date 5 days from next thursday",
+    "i have nothing planned for the rest of the afternoon",
+    "play some music please",
+    "what was the score of the game on february 18 2016",
+]
+
+
+def main(repetitions=2000):
+    load_language("en")
+    words = [_clean_datetime_string_en(text) for text in UTTERANCES]
+    clean = timeit(lambda: [_clean_datetime_string_en(text)
+                            for text in UTTERANCES],
+                   number=repetitions) / repetitions
+    resolve = timeit(lambda: [_resolve_datetime_en(list(w), ANCHOR)
+                              for w in words],
+                     number=repetitions) / repetitions
+    print(f"{'stage':<10}{'per utterance (us)':>20}")
+    for name, total in (("clean", clean), ("resolve", resolve),
+                        ("total", clean + resolve)):
+        print(f"{name:<10}{total * 1e6 / len(UTTERANCES):>20.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,35 @@
+"""
+Time English number extraction on growing inputs, the time per token
+should stay flat as the number of tokens grows
+
+usage, from the repository root:
+    python -m scripts.benchmark_extract_numbers [max tokens]
+"""
+import sys
+from itertools import cycle, islice
+from timeit import timeit
+
+from lingua_franca.lang.parse_common import tokenize
+from lingua_franca.lang.parse_en import _extract_numbers_with_text_en
+
+SENTENCE = ("i bought twenty two apples and three hundred and five "
+            "oranges , it cost one point five dollars for the first "
+            "dozen and a half of them , then two thousand more").split()
+
+
+def main(max_tokens=10000):
+    print(f"{'tokens':>8}{'numbers':>9}{'total (ms)':>12}{'per token (us)':>16}")
+    size = 625
+    while size <= max_tokens:
+        tokens = tokenize(" ".join(islice(cycle(SENTENCE), size)))
+        numbers = len(_extract_numbers_with_text_en(tokens))
+        repetitions = max(1, 20000 // size)
+        total = timeit(lambda: _extract_numbers_with_text_en(tokens),
+                       number=repetitions) / repetitions
+        print(f"{size:>8}{numbers:>9}{total * 1e3:>12.2f}"
+              f"{total * 1e6 / size:>16.2f}")
+        size *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
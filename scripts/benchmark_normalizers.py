@@ -0,0 +1,45 @@
+"""
+Time building each language Normalizer against normalizing with the
+shared instance returned by get_normalizer
+
+usage, from the repository root:
+    python -m scripts.benchmark_normalizers [repetitions]
+"""
+import sys
+from timeit import timeit
+
+from lingua_franca.lang.parse_az import AzerbaijaniNormalizer
+from lingua_franca.lang.parse_ca import CatalanNormalizer
+from lingua_franca.lang.parse_common import get_normalizer
+from lingua_franca.lang.parse_cs import CzechNormalizer
+from lingua_franca.lang.parse_de import GermanNormalizer
+from lingua_franca.lang.parse_en import EnglishNormalizer
+from lingua_franca.lang.parse_pt import PortugueseNormalizer
+from lingua_franca.lang.parse_ru import RussianNormalizer
+from lingua_franca.lang.parse_uk import UkrainianNormalizer
+
+NORMALIZERS = {
+    "az-az": (AzerbaijaniNormalizer, "bu iyirmi beş dəqiqə çəkəcək"),
+    "ca-es": (CatalanNormalizer, "el gat va menjar vint-i-tres peixos"),
+    "cs-cz": (CzechNormalizer, "to bude trvat dvacet pět minut"),
+    "de-de": (GermanNormalizer, "das dauert fünfundzwanzig Minuten"),
+    "en-us": (EnglishNormalizer, "it'll take twenty five minutes, isn't it"),
+    "pt-pt": (PortugueseNormalizer, "isso vai demorar vinte e cinco minutos"),
+    "ru-ru": (RussianNormalizer, "это займёт двадцать пять минут"),
+    "uk-ua": (UkrainianNormalizer, "це займе двадцять п'ять хвилин"),
+}
+
+
+def main(repetitions=1000):
+    print(f"{'lang':8}{'build (ms)':>14}{'normalize (us)':>18}")
+    for lang, (normalizer_class, utterance) in NORMALIZERS.items():
+        build = timeit(normalizer_class, number=repetitions // 10 or 1)
+        normalizer = get_normalizer(normalizer_class)
+        run = timeit(lambda: normalizer.normalize(utterance),
+                     number=repetitions)
+        print(f"{lang:8}{build * 1e3 / (repetitions // 10 or 1):>14.3f}"
+              f"{run * 1e6 / repetitions:>18.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
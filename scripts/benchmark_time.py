@@ -0,0 +1,47 @@
+"""
+Time the per call overhead of the lingua_franca.time helpers against the
+uncached dateutil calls they used to make
+
+usage, from the repository root:
+    python -m scripts.benchmark_time [calls]
+"""
+import sys
+from datetime import datetime
+from timeit import timeit
+
+from dateutil.tz import gettz, tzlocal
+
+from lingua_franca.time import default_timezone, now_local, now_utc, \
+    set_default_tz, to_local
+
+NAIVE = datetime(2021, 6, 27, 13, 4)
+
+
+def main(calls=100000):
+    cases = [
+        ("now_utc",
+         lambda: datetime.utcnow().replace(tzinfo=gettz("UTC")), now_utc),
+        ("default_timezone", tzlocal, default_timezone),
+        ("now_local", lambda: datetime.now(tzlocal()), now_local),
+        ("now_local(tz)",
+         lambda: datetime.now(gettz("America/Chicago")),
+         lambda: now_local(gettz("America/Chicago"))),
+        ("to_local",
+         lambda: NAIVE.replace(tzinfo=tzlocal()).astimezone(tzlocal()),
+         lambda: to_local(NAIVE)),
+    ]
+    print(f"{'call':<20}{'before (us)':>12}{'after (us)':>12}")
+    for name, before, after in cases:
+        before = timeit(before, number=calls) / calls
+        after = timeit(after, number=calls) / calls
+        print(f"{name:<20}{before * 1e6:>12.2f}{after * 1e6:>12.2f}")
+
+    set_default_tz("America/Chicago")
+    before = timeit(lambda: datetime.now(gettz("America/Chicago")),
+                    number=calls) / calls
+    after = timeit(now_local, number=calls) / calls
+    print(f"{'now_local (named)':<20}{before * 1e6:>12.2f}{after * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -1,4 +1,7 @@
 import unittest
+from datetime import datetime
+
+from dateutil import tz
 
 from sys import version
 
@@ -200,6 +203,66 @@ class TestLocalizerEdgeCases(unittest.TestCase):
         unload_all_languages()
 
 
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        lingua_franca.load_language('en')
+        lingua_franca.clear_result_cache()
+        lingua_franca.config.cache_results = True
+
+    def tearDown(self):
+        lingua_franca.config.cache_results = False
+        lingua_franca.config.result_cache_size = 1024
+        lingua_franca.clear_result_cache()
+        unload_all_languages()
+
+    def test_hits_and_misses(self):
+        parse = lingua_franca.parse
+        self.assertEqual(parse.extract_number("twenty two"), 22)
+        self.assertEqual(parse.extract_number("twenty two", lang="en"), 22)
+        self.assertEqual(parse.extract_number("twenty two", True), 22)
+        self.assertEqual(parse.extract_number("twenty two", ordinals=True),
+                         22)
+        info = lingua_franca.get_result_cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (2, 2, 2))
+
+        # returned containers are copies
+        parse.extract_numbers("one two").append(3)
+        self.assertEqual(parse.extract_numbers("one two"), [1, 2])
+
+        # only pure functions are cached
+        lingua_franca.format.nice_time(datetime(2017, 6, 27, 13, 4))
+        self.assertEqual(lingua_franca.get_result_cache_info().size, 3)
+
+    def test_clock_params(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        lingua_franca.parse.extract_datetime("tomorrow")
+        lingua_franca.parse.extract_datetime("tomorrow", anchor)
+        lingua_franca.parse.extract_datetime("tomorrow", anchor)
+        info = lingua_franca.get_result_cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (1, 1, 1))
+
+    def test_timezones(self):
+        utc = datetime(2017, 6, 27, 20, tzinfo=tz.UTC)
+        tokyo = utc.astimezone(tz.gettz("Asia/Tokyo"))
+        self.assertEqual(utc, tokyo)
+        extract_datetime = lingua_franca.parse.extract_datetime
+        self.assertEqual(extract_datetime("tomorrow", utc)[0].day, 28)
+        self.assertEqual(extract_datetime("tomorrow", tokyo)[0].day, 29)
+        info = lingua_franca.get_result_cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (0, 2, 2))
+
+    def test_eviction(self):
+        lingua_franca.config.result_cache_size = 2
+        for number in (1, 2, 3, 1.0):
+            lingua_franca.format.pronounce_number(number)
+        info = lingua_franca.get_result_cache_info()
+        self.assertEqual((info.hits, info.evictions, info.size), (0, 2, 2))
+
+        lingua_franca.config.cache_results = False
+        lingua_franca.format.pronounce_number(3)
+        self.assertEqual(lingua_franca.get_result_cache_info(), info)
+
+
 class TestGetter(unittest.TestCase):
     def test_primary_lang_code(self):
         unload_all_languages()
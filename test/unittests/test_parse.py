@@ -14,12 +14,17 @@
 # limitations under the License.
 #
 import unittest
-from datetime import datetime
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
 
 from dateutil import tz
 
 from lingua_franca import load_language, unload_language, set_default_lang
-from lingua_franca.lang.parse_common import tokenize, Token, Normalizer
+from lingua_franca.lang.parse_common import tokenize, Token, Normalizer, \
+    MultiPatternMatcher, PhraseMatcher, fold_unicode, make_translation_table, \
+    get_normalizer, NumberGrammar, DurationGrammar, DatetimeResolution, \
+    datetime_remainder
 from lingua_franca.parse import extract_datetime, fuzzy_match, match_one, extract_langcode, yes_or_no
 from lingua_franca.time import default_timezone, now_local, set_default_tz
 from lingua_franca.internal import FunctionNotLocalizedError
@@ -78,6 +83,25 @@ class TestTimezones(unittest.TestCase):
 
         set_default_tz(default)  # undo changes to default tz after test
 
+    def test_now_local(self):
+        default = default_timezone()
+        set_default_tz("Europe/London")
+        london = default_timezone()
+        set_default_tz("Europe/London")
+        self.assertIs(default_timezone(), london)
+        set_default_tz(default)  # undo changes to default tz after test
+
+        # the cached offset must follow the dst changes, 2021-10-31 01:00
+        # UTC is the end of summer time in London
+        end_of_dst = 1635642000
+        for offset in (-1800, -1, 0, 1, 1800, -1):
+            now = end_of_dst + offset
+            with mock.patch("lingua_franca.time.time", lambda: now):
+                local = now_local(london)
+            expected = datetime.fromtimestamp(now, london)
+            self.assertEqual(local.isoformat(), expected.isoformat())
+            self.assertEqual(local.fold, expected.fold)
+
 
 class TestFuzzyMatch(unittest.TestCase):
     def test_matches(self):
@@ -148,6 +172,75 @@ class TestRemoveSymbols(unittest.TestCase):
                          "15/2/2018")
         
 
+class TestNormalizer(unittest.TestCase):
+    config = {"lowercase": True,
+              "remove_stopwords": True,
+              "contractions": {"isn't": "is not"},
+              "word_replacements": {"colour": "color"},
+              "number_replacements": {"one": "1"},
+              "articles": ["the", "a"],
+              "stopwords": ["is"]}
+
+    def test_normalize(self):
+        normalizer = Normalizer(self.config)
+        self.assertEqual(normalizer.normalize("The colour isn't one!"),
+                         "the color not 1")
+        self.assertEqual(normalizer.normalize("The colour isn't one!",
+                                              remove_articles=True),
+                         "color not 1")
+        self.assertEqual(normalizer.normalize("one - the -"), "1 - the")
+
+    def test_multi_word_replacements(self):
+        config = dict(self.config,
+                      number_replacements={"one": "1", "one hundred": "100"},
+                      word_replacements={"a lot of": "many", "lot": "plot"})
+        normalizer = Normalizer(config)
+        self.assertEqual(normalizer.normalize("a lot of one hundred lot"),
+                         "many 100 plot")
+        self.assertEqual(normalizer.numbers_to_digits("one hundred one"),
+                         "100 1")
+
+    def test_overridden_stage(self):
+        class ShoutingNormalizer(Normalizer):
+            def replace_words(self, utterance):
+                return utterance.replace("colour", "COLOR") + "  !"
+
+        normalizer = ShoutingNormalizer(self.config)
+        self.assertEqual(normalizer.normalize("The colour isn't one"),
+                         "the COLOR not 1")
+
+    def test_get_normalizer(self):
+        normalizer = get_normalizer(Normalizer, self.config)
+        self.assertIs(get_normalizer(Normalizer, dict(self.config)),
+                      normalizer)
+        self.assertIsNot(get_normalizer(Normalizer), normalizer)
+        self.assertIsNot(get_normalizer(Normalizer, {"lowercase": False}),
+                         normalizer)
+
+        with ThreadPoolExecutor(4) as executor:
+            normalized = list(executor.map(
+                lambda _: get_normalizer(Normalizer, self.config).normalize(
+                    "The colour isn't one!"), range(20)))
+        self.assertEqual(set(normalized), {"the color not 1"})
+
+
+class TestUnicodeFolding(unittest.TestCase):
+    def test_fold_unicode(self):
+        self.assertEqual(fold_unicode("não é"), "nao e")
+        self.assertEqual(fold_unicode("plain"), "plain")
+        self.assertEqual(fold_unicode("ﬁnal"), "nal")
+        self.assertEqual(fold_unicode("ﬁnal", "NFKD"), "final")
+        self.assertEqual(fold_unicode("é", ascii_only=False), "e\u0301")
+
+    def test_remove_accents(self):
+        self.assertEqual(Normalizer().remove_accents("Ála está ótima"),
+                         "Ala esta otima")
+        # not expressible as a translation table, replaced in order
+        self.assertIsNone(make_translation_table({"ss": "ß"}))
+        normalizer = Normalizer({"accents": {"ß": "ss", "ss": "s"}})
+        self.assertEqual(normalizer.remove_accents("Straße"), "Strase")
+
+
 class TestLangcode(unittest.TestCase):
     def test_parse_lang_code(self):
 
@@ -163,6 +256,171 @@ class TestLangcode(unittest.TestCase):
         test_with_conf("Inglês", 'en', 0.6)
 
 
+class TestMultiPatternMatcher(unittest.TestCase):
+    def test_finditer(self):
+        matcher = MultiPatternMatcher([("he", 1), ("she", 2), ("hers", 3),
+                                       ("his", 4)])
+        self.assertEqual(matcher.finditer("ushers", word_boundaries=False),
+                         [(1, 4, 2), (2, 4, 1), (2, 6, 3)])
+        self.assertEqual(matcher.finditer("ushers"), [])
+        self.assertEqual(matcher.finditer("she said his hers"),
+                         [(0, 3, 2), (9, 12, 4), (13, 17, 3)])
+
+    def test_phrases(self):
+        matcher = MultiPatternMatcher([("no", "no"), ("no way", "no_way")])
+        self.assertEqual(matcher.finditer("no way, nothing"),
+                         [(0, 2, "no"), (0, 6, "no_way")])
+
+
+class TestPhraseMatcher(unittest.TestCase):
+    def test_longest_match(self):
+        matcher = PhraseMatcher([(["new"], ["old"]),
+                                 (["new", "york"], ["ny"]),
+                                 (["new"], ["ignored"])])
+        self.assertEqual(matcher.replace("new york is new".split()),
+                         ["ny", "is", "old"])
+        self.assertEqual(matcher.replace(["new", "yorkshire"]),
+                         ["old", "yorkshire"])
+        self.assertEqual(PhraseMatcher().replace(["new"]), ["new"])
+
+    def test_chain(self):
+        contractions = PhraseMatcher([(["isn't"], ["is", "not"])])
+        words = PhraseMatcher([(["is", "not"], ["aint"]),
+                               (["not"], ["no"])])
+        chained = PhraseMatcher.chain([contractions, words])
+        tokens = "it isn't not".split()
+        self.assertEqual(chained.replace(tokens),
+                         words.replace(contractions.replace(tokens)))
+        self.assertEqual(chained.replace(tokens), ["it", "aint", "no"])
+
+    def test_chain_overlapping_replacement(self):
+        contractions = PhraseMatcher([(["isn't"], ["is", "not"])])
+        words = PhraseMatcher([(["not", "really"], ["barely"])])
+        chained = PhraseMatcher.chain([contractions, words])
+        tokens = "it isn't really".split()
+        # "not really" spans the end of the "isn't" replacement
+        self.assertEqual(words.replace(contractions.replace(tokens)),
+                         ["it", "is", "barely"])
+        self.assertEqual(chained.replace(tokens),
+                         ["it", "is", "not", "really"])
+
+
+class TestNumberGrammar(unittest.TestCase):
+    def test_connected_tens(self):
+        grammar = NumberGrammar({"uno": 1, "dos": 2, "veinte": 20,
+                                 "treinta": 30, "cien": 100},
+                                first_ten=30, connectors=("y",),
+                                scales={"mil": 1000})
+        self.assertEqual(grammar.parse("treinta y dos".split()), (32, 3))
+        self.assertEqual(grammar.parse("treinta dos".split()), (30, 1))
+        self.assertEqual(grammar.parse("veinte dos".split()), (20, 1))
+        self.assertEqual(grammar.parse("dos mil cien uno".split()),
+                         (2101, 4))
+        self.assertEqual(grammar.parse("hay dos".split(), 1), (2, 2))
+        self.assertIsNone(grammar.parse("hay dos".split()))
+        self.assertIsNone(grammar.parse(["mil"]))
+
+    def test_juxtaposed_tens(self):
+        grammar = NumberGrammar({"zero": 0, "one": 1, "two": 2,
+                                 "twenty": 20, "hundred": 100},
+                                scales={"thousand": 1000,
+                                        "million": 1000000},
+                                hundred_words=("hundred",),
+                                bare_scales=True)
+        self.assertEqual(grammar.parse(["zero", "one"]), (0, 1))
+        self.assertEqual(grammar.parse("two hundred twenty one".split()),
+                         (221, 4))
+        self.assertEqual(grammar.parse("one million two thousand".split()),
+                         (1002000, 4))
+        self.assertEqual(grammar.parse("thousand two".split()), (1002, 2))
+        self.assertEqual(grammar.parse("two thousand million".split()),
+                         (2000, 2))
+
+
+class TestDurationGrammar(unittest.TestCase):
+    grammar = DurationGrammar([("hour", "hours", 1),
+                               ("minute", "minutes", 1),
+                               ("day", "days", 1),
+                               ("week", "days", 7)],
+                              r"(?P<value>\d+(?:[.,]\d+)?)(?:\s+|-){unit}s?")
+
+    def test_parse(self):
+        time_units, remainder, spans = self.grammar.parse(
+            "wait 2 hours 3,5 minutes and 1 week")
+        self.assertEqual(time_units, {"hours": 2, "minutes": 3.5,
+                                      "days": 7})
+        self.assertEqual(remainder, "wait   and ")
+        self.assertEqual(spans, [(5, 12), (13, 24), (29, 35)])
+
+    def test_extract_duration(self):
+        self.assertEqual(self.grammar.extract_duration("2 days 1-week off"),
+                         (timedelta(days=9), "off"))
+        self.assertEqual(self.grammar.extract_duration("0 minutes left"),
+                         (None, "left"))
+        self.assertEqual(self.grammar.extract_duration("no duration"),
+                         (None, "no duration"))
+
+    def test_durations(self):
+        self.assertEqual(
+            self.grammar.durations("2 hours, 5 minutes or 1 day and 1 week",
+                                   joiners=("and",)),
+            [({"hours": 2, "minutes": 5, "days": 0}, 0, 18),
+             ({"hours": 0, "minutes": 0, "days": 8}, 22, 38)])
+        self.assertEqual(self.grammar.durations("no duration"), [])
+
+
+class TestDatetimeResolution(unittest.TestCase):
+    anchor = datetime(2017, 6, 27, 13, 4, 30)
+
+    def test_found(self):
+        self.assertFalse(DatetimeResolution().found())
+        self.assertTrue(DatetimeResolution(datestr="june 5").found())
+        self.assertTrue(DatetimeResolution(hr_abs=17).found())
+
+    def test_replace_anchor_time(self):
+        self.assertEqual(
+            DatetimeResolution(day_offset=2, hr_abs=17, min_abs=0)
+            .resolve(self.anchor),
+            datetime(2017, 6, 29, 17, 0))
+        self.assertEqual(
+            DatetimeResolution(min_offset=10, hr_abs=-1, min_abs=-1)
+            .resolve(self.anchor),
+            datetime(2017, 6, 27, 13, 14, 30))
+        # a passed clock time is tomorrow
+        self.assertEqual(DatetimeResolution(hr_abs=9).resolve(self.anchor),
+                         datetime(2017, 6, 28, 9, 0))
+        self.assertEqual(
+            DatetimeResolution(datestr="june 5").resolve(self.anchor,
+                                                         time(8, 0)),
+            datetime(2018, 6, 5, 8, 0))
+
+    def test_from_midnight(self):
+        self.assertEqual(
+            DatetimeResolution(datestr="june 5 2016", has_year=True,
+                               hr_abs=17).resolve(self.anchor,
+                                                  from_midnight=True),
+            datetime(2016, 6, 5, 17, 0))
+        self.assertEqual(
+            DatetimeResolution(day_offset=1, hr_offset=2)
+            .resolve(self.anchor, time(8, 0), from_midnight=True),
+            datetime(2017, 6, 28, 10, 0))
+
+    def test_remainder(self):
+        self.assertEqual(
+            datetime_remainder(["call", "", "and", "", "mom"], ("and",)),
+            "call mom")
+        self.assertEqual(
+            datetime_remainder(["call", "and", "", "mom"], ("and",)),
+            "call and mom")
+        self.assertEqual(datetime_remainder(["", "and"], ("and",)), "")
+        self.assertEqual(datetime_remainder(["", "and"]), "and")
+        extracted, remainder = extract_datetime("tomorrow and", self.anchor,
+                                                lang="en")
+        self.assertEqual(extracted.replace(tzinfo=None),
+                         datetime(2017, 6, 28, 0, 0))
+        self.assertEqual(remainder, "")
+
+
 class TestYesNo(unittest.TestCase):
     def test_bad_lang(self):
 
@@ -18,7 +18,7 @@ from datetime import datetime, time
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import extract_datetime
-from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
 from lingua_franca.time import default_timezone
 
@@ -191,6 +191,9 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(
             normalize("dette er en to tre test", lang="da-dk"),
             "dette er 1 2 3 test")
+        # one number, even though the parser doesn't know "hundrede" alone
+        self.assertEqual(extract_numbers("et hundrede og tyve", lang="da-dk"),
+                         [extract_number("et hundrede og tyve", lang="da-dk")])
         self.assertEqual(
             normalize("dette er fire fem seks test", lang="da-dk"),
             "dette er 4 5 6 test")
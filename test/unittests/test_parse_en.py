@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 import unittest
+import tempfile
 from datetime import datetime, timedelta, time
 
 from dateutil import tz
@@ -21,13 +22,15 @@ from dateutil.relativedelta import relativedelta
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.internal import FunctionNotLocalizedError
-from lingua_franca.parse import extract_datetime
-from lingua_franca.parse import extract_duration
+from lingua_franca.parse import extract_datetime, compile_datetime, \
+    extract_datetime_batch, extract_datetimes, datetime_stream
+from lingua_franca.parse import extract_duration, extract_durations
 from lingua_franca.parse import extract_langcode
-from lingua_franca.parse import extract_number, extract_numbers
+from lingua_franca.parse import extract_number, extract_numbers, \
+    extract_number_spans
 from lingua_franca.parse import get_color, extract_color_spans
 from lingua_franca.parse import get_gender
-from lingua_franca.parse import normalize
+from lingua_franca.parse import normalize, normalize_stream, normalize_file
 from lingua_franca.time import default_timezone, to_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 from lingua_franca.parse import extract_langcode
 from lingua_franca.parse import yes_or_no
@@ -52,6 +55,31 @@ def extractWithFormat(text):
 
 
 class TestNormalize(unittest.TestCase):
+    stream = ["this is a test", "it's twenty one", "", "the ONE"] * 3
+
+    def test_normalize_stream(self):
+        expected = [normalize(text) for text in self.stream]
+        self.assertEqual(list(normalize_stream(self.stream, chunk_size=5)),
+                         expected)
+        self.assertEqual(list(normalize_stream(iter(self.stream), "en-us",
+                                               workers=2, chunk_size=2)),
+                         expected)
+        self.assertEqual(list(normalize_stream(self.stream,
+                                               remove_articles=False)),
+                         [normalize(text, remove_articles=False)
+                          for text in self.stream])
+
+    def test_normalize_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = f"{tmp}/in.txt", f"{tmp}/out.txt"
+            with open(src, "w") as f:
+                f.write("\n".join(self.stream) + "\n")
+            self.assertEqual(normalize_file(src, dst, chunk_size=5),
+                             len(self.stream))
+            with open(dst) as f:
+                self.assertEqual(f.read().split("\n")[:-1],
+                                 [normalize(text) for text in self.stream])
+
     def test_articles(self):
         self.assertEqual(normalize("this is a test", remove_articles=True),
                          "this is test")
@@ -518,6 +546,37 @@ class TestExtractNumber(unittest.TestCase):
         self.assertEqual(extract_number("a couple thousand beers"), 2000)
         self.assertEqual(extract_number("totally 100%"), 100)
 
+    def test_number_data_is_shared(self):
+        from lingua_franca.lang.parse_en import _initialize_number_data_en
+        multiplies, ordinals, scale = _initialize_number_data_en(True)
+        self.assertIs(_initialize_number_data_en(1)[2], scale)
+        self.assertIsNot(_initialize_number_data_en(False)[2], scale)
+        with self.assertRaises(TypeError):
+            scale["gazillion"] = 10 ** 100
+
+    def test_long_text_numbers(self):
+        sentence = "twenty two apples, three hundred five pears and a dozen eggs."
+        self.assertEqual(extract_numbers(" ".join([sentence] * 100)),
+                         [22.0, 305.0] * 100)
+        self.assertEqual(normalize(" ".join(["one two"] * 100)),
+                         " ".join(["1 2"] * 100))
+
+    def test_number_spans(self):
+        text = "I want  twenty two apples and 2.5 pears, the 3rd one"
+        spans = extract_number_spans(text)
+        self.assertEqual([tuple(span) for span in spans],
+                         [(22, 8, 18, False), (2.5, 30, 33, False),
+                          (3, 45, 48, True)])
+        self.assertEqual([text[s.start:s.end] for s in spans],
+                         ["twenty two", "2.5", "3rd"])
+        text = "the fourth one is minus one million"
+        self.assertEqual(extract_number_spans(text),
+                         [(0.25, 4, 10, False), (1, 11, 14, False),
+                          (-1000000, 18, 35, False)])
+        self.assertEqual(extract_number_spans(text, ordinals=True),
+                         [(4, 4, 14, True), (-1000000, 18, 35, False)])
+        self.assertEqual(extract_number_spans("no numbers here"), [])
+
     def test_multiple_numbers(self):
         self.assertEqual(extract_numbers("this is a one two three  test"),
                          [1.0, 2.0, 3.0])
@@ -634,6 +693,26 @@ class TestExtractDuration(unittest.TestCase):
         self.assertEqual(extract_duration("5 millenniums"),
                          (timedelta(days=DAYS_IN_1_YEAR * 1000 * 5), ""))
 
+    def test_extract_durations(self):
+        def durations(text):
+            return [(duration, text[start:end])
+                    for duration, start, end in extract_durations(text)]
+
+        self.assertEqual(
+            durations("remind me in 5 minutes and again in two hours"),
+            [(timedelta(minutes=5), "5 minutes"),
+             (timedelta(hours=2), "two hours")])
+        self.assertEqual(
+            durations("The movie is one hour, fifty seven and a half "
+                      "minutes long"),
+            [(timedelta(hours=1, minutes=57.5),
+              "one hour, fifty seven and a half minutes")])
+        self.assertEqual(durations("it took a decade, then 3 centuries"),
+                         [(timedelta(days=DAYS_IN_1_YEAR * 10), "a decade"),
+                          (timedelta(days=DAYS_IN_1_YEAR * 300),
+                           "3 centuries")])
+        self.assertEqual(durations("no duration here"), [])
+
 
 class TestExtractDateTime(unittest.TestCase):
     def test_extractdatetime_fractions_en(self):
@@ -1696,6 +1775,120 @@ class TestExtractDateTime(unittest.TestCase):
             extract_datetime('What time will it be in two hundred minutes', now)[0],
             datetime(2019, 7, 4, 11, 21, 2, tzinfo=default_timezone()))
 
+    def test_compile_datetime(self):
+        text = "remind me to call mom next friday at five pm"
+        program = compile_datetime(text)
+        self.assertIs(compile_datetime(" " + text.replace(" ", "  ")),
+                      program)
+        for day in range(1, 15):
+            anchor = datetime(2019, 7, day, 18, tzinfo=default_timezone())
+            self.assertEqual(program.resolve(anchor),
+                             extract_datetime(text, anchor))
+        anchor = datetime(2019, 7, 4, 18)
+        self.assertEqual(program.resolve(anchor, time(9)),
+                         extract_datetime(text, anchor, default_time=time(9)))
+        self.assertIsNone(compile_datetime("no dates here").resolve(anchor))
+
+    def test_extract_datetime_batch(self):
+        anchor = datetime(2019, 7, 4, 18)
+        texts = ["tomorrow at 5 pm", "no dates here", "",
+                 "in 3 weeks", "tomorrow at 5 pm"]
+        expected = [extract_datetime(text, anchor) for text in texts]
+        results = extract_datetime_batch(texts, anchor)
+        self.assertEqual(results, expected)
+        self.assertIsNot(results[0], results[-1])
+        self.assertEqual(extract_datetime_batch(iter(texts), anchor,
+                                                workers=2), expected)
+        self.assertEqual(extract_datetime_batch([], anchor), [])
+
+    def test_extract_datetimes(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        text = "from monday at 9 until friday at 5 pm, or tonight"
+        results = extract_datetimes(text, anchor)
+        self.assertEqual([r.text for r in results],
+                         ["from monday at 9", "friday at 5 pm", "tonight"])
+        self.assertEqual([text[r.start:r.end] for r in results],
+                         [r.text for r in results])
+        self.assertEqual([r.datetime for r in results],
+                         [datetime(2017, 7, 3, 9, tzinfo=default_timezone()),
+                          datetime(2017, 6, 30, 17, tzinfo=default_timezone()),
+                          datetime(2017, 6, 27, 22, tzinfo=default_timezone())])
+        text = "what is the weather like the day after tomorrow?"
+        self.assertEqual(extract_datetimes(text, anchor)[0][1:],
+                         (29, 47, "day after tomorrow"))
+        self.assertEqual(extract_datetimes("do it now", anchor)[0][1:],
+                         (6, 9, "now"))
+        self.assertEqual(extract_datetimes("no dates here", anchor), [])
+
+        # "to" and "and" don't split an expression
+        anchor = datetime(2017, 1, 1, 12, tzinfo=default_timezone())
+        text = "remind me in two weeks and three days"
+        self.assertEqual(
+            extract_datetimes(text, anchor),
+            [(datetime(2017, 1, 18, tzinfo=default_timezone()), 10, 37,
+              "in two weeks and three days")])
+        text = "set an alarm for ten to six pm"
+        results = extract_datetimes(text, anchor)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].datetime,
+                         extract_datetime(text, anchor)[0])
+
+        # neither does a comma inside a single date
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        self.assertEqual(
+            extract_datetimes("on june 5th, 2018 at noon", anchor),
+            [(datetime(2018, 6, 5, 12, tzinfo=default_timezone()), 0, 25,
+              "on june 5th, 2018 at noon")])
+        self.assertEqual(
+            extract_datetimes("tomorrow, at 5 pm", anchor),
+            [(datetime(2017, 6, 28, 17, tzinfo=default_timezone()), 0, 17,
+              "tomorrow, at 5 pm")])
+
+    def test_datetime_stream(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        stream = datetime_stream(anchor)
+        for word in "remind me tomorrow at 9. then next friday at noon " \
+                    "until 5 pm".split():
+            stream.feed(word)
+            self.assertEqual(stream.result(),
+                             extract_datetimes(stream.text, anchor))
+        self.assertEqual(len(stream.result()), 3)
+        stream.update("remind me tomorrow at 9. then next monday")
+        self.assertEqual(stream.result(),
+                         extract_datetimes(stream.text, anchor))
+
+        stream = datetime_stream(anchor)
+        for word in "remind me in two weeks and three days".split():
+            stream.feed(word)
+        self.assertEqual(stream.result(),
+                         [(datetime(2017, 7, 14, tzinfo=default_timezone()),
+                           10, 37, "in two weeks and three days")])
+
+        stream = datetime_stream(anchor)
+        for word in "remind me on june 5th, 2018 at noon".split():
+            stream.feed(word)
+        self.assertEqual(stream.result(),
+                         [(datetime(2018, 6, 5, 12, tzinfo=default_timezone()),
+                           10, 35, "on june 5th, 2018 at noon")])
+
+        # closed clauses are never parsed again
+        from lingua_franca.lang.parse_en import _clean_datetime_spans_en
+        cleaned = []
+
+        def clean(spans):
+            cleaned.append(" ".join(word for _, _, word in spans))
+            return _clean_datetime_spans_en(spans)
+
+        stream = datetime_stream(anchor)
+        stream._clean = clean
+        stream.feed("tomorrow at 9 then")
+        stream.feed("friday")
+        stream.result()
+        stream.feed(["at", "noon"])
+        stream.result()
+        self.assertEqual(cleaned, ["tomorrow at 9", "friday",
+                                   "friday at noon"])
+
 
 class TestGender(unittest.TestCase):
     # TODO not localized; needed in english?
@@ -1749,6 +1942,12 @@ class TestYesNo(unittest.TestCase):
         test_utt("you are not mistaken", True)
         test_utt("tou are not wrong", True)
 
+        # only whole words are matched
+        test_utt("i know", None)
+        test_utt("yesterday", None)
+        # the last answer wins
+        test_utt("yes, no, well, actually yes", True)
+
 
 class TestLangcode(unittest.TestCase):
     def test_parse_lang_code(self):
@@ -1759,6 +1958,13 @@ class TestLangcode(unittest.TestCase):
 
         test_with_conf("English", 'en', 1.0)
         test_with_conf("Portuguese", 'pt', 1.0)
+        test_with_conf("portugese", 'pt')
+
+    def test_score_cutoff(self):
+        self.assertEqual(extract_langcode("portugese", score_cutoff=0.99),
+                         (None, 0.0))
+        self.assertEqual(extract_langcode("german", score_cutoff=0.99),
+                         ('de', 1.0))
 
     def test_parse_lang2_code(self):
         def test_with_conf(text, expected_lang, min_conf=0.8):
@@ -1766,10 +1972,9 @@ class TestLangcode(unittest.TestCase):
             self.assertEqual(lang, expected_lang)
             self.assertGreaterEqual(conf, min_conf)
 
-        # TODO should be "pt-br", but let it pass for now
-        test_with_conf("Brazilian Portuguese", 'pt')
-        # TODO should be "en-us", but let it pass for now
-        test_with_conf("American English", 'en')
+        test_with_conf("Brazilian Portuguese", 'pt-br', 1.0)
+        test_with_conf("American English", 'en-us', 1.0)
+        test_with_conf("american  english", 'en-us', 1.0)
 
         test_with_conf("Brazilian", 'pt-br')
         test_with_conf("American", 'en-us')
@@ -19,7 +19,8 @@ import unittest
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import (normalize, extract_numbers, extract_number,
-                                 extract_datetime, yes_or_no, extract_duration)
+                                 extract_datetime, yes_or_no, extract_duration,
+                                 extract_number_spans)
 from lingua_franca.lang.parse_es import extract_datetime_es, is_fractional_es
 from lingua_franca.time import default_timezone, to_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 from lingua_franca.util.colors import Color, ColorOutOfSpace
@@ -114,6 +115,16 @@ class TestNormalize(unittest.TestCase):
 
         self.assertEqual(extract_number("dos punto cero dos", lang='es'), 2.02)
 
+    def test_extract_number_spans_es(self):
+        text = "tengo veinte y cinco manzanas y tres peras"
+        self.assertEqual(extract_number_spans(text, lang='es'),
+                         [(25, 6, 20, False), (3, 32, 36, False)])
+        self.assertEqual(extract_numbers("uno dos tres", lang='es'),
+                         [1, 2, 3])
+        # a scale word continues the number when the handler multiplies it
+        self.assertEqual(extract_numbers("un mil", lang='es'), [1000])
+        self.assertEqual(extract_numbers("dos mil", lang='es'), [2, 1000])
+
     def test_isFraction_es(self):
         self.assertEqual(is_fractional_es("vigésimo"), 1.0 / 20)
         self.assertEqual(is_fractional_es("vigésima"), 1.0 / 20)
@@ -13,9 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import sys
 import unittest
+from importlib.util import find_spec
+from unittest import mock
+
 from lingua_franca import load_language, unload_language, set_default_lang
+from lingua_franca.util import Matcher, MatchStrategy, fuzzy_match, \
+    match_all, match_matrix, match_one
 from lingua_franca.util.colors import Color, ColorOutOfSpace
+from lingua_franca.parse import extract_datetime, extract_duration
+from lingua_franca.profile import profile, stage, mark, traced
 
 
 def setUpModule():
@@ -71,5 +79,162 @@ class TestColorObject(unittest.TestCase):
         self.assertEqual(aprox_color.rgb255, (159, 160, 197))
 
 
+class TestMatcher(unittest.TestCase):
+    choices = ['frank', 'kate', 'harry', 'henry', 'frank sinatra',
+               'sinatra frank', 'the kate bush']
+
+    def test_best(self):
+        matcher = Matcher(self.choices)
+        self.assertEqual(matcher.best('frank')[0], 'frank')
+        self.assertEqual(matcher.best('fran')[0], 'frank')
+        self.assertEqual(matcher.best('enry')[0], 'henry')
+        self.assertEqual(matcher.best('katt')[0], 'kate')
+        self.assertIsNone(matcher.best('frank', score_cutoff=1.1))
+
+        matcher = Matcher({'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4})
+        self.assertEqual(matcher.best('frank')[0], 1)
+        self.assertEqual(matcher.best('enry')[0], 4)
+
+    def test_same_scores_as_fuzzy_match(self):
+        for strategy in MatchStrategy:
+            matcher = Matcher(self.choices, strategy, prefilter=False)
+            for query in ['frank', 'Kate Bush', 'sinatra', 'xyz', '']:
+                self.assertEqual(matcher.top(query),
+                                 match_all(query, self.choices,
+                                           strategy=strategy))
+            matcher = Matcher(self.choices, strategy)
+            for choice, score in matcher.top('frank sinatra'):
+                self.assertEqual(score, fuzzy_match('frank sinatra', choice,
+                                                    strategy))
+
+    def test_top(self):
+        matcher = Matcher(self.choices, MatchStrategy.TOKEN_SORT_RATIO)
+        top = matcher.top('sinatra frank', 2)
+        self.assertEqual(top, [('frank sinatra', 1.0),
+                               ('sinatra frank', 1.0)])
+        # choices without a shared n-gram are not scored
+        self.assertNotIn('harry', [m[0] for m in matcher.top('frank')])
+        self.assertEqual(matcher.top('frank', score_cutoff=0.9),
+                         [('frank', 1.0)])
+
+    def test_prefilter_near_miss(self):
+        # "hryra" shares no trigram with "harry", the prefilter drops the
+        # choice match_one finds best
+        self.assertEqual(match_one('hryra', self.choices), ('harry', 0.6))
+        self.assertEqual(Matcher(self.choices).best('hryra'),
+                         ('frank sinatra', fuzzy_match('hryra',
+                                                       'frank sinatra')))
+        self.assertEqual(Matcher(self.choices, prefilter=False).best('hryra'),
+                         match_one('hryra', self.choices))
+        # nothing shares an n-gram with "xyz", every choice is scored
+        self.assertEqual(Matcher(self.choices).best('xyz'),
+                         match_one('xyz', self.choices))
+
+
+@unittest.skipIf(find_spec("numpy") is None, "match_matrix requires numpy")
+class TestMatchMatrix(unittest.TestCase):
+    queries = ['frank', 'kate bush', 'sinatra']
+    choices = ['frank', 'henry', 'the kate bush', 'frank sinatra']
+
+    def test_dense(self):
+        for strategy in MatchStrategy:
+            if strategy == MatchStrategy.SIMPLE_RATIO:
+                continue
+            matrix = match_matrix(self.queries, self.choices, strategy,
+                                  workers=2)
+            self.assertEqual(matrix.shape, (3, 4))
+            for i, query in enumerate(self.queries):
+                for j, choice in enumerate(self.choices):
+                    self.assertAlmostEqual(matrix[i][j],
+                                           fuzzy_match(query, choice,
+                                                       strategy))
+
+    def test_simple_ratio(self):
+        matrix = match_matrix(self.queries, self.choices)
+        self.assertEqual(matrix[0][0], 1.0)
+        self.assertAlmostEqual(matrix[0][1],
+                               fuzzy_match('frank', 'henry'))
+
+    def test_sparse(self):
+        matches = match_matrix(self.queries, self.choices,
+                               MatchStrategy.PARTIAL_RATIO, score_cutoff=1.0)
+        self.assertEqual(matches, [(0, 0, 1.0), (0, 3, 1.0), (1, 2, 1.0),
+                                   (2, 3, 1.0)])
+
+
+class TestMatchMatrixWithoutNumpy(unittest.TestCase):
+    queries = TestMatchMatrix.queries
+    choices = TestMatchMatrix.choices
+
+    def setUp(self):
+        # importing a module mapped to None raises ImportError
+        patcher = mock.patch.dict(sys.modules, {"numpy": None})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_dense(self):
+        strategy = MatchStrategy.TOKEN_SET_RATIO
+        matrix = match_matrix(self.queries, self.choices, strategy)
+        self.assertEqual(len(matrix), 3)
+        for i, query in enumerate(self.queries):
+            self.assertEqual(len(matrix[i]), 4)
+            for j, choice in enumerate(self.choices):
+                self.assertAlmostEqual(matrix[i][j],
+                                       fuzzy_match(query, choice, strategy))
+
+    def test_sparse(self):
+        matches = match_matrix(self.queries, self.choices,
+                               MatchStrategy.PARTIAL_RATIO, score_cutoff=1.0)
+        self.assertEqual(matches, [(0, 0, 1.0), (0, 3, 1.0), (1, 2, 1.0),
+                                   (2, 3, 1.0)])
+
+
+@traced
+def _traced_stages(text):
+    mark("first", text)
+    with stage("nested"):
+        pass
+    mark("second")
+    return text
+
+
+class TestProfile(unittest.TestCase):
+    def test_stages(self):
+        _traced_stages("not profiled")
+        with profile() as trace:
+            self.assertEqual(_traced_stages("two words"), "two words")
+        _traced_stages("not profiled")
+
+        self.assertEqual(
+            [(record.stack, record.tokens) for record in trace.records],
+            [(("_traced_stages", "first", "nested"), None),
+             (("_traced_stages", "first"), 2),
+             (("_traced_stages", "second"), None),
+             (("_traced_stages",), 2)])
+        totals = trace.totals()
+        self.assertEqual(totals[("_traced_stages",)][0], 1)
+        self.assertGreaterEqual(totals[("_traced_stages",)][1],
+                                totals[("_traced_stages", "first")][1])
+
+        lines = trace.collapsed().splitlines()
+        self.assertEqual(sorted(line.rsplit(" ", 1)[0] for line in lines),
+                         ["_traced_stages",
+                          "_traced_stages;first",
+                          "_traced_stages;first;nested",
+                          "_traced_stages;second"])
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit()
+                            for line in lines))
+
+    def test_extractors(self):
+        with profile() as trace:
+            extract_datetime("next tuesday at 4pm", lang="en")
+            extract_duration("set a timer for five minutes", lang="en")
+        stacks = trace.totals()
+        self.assertIn(("extract_datetime_en", "_resolve_datetime_en",
+                       "time"), stacks)
+        self.assertEqual(stacks[("extract_duration_en",)][2], 6)
+        self.assertIn(("extract_duration_en", "units"), stacks)
+
+
 if __name__ == "__main__":
     unittest.main()